@@ -0,0 +1,150 @@
+"""
+Time BcolzMinuteBarReader.load_raw_arrays against the previous, sid by sid,
+implementation.
+
+A minute bar directory is written for ``--sids`` sids over the sessions of
+Thanksgiving week 2015, whose Friday closes early, and the window of every
+field is loaded for all of the sids by both implementations.
+
+    python etc/benchmark_minute_bar_reader.py --sids 1000
+"""
+from timeit import default_timer
+
+import click
+import numpy as np
+import pandas as pd
+
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.testing import tmp_dir
+from zipline.utils.calendars import get_calendar
+
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def load_raw_arrays_per_sid(reader, fields, start_dt, end_dt, sids):
+    """The previous implementation of ``load_raw_arrays``."""
+    start_idx = reader._find_position_of_minute(start_dt)
+    end_idx = reader._find_position_of_minute(end_dt)
+
+    num_minutes = (end_idx - start_idx + 1)
+
+    results = []
+
+    indices_to_exclude = reader._exclusion_indices_for_range(
+        start_idx, end_idx)
+    if indices_to_exclude is not None:
+        for excl_start, excl_stop in indices_to_exclude:
+            length = excl_stop - excl_start + 1
+            num_minutes -= length
+
+    shape = num_minutes, len(sids)
+
+    for field in fields:
+        if field != 'volume':
+            out = np.full(shape, np.nan)
+        else:
+            out = np.zeros(shape, dtype=np.uint32)
+
+        for i, sid in enumerate(sids):
+            carray = reader._open_minute_file(field, sid)
+            values = carray[start_idx:end_idx + 1]
+            if indices_to_exclude is not None:
+                for excl_start, excl_stop in indices_to_exclude[::-1]:
+                    excl_slice = np.s_[
+                        excl_start - start_idx:excl_stop - start_idx + 1]
+                    values = np.delete(values, excl_slice)
+
+            where = values != 0
+            if field != 'volume':
+                out[:len(where), i][where] = (
+                    values[where] * reader._ohlc_ratio_inverse_for_sid(sid))
+            else:
+                out[:len(where), i][where] = values[where]
+
+        results.append(out)
+    return results
+
+
+def write_minute_bars(rootdir, calendar, sessions, sids):
+    minutes = calendar.minutes_for_sessions_in_range(
+        sessions[0], sessions[-1],
+    )
+    writer = BcolzMinuteBarWriter(
+        rootdir,
+        calendar,
+        sessions[0],
+        sessions[-1],
+        US_EQUITIES_MINUTES_PER_DAY,
+    )
+    rand = np.random.RandomState(0)
+    for sid in sids:
+        # Leave gaps in the trading of each sid.
+        values = rand.randint(0, 4, len(minutes)) * 10.0
+        writer.write_sid(sid, pd.DataFrame(
+            data={field: values for field in FIELDS},
+            index=minutes,
+        ))
+    return minutes
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        times.append(default_timer() - start)
+    return min(times)
+
+
+@click.command()
+@click.option('--sids', default=1000, show_default=True,
+              help='The number of sids to load.')
+@click.option('--repeat', default=3, show_default=True,
+              help='The number of timed loads of each implementation.')
+def main(sids, repeat):
+    calendar = get_calendar('NYSE')
+    sessions = calendar.sessions_in_range(
+        pd.Timestamp('2015-11-23', tz='UTC'),
+        pd.Timestamp('2015-11-30', tz='UTC'),
+    )
+    sids = list(range(1, sids + 1))
+
+    with tmp_dir() as rootdir:
+        click.echo('Writing {} sids...'.format(len(sids)))
+        minutes = write_minute_bars(rootdir.path, calendar, sessions, sids)
+        # Keep the carrays of every sid open.
+        reader = BcolzMinuteBarReader(rootdir.path,
+                                      sid_cache_size=len(sids))
+        start_dt, end_dt = minutes[0], minutes[-1]
+
+        def load_batched():
+            return reader.load_raw_arrays(FIELDS, start_dt, end_dt, sids)
+
+        def load_per_sid():
+            return load_raw_arrays_per_sid(
+                reader, FIELDS, start_dt, end_dt, sids,
+            )
+
+        # Open the carrays of every sid before timing, and check that both
+        # implementations agree.
+        for batched, per_sid in zip(load_batched(), load_per_sid()):
+            np.testing.assert_almost_equal(batched, per_sid)
+
+        per_sid_time = best_time(load_per_sid, repeat)
+        batched_time = best_time(load_batched, repeat)
+        click.echo(
+            '{} minutes x {} sids, early close on 2015-11-27\n'
+            'per sid: {:8.3f} s\n'
+            'batched: {:8.3f} s ({:.1f}x)'.format(
+                len(minutes), len(sids), per_sid_time, batched_time,
+                per_sid_time / batched_time,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Time the storage of streamed TWS ticks against the previous storage.
+
+TWSConnection used to append every tick to the DataFrame of its symbol and
+aggregated bars by resampling it. The ticks are now appended to a
+TickBuffer and minute bars are kept by a MinuteBarAggregator. This script
+feeds the same synthetic session of ticks to both, and to a list based
+storage, and prints the time per tick of the appends and of the bars read
+back.
+
+    python etc/benchmark_tick_buffer.py --ticks 100000
+"""
+from timeit import default_timer
+
+import click
+import numpy as np
+import pandas as pd
+
+from zipline.gens.brokers.ib_broker import (MinuteBarAggregator,
+                                            TWSConnection)
+
+
+def synthetic_session(n, seed=42):
+    session_open = pd.Timestamp('2017-09-27 13:30', tz='UTC').value
+    rand = np.random.RandomState(seed)
+    times = session_open + np.sort(
+        rand.randint(0, 390 * 60 * 10 ** 9, size=n))
+    prices = 250 + np.cumsum(rand.normal(0, 0.01, size=n))
+    sizes = rand.randint(1, 500, size=n)
+    return times, prices, sizes
+
+
+def frame_storage(times, prices, sizes):
+    """The previous storage: one DataFrame appended to per tick."""
+    bars = None
+    for time, price, size in zip(times, prices, sizes):
+        bar = pd.DataFrame(index=pd.DatetimeIndex([time], tz='UTC'),
+                           data={'last_trade_price': price,
+                                 'last_trade_size': size,
+                                 'total_volume': 0,
+                                 'vwap': 0.0,
+                                 'single_trade_flag': False})
+        bars = bar if bars is None else bars.append(bar)
+    return bars
+
+
+def frame_bars(bars):
+    ohlcv = bars['last_trade_price'].resample('1 Min').ohlc()
+    ohlcv['volume'] = bars['last_trade_size'].resample('1 Min').sum()
+    return ohlcv
+
+
+def list_storage(times, prices, sizes):
+    """Appends to lists, converted to a DataFrame to aggregate bars."""
+    rows = ([], [], [])
+    for time, price, size in zip(times, prices, sizes):
+        rows[0].append(time)
+        rows[1].append(price)
+        rows[2].append(size)
+    return rows
+
+
+def list_bars(rows):
+    times, prices, sizes = rows
+    return frame_bars(pd.DataFrame(
+        index=pd.to_datetime(times, utc=True),
+        data={'last_trade_price': prices, 'last_trade_size': sizes},
+    ))
+
+
+def buffer_storage(times, prices, sizes):
+    """The current storage of TWSConnection."""
+    tws = TWSConnection.__new__(TWSConnection)
+    tws.bars = {}
+    tws.minute_bars = {'SPY': MinuteBarAggregator()}
+    tws.market_data_ready = {}
+    for time, price, size in zip(times, prices, sizes):
+        tws._add_tick('SPY', price, size, time, 0, 0.0, False)
+    return tws.minute_bars['SPY']
+
+
+def buffer_bars(minute_bars):
+    return minute_bars.bars()
+
+
+def timed(func, *args):
+    start = default_timer()
+    result = func(*args)
+    return result, default_timer() - start
+
+
+@click.command()
+@click.option('--ticks', default=100000, show_default=True,
+              help='The number of ticks of the session.')
+@click.option('--frame-ticks', default=5000, show_default=True,
+              help='The number of ticks stored in DataFrames, whose appends '
+                   'cost time linear in the number of ticks stored.')
+def main(ticks, frame_ticks):
+    times, prices, sizes = synthetic_session(ticks)
+    for name, store, read, n in (
+            ('DataFrame', frame_storage, frame_bars, min(ticks, frame_ticks)),
+            ('list', list_storage, list_bars, ticks),
+            ('TickBuffer', buffer_storage, buffer_bars, ticks)):
+        stored, append_time = timed(store, times[:n], prices[:n], sizes[:n])
+        _, read_time = timed(read, stored)
+        click.echo(
+            '{:<10} {:>7} ticks: {:8.2f} us per append, '
+            '{:8.2f} ms per minute bars read'.format(
+                name, n, 1e6 * append_time / n, 1e3 * read_time,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
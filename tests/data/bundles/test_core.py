@@ -264,6 +264,77 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_load_shared(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+            daily_bar_writer.write(make_bar_data(equities, sessions))
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+        shared = self.load('bundle', environ=self.environ, shared=True)
+        # A second shared load attaches to the existing copy.
+        attached = self.load('bundle', environ=self.environ, shared=True)
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        for reader_name, start, end in (
+                ('equity_minute_bar_reader', minutes[0], minutes[-1]),
+                ('equity_daily_bar_reader', sessions[0], sessions[-1])):
+            expected = getattr(bundle, reader_name).load_raw_arrays(
+                columns, start, end, sids,
+            )
+            for loaded in shared, attached:
+                actual = getattr(loaded, reader_name).load_raw_arrays(
+                    columns, start, end, sids,
+                )
+                for actual_column, expected_column, colname in zip(
+                        actual, expected, columns):
+                    assert_equal(
+                        actual_column,
+                        expected_column,
+                        msg=(reader_name, colname),
+                    )
+
+        for sid in sids:
+            assert_equal(
+                shared.equity_daily_bar_reader.get_value(
+                    sid, sessions[2], 'close',
+                ),
+                bundle.equity_daily_bar_reader.get_value(
+                    sid, sessions[2], 'close',
+                ),
+            )
+
     def test_ingest_assets_versions(self):
         versions = (1, 2)
 
@@ -18,13 +18,17 @@ import os
 from numpy import (
     arange,
     array,
+    delete,
     int64,
     float64,
     full,
+    isnan,
     nan,
+    s_,
     transpose,
     zeros,
 )
+from numpy.random import RandomState
 from numpy.testing import assert_almost_equal, assert_array_equal
 from pandas import (
     DataFrame,
@@ -34,8 +38,11 @@ from pandas import (
     NaT,
     date_range,
 )
+from pandas.util.testing import assert_index_equal
+from six import integer_types
 
-from zipline.data.bar_reader import NoDataOnDate
+from zipline.data import bar_reader
+from zipline.data.bar_reader import NoDataOnDate, read_pool
 from zipline.data.minute_bars import (
     BcolzMinuteBarMetadata,
     BcolzMinuteBarWriter,
@@ -45,6 +52,8 @@ from zipline.data.minute_bars import (
     BcolzMinuteWriterColumnMismatch,
     H5MinuteBarUpdateWriter,
     H5MinuteBarUpdateReader,
+    MemmapMinuteBarReader,
+    convert_bcolz_minute_bars_to_memmap,
 )
 
 from zipline.testing.fixtures import (
@@ -178,6 +187,170 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
         volume_price = reader.get_value(sid, minute, 'volume')
         self.assertEquals(50.0, volume_price)
 
+    def test_get_values(self):
+        minute_0 = self.market_opens[self.test_calendar_start]
+        minute_1 = minute_0 + timedelta(minutes=1)
+        self.writer.write_sid(1, DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0]
+            },
+            index=[minute_0, minute_1]))
+        self.writer.write_sid(2, DataFrame(
+            data={
+                'open': [110.0],
+                'high': [120.0],
+                'low': [130.0],
+                'close': [140.0],
+                'volume': [150.0]
+            },
+            index=[minute_0]))
+
+        for minute in minute_0, minute_1:
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                values = self.reader.get_values([1, 2], minute, field)
+                assert_array_equal(
+                    values,
+                    [self.reader.get_value(sid, minute, field)
+                     for sid in (1, 2)],
+                )
+                self.assertEqual(
+                    values.dtype, int64 if field == 'volume' else float64,
+                )
+
+        assert_array_equal(self.reader.get_values([2, 1], minute_1, 'close'),
+                           [nan, 41.0])
+        assert_array_equal(self.reader.get_values([2, 1], minute_1, 'volume'),
+                           [0, 51])
+
+    def test_get_last_traded_dts(self):
+        sessions = self.market_opens.index[:4]
+        opens = self.market_opens[sessions]
+        traded_minutes = {
+            1: [opens[0], opens[0] + timedelta(minutes=5), opens[2]],
+            2: [opens[1] + timedelta(minutes=100)],
+        }
+        for sid, minutes in traded_minutes.items():
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': [10.0] * len(minutes),
+                    'high': [20.0] * len(minutes),
+                    'low': [30.0] * len(minutes),
+                    'close': [40.0] * len(minutes),
+                    'volume': [50.0] * len(minutes),
+                },
+                index=minutes))
+        # Use another reader for the single lookups so the cached knowledge
+        # of zero volumes is not shared.
+        single_reader = BcolzMinuteBarReader(self.dest)
+
+        assets = self.asset_finder.retrieve_all([1, 2])
+        query_minutes = [
+            opens[0],
+            opens[0] + timedelta(minutes=4),
+            opens[1] + timedelta(minutes=100),
+            self.market_closes[sessions[1]] + timedelta(hours=2),
+            opens[3] + timedelta(minutes=30),
+        ]
+        for minute in query_minutes:
+            assert_index_equal(
+                self.reader.get_last_traded_dts(assets, minute),
+                DatetimeIndex(
+                    [single_reader.get_last_traded_dt(asset, minute)
+                     for asset in assets],
+                    tz='UTC',
+                ),
+            )
+
+        assert_index_equal(
+            self.reader.get_last_traded_dts(assets, query_minutes[-1]),
+            DatetimeIndex([opens[2], opens[1] + timedelta(minutes=100)],
+                          tz='UTC'),
+        )
+        assert_index_equal(
+            self.reader.get_last_traded_dts(assets, query_minutes[0]),
+            DatetimeIndex([opens[0], NaT], tz='UTC'),
+        )
+
+    def test_get_last_traded_dts_after_single_lookup(self):
+        sessions = self.market_opens.index[:2]
+        opens = self.market_opens[sessions]
+        self.writer.write_sid(1, DataFrame(
+            data={
+                'open': [0.0, 0.0],
+                'high': [0.0, 0.0],
+                'low': [0.0, 0.0],
+                'close': [0.0, 0.0],
+                'volume': [0, 0],
+            },
+            index=list(opens)))
+        asset = self.asset_finder.retrieve_asset(1)
+        minute = opens[1] + timedelta(minutes=10)
+
+        # The single lookup records the minutes known to have no volume,
+        # which the bulk lookup starts from.
+        self.assertIs(self.reader.get_last_traded_dt(asset, minute), NaT)
+        self.assertIsInstance(
+            self.reader._known_zero_volume_dict[asset.sid],
+            integer_types,
+        )
+        assert_index_equal(
+            self.reader.get_last_traded_dts([asset], minute),
+            DatetimeIndex([NaT], tz='UTC'),
+        )
+        assert_index_equal(
+            self.reader.get_last_traded_dts(
+                [asset], minute + timedelta(minutes=5),
+            ),
+            DatetimeIndex([NaT], tz='UTC'),
+        )
+
+    def test_memmap_reader(self):
+        minute_0 = self.market_opens[self.test_calendar_start]
+        minutes = date_range(minute_0, periods=3, freq='min')
+        for sid in 1, 2:
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': [10.0, 0.0, 11.0],
+                    'high': [20.0, 0.0, 21.0],
+                    'low': [30.0, 0.0, 31.0],
+                    'close': [40.0 + sid, 0.0, 41.0],
+                    'volume': [50.0, 0.0, 51.0 * sid],
+                },
+                index=minutes))
+        self.writer.set_sid_attrs(1, start_day=1, end_day=2)
+
+        memmap_dest = self.instance_tmpdir.getpath('memmap_minute_bars')
+        convert_bcolz_minute_bars_to_memmap(self.dest, memmap_dest)
+        memmap_reader = MemmapMinuteBarReader(memmap_dest)
+
+        self.assertEqual(memmap_reader.table_len(1), self.reader.table_len(1))
+        self.assertEqual(memmap_reader.get_sid_attr(1, 'start_day'), 1)
+        self.assertEqual(memmap_reader.get_sid_attr(2, 'start_day'), None)
+
+        for minute in minutes:
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                for sid in 1, 2:
+                    assert_array_equal(
+                        memmap_reader.get_value(sid, minute, field),
+                        self.reader.get_value(sid, minute, field),
+                    )
+
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        for expected, result in zip(
+                self.reader.load_raw_arrays(fields, minutes[0], minutes[-1],
+                                            [1, 2]),
+                memmap_reader.load_raw_arrays(fields, minutes[0],
+                                              minutes[-1], [1, 2])):
+            assert_array_equal(expected, result)
+
+        asset = self.asset_finder.retrieve_asset(1)
+        self.assertEqual(memmap_reader.get_last_traded_dt(asset, minutes[1]),
+                         minutes[0])
+
     def test_write_two_bars(self):
         minute_0 = self.market_opens[self.test_calendar_start]
         minute_1 = minute_0 + timedelta(minutes=1)
@@ -816,6 +989,94 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
             for j, sid in enumerate(sids):
                 assert_almost_equal(data[sid][col], arrays[i][j])
 
+    def test_load_raw_arrays_matches_per_sid_reads(self):
+        """
+        Compare the batched load_raw_arrays with a sid by sid read of the same
+        window spanning an early close.
+        """
+        sessions = self.trading_calendar.sessions_in_range(
+            Timestamp('2015-11-24', tz='UTC'),
+            Timestamp('2015-11-30', tz='UTC'),
+        )
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            sessions[0], sessions[-1],
+        )
+        sids = list(range(1, 31))
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={sid: 100 for sid in sids[::3]},
+        )
+        rand = RandomState(1)
+        for sid in sids:
+            # Some sids stop trading before the end of the window
+            sid_minutes = minutes[:len(minutes) - sid * 7]
+            values = rand.randint(0, 4, len(sid_minutes)) * 10.0
+            writer.write_sid(sid, DataFrame(
+                data={
+                    'open': values,
+                    'high': values,
+                    'low': values,
+                    'close': values,
+                    'volume': values,
+                },
+                index=sid_minutes))
+        reader = BcolzMinuteBarReader(self.dest)
+        threaded_reader = BcolzMinuteBarReader(self.dest, read_threads=4)
+
+        def load_per_sid(field, start_dt, end_dt):
+            start_idx = reader._find_position_of_minute(start_dt)
+            end_idx = reader._find_position_of_minute(end_dt)
+            excluded = reader._exclusion_indices_for_range(start_idx,
+                                                           end_idx) or []
+            columns = []
+            for sid in sids:
+                values = reader._open_minute_file(field, sid)[
+                    start_idx:end_idx + 1]
+                for excl_start, excl_stop in excluded[::-1]:
+                    values = delete(values, s_[excl_start - start_idx:
+                                               excl_stop - start_idx + 1])
+                column = full(len(minutes_in_window), nan)
+                column[:len(values)] = values
+                if field != 'volume':
+                    column *= reader._ohlc_ratio_inverse_for_sid(sid)
+                column[column == 0] = nan if field != 'volume' else 0
+                columns.append(column)
+            return transpose(array(columns))
+
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        for start_dt, end_dt in ((minutes[0], minutes[-1]),
+                                 (minutes[100], minutes[-200]),
+                                 (minutes[5], minutes[20])):
+            minutes_in_window = minutes[minutes.slice_indexer(start_dt,
+                                                              end_dt)]
+            arrays = reader.load_raw_arrays(fields, start_dt, end_dt, sids)
+            threaded_arrays = threaded_reader.load_raw_arrays(
+                fields, start_dt, end_dt, sids)
+            for field, result, threaded_result in zip(fields,
+                                                      arrays,
+                                                      threaded_arrays):
+                expected = load_per_sid(field, start_dt, end_dt)
+                if field == 'volume':
+                    expected[isnan(expected)] = 0
+                assert_almost_equal(result, expected)
+                assert_almost_equal(threaded_result, expected)
+
+    def test_read_pool_after_fork(self):
+        pool = read_pool(2)
+        self.assertIs(read_pool(2), pool)
+
+        # A process forked without ``os.register_at_fork`` still has the
+        # parent's pools, whose threads did not survive the fork.
+        bar_reader._read_pools_pid = -1
+        child_pool = read_pool(2)
+        self.assertIsNot(child_pool, pool)
+        self.assertEqual(bar_reader._read_pools_pid, os.getpid())
+        self.assertEqual(child_pool.map(abs, [-1, -2]), [1, 2])
+
     def test_unadjusted_minutes_early_close(self):
         """
         Test unadjusted minute window, ensuring that early closes are filtered
@@ -1159,6 +1420,10 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                           "The last traded dt should be before the early "
                           "close, even when data is written between the early "
                           "close and the next open.")
+        assert_index_equal(
+            self.reader.get_last_traded_dts([asset], minute),
+            DatetimeIndex([before_early_close], tz='UTC'),
+        )
 
     def test_minute_updates(self):
         """
@@ -26,6 +26,8 @@ from numpy.testing import (
 )
 from pandas import (
     DataFrame,
+    DatetimeIndex,
+    NaT,
     Timestamp,
 )
 from pandas.util.testing import assert_index_equal
@@ -35,6 +37,7 @@ from zipline.data.us_equity_pricing import (
     BcolzDailyBarWriter,
     NoDataBeforeDate,
     NoDataAfterDate,
+    NoDataOnDate,
 )
 from zipline.pipeline.loaders.synthetic import (
     OHLCV,
@@ -330,6 +333,93 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, ZiplineTestCase):
         with self.assertRaises(NoDataAfterDate):
             reader.get_value(4, Timestamp('2015-06-16', tz='UTC'), 'close')
 
+    def test_get_values(self):
+        reader = self.bcolz_equity_daily_bar_reader
+        day = Timestamp('2015-06-15', tz='UTC')
+
+        for field in OHLCV:
+            expected = []
+            for sid in self.assets:
+                try:
+                    expected.append(reader.get_value(sid, day, field))
+                except NoDataOnDate:
+                    expected.append(0 if field == 'volume' else nan)
+
+            assert_array_equal(
+                reader.get_values(list(self.assets), day, field),
+                expected,
+            )
+
+        # A day outside of the calendar has no data
+        assert_array_equal(
+            reader.get_values([1, 3], Timestamp('2015-07-15', tz='UTC'),
+                              'close'),
+            [nan, nan],
+        )
+
+    def test_get_last_traded_dt(self):
+        table = self.bcolz_daily_bar_ctable
+        volumes = table['volume'][:]
+
+        class ZeroVolumeReader(BcolzDailyBarReader):
+            @property
+            def _columns(self):
+                return {'volume': volumes}
+
+        reader = ZeroVolumeReader(table)
+
+        # Days without trades at the start of an asset, in the middle of an
+        # asset and for the whole life of an asset.
+        zero_volume_days = [
+            (1, self.trading_days_between(Timestamp('2015-06-01', tz='UTC'),
+                                          Timestamp('2015-06-02', tz='UTC'))),
+            (3, self.trading_days_between(Timestamp('2015-06-10', tz='UTC'),
+                                          Timestamp('2015-06-17', tz='UTC'))),
+            (5, self.dates_for_asset(5)),
+        ]
+        for sid, days in zero_volume_days:
+            for day in days:
+                volumes[reader.sid_day_index(sid, day)] = 0
+
+        def expected_last_traded(sid, day):
+            day_loc = self.sessions.get_loc(day)
+            for search_day in self.sessions[day_loc::-1]:
+                try:
+                    ix = reader.sid_day_index(sid, search_day)
+                except NoDataBeforeDate:
+                    return NaT
+                except NoDataAfterDate:
+                    continue
+                if volumes[ix] != 0:
+                    return search_day
+            return NaT
+
+        for day in self.sessions:
+            expected = DatetimeIndex(
+                [expected_last_traded(sid, day) for sid in self.assets],
+                tz='UTC',
+            )
+            assert_index_equal(
+                DatetimeIndex(
+                    [reader.get_last_traded_dt(sid, day)
+                     for sid in self.assets],
+                    tz='UTC',
+                ),
+                expected,
+            )
+            assert_index_equal(
+                reader.get_last_traded_dts(self.assets, day),
+                expected,
+            )
+
+        # A day outside of the calendar has no last traded day
+        day = Timestamp('2015-07-15', tz='UTC')
+        self.assertIs(reader.get_last_traded_dt(1, day), NaT)
+        assert_index_equal(
+            reader.get_last_traded_dts([1, 3], day),
+            DatetimeIndex([NaT, NaT], tz='UTC'),
+        )
+
     def test_unadjusted_get_value_empty_value(self):
         reader = self.bcolz_equity_daily_bar_reader
 
@@ -369,6 +459,24 @@ class BcolzDailyBarNeverReadAllTestCase(BcolzDailyBarTestCase):
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = maxsize
 
 
+class BcolzDailyBarThreadedReadAllTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase reading the columns of
+    `load_raw_array` on a thread pool, with the entire columns in memory.
+    """
+    BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = 0
+    BCOLZ_DAILY_BAR_READ_THREADS = 4
+
+
+class BcolzDailyBarThreadedNeverReadAllTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase reading the columns and
+    groups of assets of `load_raw_array` on a thread pool.
+    """
+    BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = maxsize
+    BCOLZ_DAILY_BAR_READ_THREADS = 4
+
+
 class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
                                              WithTmpDir,
                                              WithTradingCalendars,
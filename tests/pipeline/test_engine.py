@@ -5,6 +5,7 @@ from __future__ import division
 from collections import OrderedDict
 from itertools import product
 from operator import add, sub
+import os
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -17,6 +18,7 @@ from numpy import (
     full_like,
     log,
     nan,
+    ones,
     tile,
     where,
     zeros,
@@ -41,9 +43,11 @@ from zipline.errors import NoFurtherDataError
 from zipline.lib.adjustment import MULTIPLY
 from zipline.lib.labelarray import LabelArray
 from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.cache import TermCache
 from zipline.pipeline.data import Column, DataSet, USEquityPricing
 from zipline.pipeline.data.testing import TestingDataSet
 from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.filters import CustomFilter
 from zipline.pipeline.factors import (
     AverageDollarVolume,
     EWMA,
@@ -77,6 +81,7 @@ from zipline.testing import (
 )
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
+    WithInstanceTmpDir,
     WithSeededRandomPipelineEngine,
     WithTradingEnvironment,
     ZiplineTestCase,
@@ -1323,6 +1328,140 @@ class StringColumnTestCase(WithSeededRandomPipelineEngine,
         assert_frame_equal(result.c.unstack(), expected_final_result)
 
 
+class ChunkedPipelineTestCase(WithSeededRandomPipelineEngine,
+                              ZiplineTestCase):
+
+    @parameter_space(processes=[None, 2], chunksize=[1, 4, 20])
+    def test_run_chunked_pipeline(self, processes, chunksize):
+        pipeline = Pipeline({
+            'float': TestingDataSet.float_col.latest,
+            'sma': SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=5,
+            ),
+            'categorical': TestingDataSet.categorical_col.latest,
+        })
+        start_date, end_date = self.trading_days[[-15, -1]]
+
+        expected = self.run_pipeline(pipeline, start_date, end_date)
+        result = self.seeded_random_engine.run_chunked_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            chunksize,
+            processes,
+        )
+
+        # The categories of the chunks are the union of the labels of each
+        # chunk, so compare the labels themselves.
+        self.assertIsInstance(result['categorical'].values, Categorical)
+        for frame in result, expected:
+            frame['categorical'] = frame['categorical'].astype(object)
+        assert_frame_equal(result, expected)
+
+    @parameter_space(processes=[None, 2])
+    def test_empty_chunk(self, processes):
+        start_date, end_date = self.trading_days[[-15, -1]]
+        cutoff = self.trading_days[-5]
+
+        class AfterCutoff(CustomFilter):
+            inputs = [TestingDataSet.float_col]
+            window_length = 1
+
+            def compute(self, today, assets, out, values):
+                out[:] = today >= cutoff
+
+        pipeline = Pipeline(
+            {'categorical': TestingDataSet.categorical_col.latest},
+            screen=AfterCutoff(),
+        )
+
+        expected = self.run_pipeline(pipeline, start_date, end_date)
+        # The screen passes nothing in the first chunks.
+        result = self.seeded_random_engine.run_chunked_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            5,
+            processes,
+        )
+
+        self.assertIsInstance(result['categorical'].values, Categorical)
+        self.assertEqual(
+            result.index.get_level_values(0).min(),
+            cutoff,
+        )
+        for frame in result, expected:
+            frame['categorical'] = frame['categorical'].astype(object)
+        assert_frame_equal(result, expected)
+
+    def test_insufficient_lookback(self):
+        pipeline = Pipeline({
+            'sma': SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=5,
+            ),
+        })
+        start_date, end_date = self.trading_days[[2, 10]]
+        for processes in None, 2:
+            with self.assertRaises(NoFurtherDataError):
+                self.seeded_random_engine.run_chunked_pipeline(
+                    pipeline, start_date, end_date, 3, processes,
+                )
+
+
+class ColumnarPipelineTestCase(WithSeededRandomPipelineEngine,
+                               ZiplineTestCase):
+
+    def test_columnar_matches_narrow(self):
+        pipeline = Pipeline(
+            {
+                'float': TestingDataSet.float_col.latest,
+                'sma': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                ),
+                'categorical': TestingDataSet.categorical_col.latest,
+            },
+            screen=TestingDataSet.bool_col.latest,
+        )
+        run_dates = self.trading_days[-10:]
+        start_date, end_date = run_dates[[0, -1]]
+        engine = self.seeded_random_engine
+
+        expected = engine.run_pipeline(pipeline, start_date, end_date)
+        result = engine.run_columnar_pipeline(pipeline, start_date, end_date)
+
+        self.assertEqual(len(result), len(expected))
+        expected_assets = expected.index.get_level_values(1)
+        assert_equal(
+            result.sids,
+            array([int(asset) for asset in expected_assets]),
+        )
+        assert_equal(
+            result.dates,
+            expected.index.get_level_values(0).tz_localize(None).values,
+        )
+        assert_frame_equal(result.to_frame(), expected)
+
+        for date in run_dates:
+            assert_frame_equal(result.for_session(date), expected.loc[date])
+
+    def test_empty_session(self):
+        pipeline = Pipeline(
+            {'float': TestingDataSet.float_col.latest},
+            screen=TestingDataSet.float_col.latest.isnull(),
+        )
+        date = self.trading_days[-1]
+
+        result = self.seeded_random_engine.run_columnar_pipeline(
+            pipeline, date, date,
+        )
+        self.assertEqual(len(result), 0)
+        self.assertTrue(result.for_session(date).empty)
+        self.assertTrue(result.to_frame().empty)
+
+
 class WindowSafetyPropagationTestCase(WithSeededRandomPipelineEngine,
                                       ZiplineTestCase):
 
@@ -1497,3 +1636,268 @@ class PopulateInitialWorkspaceTestCase(WithConstantInputs, ZiplineTestCase):
                 precomputed_term_value,
             ),
         )
+
+
+class ParallelEngineTestCase(WithConstantInputs, ZiplineTestCase):
+
+    def make_engine(self, max_workers):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            max_workers=max_workers,
+        )
+        self.addCleanup(engine.close)
+        return engine
+
+    def test_parallel_matches_serial(self):
+        columns = {
+            'sum_%d' % window_length: RollingSumDifference(
+                window_length=window_length,
+            )
+            for window_length in range(2, 8)
+        }
+        columns['rank'] = columns['sum_2'].rank()
+        columns['zscore'] = (columns['sum_3'] + columns['sum_4']).zscore()
+        columns['open'] = USEquityPricing.open.latest
+        pipeline = Pipeline(columns)
+        start_date, end_date = self.dates[10], self.dates[20]
+
+        expected = self.make_engine(None).run_pipeline(
+            pipeline, start_date, end_date,
+        )
+
+        engine = self.make_engine(4)
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        assert_frame_equal(result, expected)
+
+        timings = engine.term_timings
+        for term in columns.values():
+            self.assertIn(term, timings)
+            self.assertGreaterEqual(timings[term], 0)
+
+        # Closing the engine stops its threads, and the next computation
+        # starts new ones.
+        engine.close()
+        self.assertIsNone(engine._pool)
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        assert_frame_equal(result, expected)
+
+    def test_parallel_error(self):
+
+        class Failing(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 2
+
+            def compute(self, today, assets, out, closes):
+                raise ValueError('failed to compute')
+
+        pipeline = Pipeline({
+            'failing': Failing(),
+            'sum': RollingSumDifference(window_length=3),
+        })
+        with self.assertRaisesRegexp(ValueError, 'failed to compute'):
+            self.make_engine(4).run_pipeline(
+                pipeline, self.dates[10], self.dates[12],
+            )
+
+
+class TermCacheTestCase(WithConstantInputs,
+                        WithInstanceTmpDir,
+                        ZiplineTestCase):
+
+    def make_engine(self, data_version):
+        loader = self.loader
+        return SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            term_cache=TermCache(self.instance_tmpdir.path, data_version),
+        )
+
+    def test_term_cache(self):
+        class RecordingSum(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 3
+            # Not closed over by ``compute``, which would make the key of the
+            # factor change with each computation.
+            computed_dates = []
+
+            def compute(self, today, assets, out, closes):
+                type(self).computed_dates.append(today)
+                out[:] = closes.sum(axis=0)
+
+        computed_dates = RecordingSum.computed_dates
+
+        factor = RecordingSum()
+        pipeline = Pipeline({'sum': factor, 'sum_plus_one': factor + 1})
+        start_date, end_date = self.dates[5], self.dates[9]
+
+        expected = self.make_engine('v1').run_pipeline(
+            pipeline, start_date, end_date,
+        )
+        self.assertEqual(len(computed_dates), 5)
+        assert_equal(expected['sum'].values, full(20, 9.0))
+        assert_equal(expected['sum_plus_one'].values, full(20, 10.0))
+
+        # Another engine over the same data reads the cached results.
+        engine = self.make_engine('v1')
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(len(computed_dates), 5)
+        self.assertGreater(engine._term_cache.hits, 0)
+        assert_frame_equal(result, expected)
+
+        # Results computed from another version of the data are not read.
+        result = self.make_engine('v2').run_pipeline(
+            pipeline, start_date, end_date,
+        )
+        self.assertEqual(len(computed_dates), 10)
+        assert_frame_equal(result, expected)
+
+    def test_eviction(self):
+        # Room for one of the results below, but not two.
+        cache = TermCache(self.instance_tmpdir.path, 'v1', max_bytes=400)
+        dates = self.dates[:5]
+        assets = Int64Index(self.asset_ids)
+        mask = ones((len(dates), len(assets)), dtype=bool_dtype)
+
+        first = cache.key(AssetID(), dates, assets, mask)
+        cache.set(first, arange(20, dtype=float64).reshape(5, 4))
+        assert_equal(
+            cache.get(first),
+            arange(20, dtype=float64).reshape(5, 4),
+        )
+
+        # Make the first result the least recently used one.
+        os.utime(cache._keypath(first), (0, 0))
+
+        # The second result doesn't fit alongside the first one.
+        second = cache.key(AssetIDPlusDay(), dates, assets, mask)
+        self.assertNotEqual(first, second)
+        cache.set(second, ones((5, 4)))
+        self.assertIsNone(cache.get(first))
+        assert_equal(cache.get(second), ones((5, 4)))
+
+    def test_closure_values_in_key(self):
+        cache = TermCache(self.instance_tmpdir.path, 'v1')
+        dates = self.dates[:5]
+        assets = Int64Index(self.asset_ids)
+        mask = ones((len(dates), len(assets)), dtype=bool_dtype)
+
+        def make_factor(threshold):
+            class Above(CustomFactor):
+                inputs = [USEquityPricing.close]
+                window_length = 1
+
+                def compute(self, today, assets, out, closes):
+                    out[:] = closes[-1] > threshold
+
+            return Above()
+
+        # The classes have the same name and code, and differ only in the
+        # values that they close over.
+        one = cache.key(make_factor(1.0), dates, assets, mask)
+        self.assertEqual(one, cache.key(make_factor(1.0), dates, assets, mask))
+        self.assertNotEqual(
+            one,
+            cache.key(make_factor(2.0), dates, assets, mask),
+        )
+
+        # Values without a stable repr can't be identified.
+        self.assertIsNone(
+            cache.key(make_factor(object()), dates, assets, mask),
+        )
+
+
+class IncrementalPipelineTestCase(WithAdjustmentReader, ZiplineTestCase):
+    first_asset_start = Timestamp('2015-04-01', tz='UTC')
+    START_DATE = Timestamp('2015-01-01', tz='utc')
+    END_DATE = Timestamp('2015-08-01', tz='utc')
+
+    @classmethod
+    def make_equity_info(cls):
+        cls.equity_info = ret = make_rotating_equity_info(
+            num_assets=6,
+            first_start=cls.first_asset_start,
+            frequency=cls.trading_calendar.day,
+            periods_between_starts=4,
+            asset_lifetime=8,
+        )
+        return ret
+
+    @classmethod
+    def make_equity_daily_bar_data(cls):
+        return make_bar_data(
+            cls.equity_info,
+            cls.equity_daily_bar_days,
+        )
+
+    @classmethod
+    def make_splits_data(cls):
+        # Split each asset in the middle of its lifetime.
+        day = cls.trading_calendar.day
+        return DataFrame({
+            'sid': cls.equity_info.index,
+            'ratio': 0.5,
+            'effective_date': [
+                (start_date + 4 * day).value // 10 ** 9
+                for start_date in cls.equity_info['start_date']
+            ],
+        })
+
+    def test_incremental_matches_full(self):
+        loaded_lengths = []
+
+        class RecordingLoader(USEquityPricingLoader):
+            def load_adjusted_array(self, columns, dates, assets, mask):
+                loaded_lengths.append(len(dates))
+                return super(RecordingLoader, self).load_adjusted_array(
+                    columns, dates, assets, mask,
+                )
+
+        loader = RecordingLoader(
+            self.bcolz_equity_daily_bar_reader,
+            self.adjustment_reader,
+        )
+        sessions = self.trading_calendar.all_sessions
+
+        def make_engine(incremental):
+            return SimplePipelineEngine(
+                lambda column: loader,
+                sessions,
+                self.asset_finder,
+                incremental=incremental,
+            )
+
+        pipeline = Pipeline({
+            'sma': SimpleMovingAverage(
+                inputs=[USEquityPricing.close],
+                window_length=10,
+            ),
+            'volume': SimpleMovingAverage(
+                inputs=[USEquityPricing.volume],
+                window_length=3,
+            ),
+            'close': USEquityPricing.close.latest,
+        })
+
+        start_ix, end_ix = sessions.slice_locs(
+            self.first_asset_start,
+            self.equity_info['end_date'].max(),
+        )
+        incremental_engine = make_engine(True)
+        full_engine = make_engine(False)
+        for i, session in enumerate(sessions[start_ix + 10:end_ix]):
+            del loaded_lengths[:]
+            result = incremental_engine.run_pipeline(
+                pipeline, session, session,
+            )
+            if i:
+                # Only the new session is loaded, along with the one before
+                # it.
+                self.assertEqual(loaded_lengths, [2, 2])
+
+            expected = full_engine.run_pipeline(pipeline, session, session)
+            self.assertFalse(expected.empty)
+            assert_frame_equal(result, expected)
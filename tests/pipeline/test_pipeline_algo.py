@@ -43,6 +43,7 @@ from zipline.errors import (
 )
 from zipline.lib.adjustment import MULTIPLY
 from zipline.pipeline import Pipeline
+from zipline.pipeline.engine import PipelineEngine
 from zipline.pipeline.factors import VWAP
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.loaders.frame import DataFrameLoader
@@ -344,6 +345,46 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
         # Run for a week in the middle of our data.
         algo.run(self.data_portal)
 
+    def test_engine_with_only_run_pipeline(self):
+        """
+        Assert that pipeline_output works with an engine which only implements
+        ``PipelineEngine.run_pipeline``.
+        """
+        class FrameOnlyEngine(PipelineEngine):
+            def __init__(self, engine):
+                self.engine = engine
+
+            def run_pipeline(self, pipeline, start_date, end_date):
+                return self.engine.run_pipeline(pipeline, start_date, end_date)
+
+        def initialize(context):
+            p = attach_pipeline(Pipeline(), 'test', chunks=5)
+            p.add(USEquityPricing.close.latest, 'close')
+
+        def handle_data(context, data):
+            results = pipeline_output('test')
+            date = get_datetime().normalize()
+            for asset in self.assets:
+                exists_today = self.exists(date, asset)
+                existed_yesterday = self.exists(date - self.trading_day, asset)
+                if exists_today and existed_yesterday:
+                    latest = results.loc[asset, 'close']
+                    self.assertEqual(latest, self.expected_close(date, asset))
+                else:
+                    self.assertNotIn(asset, results.index)
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+        algo.engine = FrameOnlyEngine(algo.engine)
+        algo.run(self.data_portal)
+
 
 class MockDailyBarSpotReader(object):
     """
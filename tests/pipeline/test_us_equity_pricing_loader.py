@@ -15,6 +15,8 @@
 """
 Tests for USEquityPricingLoader and related classes.
 """
+import sqlite3
+
 from nose_parameterized import parameterized
 from numpy import (
     arange,
@@ -36,6 +38,7 @@ from pandas import (
 from pandas.util.testing import assert_frame_equal
 from toolz.curried.operator import getitem
 
+from zipline.data.us_equity_pricing import SQLiteAdjustmentReader
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     NullAdjustmentReader,
@@ -51,6 +54,7 @@ from zipline.pipeline.data import USEquityPricing
 from zipline.testing import (
     seconds_to_timestamp,
     str_to_seconds,
+    tmp_dir,
     MockDailyBarReader,
 )
 from zipline.testing.fixtures import (
@@ -397,6 +401,46 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
                 self.assertEqual(adj.last_col, expected.last_col)
                 assert_allclose(adj.value, expected.value)
 
+    def test_reconnect_after_fork(self):
+        columns = ['close', 'volume']
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+        )
+        expected = self.adjustment_reader.load_adjustments(
+            columns, query_days, self.assets,
+        )
+
+        with tmp_dir() as tmpdir:
+            path = tmpdir.getpath('adjustments.db')
+            conn = sqlite3.connect(path)
+            conn.executescript(
+                '\n'.join(self.adjustment_reader.conn.iterdump()),
+            )
+            conn.close()
+
+            reader = SQLiteAdjustmentReader(path)
+            parent_conn = reader.conn
+            self.assertIs(reader.conn, parent_conn)
+
+            # A forked process connects to the database again.
+            reader._conn_pid = -1
+            child_conn = reader.conn
+            self.assertIsNot(child_conn, parent_conn)
+            self.assertIs(reader.conn, child_conn)
+            self.assertEqual(
+                reader.load_adjustments(columns, query_days, self.assets),
+                expected,
+            )
+            child_conn.close()
+            parent_conn.close()
+
+        # Databases held in memory can only be read through the inherited
+        # connection.
+        memory_conn = self.adjustment_reader.conn
+        self.adjustment_reader._conn_pid = -1
+        self.assertIs(self.adjustment_reader.conn, memory_conn)
+
     @parameterized([(True,), (False,)])
     def test_load_adjustments_to_df(self, convert_dts):
         reader = self.adjustment_reader
@@ -14,7 +14,7 @@
 # limitations under the License.
 from collections import OrderedDict
 
-from numpy import array, append, nan, full
+from numpy import array, append, nan, full, ndarray
 from numpy.testing import assert_almost_equal
 import pandas as pd
 from pandas.tslib import Timedelta
@@ -370,6 +370,25 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    def test_get_spot_values(self):
+        equity = self.asset_finder.retrieve_asset(1)
+        future = self.asset_finder.retrieve_asset(10000)
+        trading_calendar = self.trading_calendars[Equity]
+        dts = trading_calendar.minutes_for_session(self.trading_days[2])
+
+        for dt in dts[1], dts[100]:
+            for field in ('open', 'high', 'low', 'close', 'volume', 'price'):
+                result = self.data_portal.get_spot_values(
+                    [equity, future, equity], field, dt, 'minute',
+                )
+                self.assertIsInstance(result, ndarray)
+                assert_almost_equal(
+                    result,
+                    [self.data_portal.get_spot_value(asset, field, dt,
+                                                     'minute')
+                     for asset in (equity, future, equity)],
+                )
+
     def test_bar_count_for_simple_transforms(self):
         # July 2015
         # Su Mo Tu We Th Fr Sa
@@ -414,6 +433,28 @@ class DataPortalTestBase(WithDataPortal,
             self.data_portal._get_minute_count_for_transform(nov_30_dt, 4)
         )
 
+    def test_minute_index_window(self):
+        cal = self.trading_calendar
+        minute_index = self.data_portal._minute_index
+        nov_27_close = cal.open_and_close_for_session(
+            pd.Timestamp("2015-11-27", tz='UTC')
+        )[1]
+        dts = [
+            nov_27_close,
+            # After the early close, the window ends at the close.
+            nov_27_close + Timedelta("2 hours"),
+            nov_27_close + Timedelta("3 days"),
+        ]
+        for dt in dts:
+            for count in 1, 390, 1000:
+                window = minute_index.window(dt, count)
+                assert_equal(window, cal.minutes_window(dt, -count))
+                # Repeated calls share the same index.
+                self.assertIs(window, minute_index.window(dt, count))
+
+        with self.assertRaises(KeyError):
+            minute_index.window(cal.all_minutes[5], 10)
+
     def test_get_last_traded_dt_minute(self):
         minutes = self.nyse_calendar.minutes_for_session(
             self.trading_days[2])
@@ -450,6 +491,25 @@ class DataPortalTestBase(WithDataPortal,
                          "Asset 10000 had a trade on fourth minute, so should "
                          "return that as the last trade on the fifth.")
 
+    @parameter_space(frequency=HISTORY_FREQUENCIES)
+    def test_get_history_windows(self, frequency):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        minute = self.nyse_calendar.minutes_for_session(
+            self.trading_days[2],
+        )[5]
+        fields = ['open', 'high', 'low', 'close', 'volume', 'price']
+
+        result = self.data_portal.get_history_windows(
+            assets, minute, 2, frequency, fields, 'minute',
+        )
+
+        assert_equal(sorted(result.items), sorted(fields))
+        for field in fields:
+            expected = self.data_portal.get_history_window(
+                assets, minute, 2, frequency, field, 'minute',
+            )
+            assert_equal(result[field], expected, msg=field)
+
     def test_get_empty_splits(self):
         splits = self.data_portal.get_splits([], self.trading_days[2])
         self.assertEqual([], splits)
@@ -1598,6 +1598,35 @@ class NoPrefetchMinuteEquityHistoryTestCase(MinuteEquityHistoryTestCase):
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = 0
 
 
+class AdaptivePrefetchMinuteEquityHistoryTestCase(
+        MinuteEquityHistoryTestCase):
+    DATA_PORTAL_MINUTE_HISTORY_PREFETCH = 10
+    DATA_PORTAL_ADAPTIVE_MINUTE_HISTORY_PREFETCH = True
+
+    def test_adaptive_prefetch_stats(self):
+        equity_cal = self.trading_calendars[Equity]
+        minutes = equity_cal.minutes_for_session(
+            pd.Timestamp('2015-01-06', tz='UTC'),
+        )[20:220]
+
+        for minute in minutes:
+            self.data_portal.get_history_window(
+                [self.ASSET2],
+                minute,
+                10,
+                '1m',
+                'close',
+                'minute',
+            )
+
+        stats = self.data_portal.history_prefetch_stats()['minute']
+        self.assertEqual(stats['hits'] + stats['misses'], len(minutes))
+        # Prefetching 10, 20, then 40 minutes at a time takes 7 loads where
+        # a fixed prefetch of 10 minutes takes 19.
+        self.assertEqual(stats['block_loads'], 7)
+        self.assertEqual(stats['misses'], 7)
+
+
 class DailyEquityHistoryTestCase(WithHistory, ZiplineTestCase):
     CREATE_BARDATA_DATA_FREQUENCY = 'daily'
 
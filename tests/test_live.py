@@ -16,8 +16,12 @@ except ImportError:                     # Python 2
 
 from functools import partial
 
+import gc
 import os
+import json
+import threading
 from math import fabs
+from timeit import default_timer
 
 from mock import patch, sentinel, Mock, MagicMock
 from testfixtures import tempdir
@@ -33,13 +37,18 @@ from zipline.algorithm import TradingAlgorithm
 from zipline.algorithm_live import LiveTradingAlgorithm, LiveAlgorithmExecutor
 from zipline.data.data_portal_live import DataPortalLive
 from zipline.gens.realtimeclock import (RealtimeClock,
+                                        BAR,
                                         SESSION_START,
+                                        SESSION_END,
                                         BEFORE_TRADING_START_BAR)
 from zipline.finance.order import Order as ZPOrder
 from zipline.finance.blotter_live import BlotterLive
 from zipline.gens.sim_engine import MinuteSimulationClock
-from zipline.gens.brokers.broker import Broker
-from zipline.gens.brokers.ib_broker import IBBroker, TWSConnection
+from zipline.gens.brokers.broker import Broker, OrderJournal
+from zipline.gens.brokers.ib_broker import (IBBroker,
+                                            TWSConnection,
+                                            TickBuffer,
+                                            MinuteBarAggregator)
 from zipline.gens.brokers.alpaca_broker import ALPACABroker
 from zipline.testing.fixtures import WithSimParams
 from zipline.finance.execution import (StopLimitOrder,
@@ -50,7 +59,9 @@ from zipline.finance.order import ORDER_STATUS
 from zipline.finance.transaction import Transaction
 from zipline.utils.calendars import get_calendar
 from zipline.utils.calendars.trading_calendar import days_at_time
-from zipline.utils.serialization_utils import load_context, store_context
+from zipline.utils.serialization_utils import (load_context,
+                                               store_context,
+                                               ContextCheckpointer)
 from zipline.testing.fixtures import (ZiplineTestCase,
                                       WithTradingEnvironment,
                                       WithDataPortal)
@@ -217,6 +228,122 @@ class TestRealtimeClock(TestCase):
                               pd.Timestamp("2017-04-20 20:05", tz='UTC'))
             self.assertEquals(event_type, BEFORE_TRADING_START_BAR)
 
+    def test_scheduled_wakeups(self):
+        """Tests that RealtimeClock sleeps until the next bar instead of
+        polling and emits the bars at the emission offset"""
+        wall_clock = [pd.Timestamp("2017-04-20 12:44:30", tz='UTC')]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            wall_clock[0] += pd.Timedelta(seconds=seconds)
+
+        clock = RealtimeClock(
+            self.sessions,
+            self.opens,
+            self.closes,
+            days_at_time(self.sessions, time(8, 45), "US/Eastern"),
+            False,
+            emission_offset=pd.Timedelta('250ms'),
+            time_source=lambda: wall_clock[0],
+            sleep=fake_sleep
+        )
+
+        bars = []
+        for event_time, event_type in clock:
+            if event_type == BAR:
+                bars.append(event_time)
+                # Each bar is emitted exactly at the emission offset
+                self.assertEquals(wall_clock[0],
+                                  event_time + pd.Timedelta('250ms'))
+                self.assertEquals(clock.emission_lag, pd.Timedelta(0))
+
+        expected_bars = pd.date_range("2017-04-20 13:31",
+                                      "2017-04-20 20:00",
+                                      freq='1min', tz='UTC')
+        self.assertEquals(list(bars), list(expected_bars))
+        # One wakeup per bar, plus the capped sleeps until the open
+        self.assertLess(len(sleeps), len(expected_bars) + 50)
+
+    def test_multiple_sessions(self):
+        """Tests that RealtimeClock steps through consecutive sessions like
+        MinuteSimulationClock"""
+        sessions = self.nyse_calendar.sessions_in_range(
+            pd.Timestamp("2017-04-20"),
+            pd.Timestamp("2017-04-24")
+        )
+        trading_o_and_c = self.nyse_calendar.schedule.ix[sessions]
+        opens = trading_o_and_c['market_open']
+        closes = trading_o_and_c['market_close']
+        before_trading_start_minutes = days_at_time(sessions,
+                                                    time(8, 45),
+                                                    "US/Eastern")
+
+        msc_events = list(MinuteSimulationClock(
+            sessions, opens, closes, before_trading_start_minutes, True
+        ))
+
+        wall_clock = [pd.Timestamp("2017-04-20 00:00", tz='UTC')]
+
+        def fake_sleep(seconds):
+            wall_clock[0] += pd.Timedelta(seconds=seconds)
+
+        rtc_events = list(RealtimeClock(
+            sessions, opens, closes, before_trading_start_minutes, True,
+            time_source=lambda: wall_clock[0],
+            sleep=fake_sleep
+        ))
+
+        self.assertEquals(len(sessions), 3)
+        self.assertEquals(rtc_events, msc_events)
+
+    def test_multiple_sessions_afterhours_start(self):
+        """Tests that a session which closed before the clock started is
+        closed and the clock moves on to the next session"""
+        sessions = self.nyse_calendar.sessions_in_range(
+            pd.Timestamp("2017-04-20"),
+            pd.Timestamp("2017-04-21")
+        )
+        trading_o_and_c = self.nyse_calendar.schedule.ix[sessions]
+        closes = trading_o_and_c['market_close']
+
+        wall_clock = [pd.Timestamp("2017-04-20 20:05", tz='UTC')]
+
+        def fake_sleep(seconds):
+            wall_clock[0] += pd.Timedelta(seconds=seconds)
+
+        events = list(RealtimeClock(
+            sessions,
+            trading_o_and_c['market_open'],
+            closes,
+            days_at_time(sessions, time(8, 45), "US/Eastern"),
+            False,
+            time_source=lambda: wall_clock[0],
+            sleep=fake_sleep
+        ))
+
+        self.assertEquals(events[:3], [
+            (sessions[0], SESSION_START),
+            (closes[0].tz_localize('UTC'), SESSION_END),
+            (sessions[1], SESSION_START),
+        ])
+        self.assertEquals(events[3],
+                          (pd.Timestamp("2017-04-21 12:45", tz='UTC'),
+                           BEFORE_TRADING_START_BAR))
+        self.assertEquals(events[-1],
+                          (closes[1].tz_localize('UTC'), SESSION_END))
+
+    def test_invalid_emission_offset(self):
+        with self.assertRaises(ValueError):
+            RealtimeClock(
+                self.sessions,
+                self.opens,
+                self.closes,
+                days_at_time(self.sessions, time(8, 45), "US/Eastern"),
+                False,
+                emission_offset=pd.Timedelta('1 min')
+            )
+
 
 class TestPersistence(WithSimParams, WithTradingEnvironment, ZiplineTestCase):
     def noop(*args, **kwargs):
@@ -380,6 +507,66 @@ class TestPersistence(WithSimParams, WithTradingEnvironment, ZiplineTestCase):
         assert restored_context.trading_client is None
         assert restored_context.event_manager is None
 
+    @tempdir()
+    def test_context_checkpointer(self, tmpdir):
+        class Context(object):
+            pass
+
+        context = Context()
+        context.counter = 1
+        context.prices = pd.DataFrame(
+            np.arange(20.0).reshape(10, 2),
+            index=pd.date_range('2017-04-20', periods=10, tz='UTC'),
+            columns=['a', 'b'])
+        context.model = {'weights': [0.1, 0.9]}
+
+        state_file_path = os.path.join(tmpdir.path, "state_file")
+        checkpointer = ContextCheckpointer(state_file_path, 'robocop', [])
+
+        assert checkpointer.store(context)
+        assert sorted(checkpointer.last_changed_fields) == \
+            ['counter', 'model', 'prices']
+        assert checkpointer.last_cost >= 0
+
+        # Nothing changed, the state file is not rewritten
+        assert not checkpointer.store(context)
+        assert checkpointer.last_changed_fields == []
+
+        context.prices.iloc[-1, 0] = -1.0
+        context.model['weights'].append(0.0)
+        assert checkpointer.store(context)
+        assert sorted(checkpointer.last_changed_fields) == ['model', 'prices']
+
+        del context.counter
+        assert checkpointer.store(context)
+
+        restored_context = Context()
+        load_context(state_file_path, restored_context, 'robocop')
+        assert not hasattr(restored_context, 'counter')
+        assert restored_context.model == context.model
+        pd.util.testing.assert_frame_equal(restored_context.prices,
+                                           context.prices)
+        assert os.listdir(tmpdir.path) == ["state_file"]
+
+    @tempdir()
+    def test_context_checkpointer_background(self, tmpdir):
+        class Context(object):
+            pass
+
+        context = Context()
+        state_file_path = os.path.join(tmpdir.path, "state_file")
+        checkpointer = ContextCheckpointer(state_file_path, 'robocop', [],
+                                           background=True)
+
+        for i in range(100):
+            context.counter = i
+            checkpointer.store(context)
+        checkpointer.flush()
+
+        restored_context = Context()
+        load_context(state_file_path, restored_context, 'robocop')
+        assert restored_context.counter == 99
+
 
 class TestLiveTradingAlgorithm(WithSimParams,
                                WithDataPortal,
@@ -492,13 +679,43 @@ class TestLiveTradingAlgorithm(WithSimParams,
         assert len(combined_data) == bar_count
         assert expected_bars.isin(combined_data).all().all()
 
+    def test_data_portal_live_batches_spot_values(self):
+        assets = [self.asset_finder.retrieve_asset(1),
+                  self.asset_finder.retrieve_asset(2)]
+        dt = pd.Timestamp('2017-03-03 10:00:00', tz='utc')
+        broker = MagicMock(Broker)
+        data_portal_live = DataPortalLive(
+            broker,
+            asset_finder=self.data_portal.asset_finder,
+            trading_calendar=self.data_portal.trading_calendar,
+            first_trading_day=self.data_portal._first_available_session,
+        )
+
+        # One call for all of the assets when the broker accepts a list
+        broker.batch_spot_values = True
+        broker.get_spot_value.return_value = [1.0, 2.0]
+        values = data_portal_live.get_spot_values(
+            iter(assets), 'price', dt, 'minute')
+        np.testing.assert_array_equal(values, [1.0, 2.0])
+        broker.get_spot_value.assert_called_once_with(
+            assets, 'price', dt, 'minute')
+
+        # One call per asset otherwise
+        broker.reset_mock()
+        broker.batch_spot_values = False
+        broker.get_spot_value.return_value = 3.0
+        values = data_portal_live.get_spot_values(
+            assets, 'price', dt, 'minute')
+        np.testing.assert_array_equal(values, [3.0, 3.0])
+        assert broker.get_spot_value.call_count == 2
+
 
 class TestIBBroker(WithSimParams, ZiplineTestCase):
     ASSET_FINDER_EQUITY_SIDS = (1, 2)
     ASSET_FINDER_EQUITY_SYMBOLS = ("SPY", "XIV")
 
     @staticmethod
-    def _tws_bars():
+    def _tws_with_ticks():
         with patch('zipline.gens.brokers.ib_broker.TWSConnection.connect'):
             tws = TWSConnection("localhost:9999:1111")
 
@@ -530,7 +747,7 @@ class TestIBBroker(WithSimParams, ZiplineTestCase):
                      pd.to_datetime('2017-09-27 11:42:10', utc=True),
                      450, 100.741, False)
 
-        return tws.bars
+        return tws
 
     @staticmethod
     def _create_contract(symbol):
@@ -582,10 +799,21 @@ class TestIBBroker(WithSimParams, ZiplineTestCase):
                             pd.to_datetime('2017-06-16 10:30:11', utc=True),
                             pd.to_datetime('2017-06-16 10:30:30', utc=True),
                             pd.to_datetime('2017-06-17 10:31:9', utc=True)]
-        index = pd.DatetimeIndex(last_trade_times)
+        ticks = TickBuffer(capacity=2)
+        minute_bars = MinuteBarAggregator()
+        for i, last_trade_time in enumerate(last_trade_times):
+            ticks.append(bars['last_trade_price'][i],
+                         bars['last_trade_size'][i],
+                         last_trade_time.value,
+                         bars['total_volume'][i],
+                         bars['vwap'][i],
+                         bars['single_trade_flag'][i])
+            minute_bars.add_tick(bars['last_trade_price'][i],
+                                 bars['last_trade_size'][i],
+                                 last_trade_time.value)
         broker = IBBroker(sentinel.tws_uri)
-        tws.return_value.bars = {asset.symbol: pd.DataFrame(
-            index=index, data=bars)}
+        tws.return_value.bars = {asset.symbol: ticks}
+        tws.return_value.minute_bars = {asset.symbol: minute_bars}
 
         price = broker.get_spot_value(asset, 'price', dt, data_freq)
         last_trade = broker.get_spot_value(asset, 'last_traded', dt, data_freq)
@@ -595,22 +823,22 @@ class TestIBBroker(WithSimParams, ZiplineTestCase):
         close = broker.get_spot_value(asset, 'close', dt, data_freq)
         volume = broker.get_spot_value(asset, 'volume', dt, data_freq)
 
-        # Only the last minute is taken into account, therefore
-        # the first bar is ignored
+        # OHLCV values are taken from the current (10:31) minute bar
         assert price == bars['last_trade_price'][-1]
         assert last_trade == last_trade_times[-1]
-        assert open_ == bars['last_trade_price'][1]
-        assert high == max(bars['last_trade_price'][1:])
-        assert low == min(bars['last_trade_price'][1:])
+        assert open_ == bars['last_trade_price'][-1]
+        assert high == bars['last_trade_price'][-1]
+        assert low == bars['last_trade_price'][-1]
         assert close == bars['last_trade_price'][-1]
-        assert volume == sum(bars['last_trade_size'][1:])
+        assert volume == bars['last_trade_size'][-1]
 
     def test_get_realtime_bars_produces_correct_df(self):
-        bars = self._tws_bars()
+        tws = self._tws_with_ticks()
 
         with patch('zipline.gens.brokers.ib_broker.TWSConnection'):
             broker = IBBroker(sentinel.tws_uri)
-            broker._tws.bars = bars
+            broker._tws.bars = tws.bars
+            broker._tws.minute_bars = tws.minute_bars
 
         assets = (self.env.asset_finder.retrieve_asset(1),
                   self.env.asset_finder.retrieve_asset(2))
@@ -670,6 +898,186 @@ class TestIBBroker(WithSimParams, ZiplineTestCase):
         assert xiv_non_na.iloc[0].close == 100.41
         assert xiv_non_na.iloc[0].volume == 200
 
+    def test_rtvolume_ticks_stored_in_tick_buffer(self):
+        with patch('zipline.gens.brokers.ib_broker.TWSConnection.connect'):
+            tws = TWSConnection("localhost:9999:1111")
+        tws.symbol_to_ticker_id['SPY'] = 0
+        tws.ticker_id_to_symbol[0] = 'SPY'
+
+        tws.tickString(0, 48, '701.28;1;1348075471534;67854;701.469;true')
+        tws.tickString(0, 48, ';0;1469805548873;240304;216.648653;true')
+        tws.tickString(0, 48, '701.30;3;1348075471634;67857;701.47;false')
+
+        ticks = tws.bars['SPY']
+        assert len(ticks) == 2
+        assert list(ticks.last_trade_price) == [701.28, 701.30]
+        assert list(ticks.last_trade_size) == [1, 3]
+        assert list(ticks.total_volume) == [67854, 67857]
+        assert list(ticks.single_trade_flag) == [True, False]
+        assert ticks.last_time == pd.to_datetime(1348075471634, unit='ms',
+                                                 utc=True)
+
+    def test_subscribe_to_market_data_in_bulk(self):
+        with patch('zipline.gens.brokers.ib_broker.TWSConnection.connect'):
+            tws = TWSConnection("localhost:9999:1111")
+
+        recorded_ticks = {
+            'SPY': '251.23;100;1506519000000;1000;251.2;false',
+            'XIV': '100.41;10;1506519000500;200;100.4;true',
+        }
+        requested = []
+
+        def replay_mkt_data(ticker_id, contract, tick_list, snapshot):
+            requested.append(contract.m_symbol)
+            if contract.m_symbol in recorded_ticks:
+                threading.Timer(
+                    0.1, tws.tickString,
+                    (ticker_id, 48, recorded_ticks[contract.m_symbol])
+                ).start()
+
+        tws.reqMktData = replay_mkt_data
+
+        start = default_timer()
+        not_ready = tws.subscribe_to_market_data(['SPY', 'XIV', 'QQQ'],
+                                                 timeout=1)
+        elapsed = default_timer() - start
+
+        assert requested == ['SPY', 'XIV', 'QQQ']
+        assert not_ready == ['QQQ']
+        # The symbols are awaited together, not one timeout each
+        assert elapsed < 2
+        assert tws.market_data_ready['SPY'].is_set()
+        assert tws.market_data_ready['XIV'].is_set()
+        assert tws.bars['XIV'].last_price == 100.41
+
+        # Resubscribing does not send the requests again
+        assert tws.subscribe_to_market_data('SPY', timeout=0) == []
+        assert requested == ['SPY', 'XIV', 'QQQ']
+
+        # A unicode symbol is a single symbol on Python 2 too
+        assert tws.subscribe_to_market_data(u'XIV', timeout=0) == []
+        assert requested == ['SPY', 'XIV', 'QQQ']
+
+    def test_get_realtime_bars_last_bar_count(self):
+        tws = self._tws_with_ticks()
+
+        with patch('zipline.gens.brokers.ib_broker.TWSConnection'):
+            broker = IBBroker(sentinel.tws_uri)
+            broker._tws.bars = tws.bars
+            broker._tws.minute_bars = tws.minute_bars
+
+        asset_spy = self.env.asset_finder.retrieve_asset(1)
+        asset_xiv = self.env.asset_finder.retrieve_asset(2)
+        realtime_history = broker.get_realtime_bars([asset_spy, asset_xiv],
+                                                    '1m', bar_count=5)
+
+        spy = realtime_history[asset_spy]
+        assert spy.index[-1] == pd.to_datetime('2017-09-27 12:10:00',
+                                               utc=True)
+        assert len(spy.dropna()) == 1
+        assert len(realtime_history[asset_xiv].dropna()) == 1
+        assert spy.iloc[-1].close == 12.99
+
+    def test_minute_bar_aggregator(self):
+        minute = pd.Timedelta('1 min').value
+        start = pd.Timestamp('2017-09-27 13:30', tz='UTC').value
+        aggregator = MinuteBarAggregator(window=3)
+        assert aggregator.current_bar is None
+        assert aggregator.bars().empty
+
+        for i in range(6):
+            aggregator.add_tick(10.0 + i, 1, start + i * minute)
+            aggregator.add_tick(9.0 + i, 2, start + i * minute + 10 ** 9)
+        # Late tick of the previously sealed bar
+        aggregator.add_tick(30.0, 5, start + 4 * minute + 2 * 10 ** 9)
+
+        assert aggregator.current_bar == (15.0, 15.0, 14.0, 14.0, 3)
+        bars = aggregator.bars()
+        # The window holds the last 3 sealed bars and the open one
+        assert len(bars) == 4
+        assert bars.index[0] == pd.Timestamp(start + 2 * minute, tz='UTC')
+        assert list(bars.volume) == [3, 3, 8, 3]
+        assert bars.high.iloc[-2] == 30.0
+
+        bars = aggregator.bars(bar_count=2)
+        assert list(bars.open) == [14.0, 15.0]
+
+    def test_tick_buffer_synthetic_session(self):
+        # The buffer is reallocated log2(n) times only and aggregates ticks
+        # spread over a whole session
+        n = 5000
+        session_open = pd.Timestamp('2017-09-27 13:30', tz='UTC').value
+        rand = np.random.RandomState(42)
+        times = session_open + np.sort(
+            rand.randint(0, 390 * 60 * 10 ** 9, size=n))
+        prices = 250 + np.cumsum(rand.normal(0, 0.01, size=n))
+        sizes = rand.randint(1, 500, size=n)
+
+        ticks = TickBuffer(capacity=1)
+        capacities = set()
+        for i in range(n):
+            ticks.append(prices[i], sizes[i], times[i], 0, 0.0, False)
+            capacities.add(ticks.capacity)
+        assert len(ticks) == n
+        assert len(capacities) <= int(np.ceil(np.log2(n))) + 1
+
+        ohlcv = ticks.ohlcv('1 Min')
+        assert len(ohlcv) == 390
+        expected = pd.Series(
+            prices,
+            index=pd.to_datetime(times, utc=True)).resample('1 Min').ohlc()
+        np.testing.assert_array_almost_equal(
+            ohlcv[['open', 'high', 'low', 'close']].values, expected.values)
+        assert ohlcv.volume.sum() == sizes.sum()
+
+    def test_tick_buffer_drop_before(self):
+        second = 10 ** 9
+        ticks = TickBuffer(capacity=4)
+        for i in range(4):
+            ticks.append(10.0 + i, i + 1, i * second, 0, 0.0, False)
+
+        assert ticks.drop_before(0) == 0
+        # Too few ticks would be dropped
+        assert ticks.drop_before(2 * second, min_dropped=3) == 0
+        assert len(ticks) == 4
+        assert ticks.drop_before(2 * second) == 2
+        assert len(ticks) == 2
+        assert ticks.capacity == 4
+        assert list(ticks.last_trade_price) == [12.0, 13.0]
+        assert list(ticks.last_trade_size) == [3, 4]
+        assert ticks.last_time == pd.Timestamp(3 * second, tz='UTC')
+
+        assert ticks.drop_before(10 * second) == 2
+        assert ticks.empty
+        assert np.isnan(ticks.last_price)
+
+    def test_ticks_trimmed_to_minute_bar_window(self):
+        tick = pd.Timedelta('6 s').value
+        start = pd.Timestamp('2017-09-27 13:30', tz='UTC').value
+        with patch('zipline.gens.brokers.ib_broker.TWSConnection.connect'):
+            tws = TWSConnection("localhost:9999:1111")
+        tws.minute_bars['SPY'] = MinuteBarAggregator(window=2)
+
+        for i in range(5000):
+            tws._add_tick('SPY', 10.0, 1, start + i * tick, 0, 0.0, False)
+
+        # The ticks of the bars rolled out of the aggregator window are
+        # dropped instead of growing the buffer
+        ticks = tws.bars['SPY']
+        assert ticks.capacity == 1024
+        assert len(ticks) < 1024
+        assert ticks.last_time == pd.Timestamp(start + 4999 * tick, tz='UTC')
+
+        # The buffer grows when the aggregator still needs most of the ticks
+        tws.minute_bars['QQQ'] = MinuteBarAggregator(window=300)
+        for i in range(5000):
+            tws._add_tick('QQQ', 10.0, 1, start + i * tick, 0, 0.0, False)
+
+        ticks = tws.bars['QQQ']
+        assert ticks.capacity > 1024
+        assert ticks.last_trade_time.min() < (
+            tws.minute_bars['QQQ'].first_start)
+
     @patch('zipline.gens.brokers.ib_broker.symbol_lookup')
     def test_new_order_appears_in_orders(self, symbol_lookup):
         with patch('zipline.gens.brokers.ib_broker.TWSConnection.connect'):
@@ -919,6 +1327,77 @@ class TestIBBroker(WithSimParams, ZiplineTestCase):
             assert broker.transactions[exec_id].price == price
             assert broker.transactions[exec_id].commission == 0
 
+    @patch('zipline.gens.brokers.ib_broker.symbol_lookup')
+    def test_order_journal(self, symbol_lookup):
+        with patch('zipline.gens.brokers.ib_broker.TWSConnection.connect'):
+            broker = IBBroker("localhost:9999:1111", account_id='TEST-123')
+            broker._tws.nextValidId(0)
+
+        asset = self.env.asset_finder.retrieve_asset(1)
+        symbol_lookup.return_value = asset
+        order = broker.order(asset, -4, MarketOrder())
+
+        events, cursor = broker.order_journal.read(0)
+        assert events == [('order', order)]
+
+        broker.sync_order_journal()
+        events, cursor = broker.order_journal.read(cursor)
+        assert not events
+
+        broker._tws.orderStatus(order.broker_order_id, 'Filled',
+                                filled=4, remaining=0,
+                                avg_fill_price=111, perm_id=0, parent_id=1,
+                                last_fill_price=112, client_id=1111,
+                                why_held='')
+        exec_detail = self._create_exec_detail(
+            order.broker_order_id, 4, 4, 12.3, 12.3,
+            pd.to_datetime('now', utc=True), 'exec-1')
+        broker._tws.execDetails(0, self._create_contract(str(asset.symbol)),
+                                exec_detail)
+        broker.sync_order_journal()
+
+        events, cursor = broker.order_journal.read(cursor)
+        assert [event_type for event_type, _ in events] == \
+            ['order', 'transaction']
+        assert not events[0][1].open
+        assert events[1][1] is broker.transactions['exec-1']
+        assert events[1][1].amount == -4
+
+        # Updates are consumed once
+        broker.sync_order_journal()
+        assert not broker.order_journal.read(cursor)[0]
+
+
+class FakeAlpacaWebSocket(object):
+    """In-memory stand-in for the Alpaca stream server.
+
+    Replays the given messages once the client started listening, then blocks
+    until the connection is closed."""
+    def __init__(self, messages):
+        self.sent = []
+        self.drained = threading.Event()
+        self._messages = list(messages)
+        self._listening = threading.Event()
+        self._closed = threading.Event()
+
+    def send(self, payload):
+        message = json.loads(payload)
+        self.sent.append(message)
+        if message['action'] == 'listen' and \
+                message['data']['streams'] != ['trade_updates']:
+            self._listening.set()
+
+    def recv(self):
+        self._listening.wait()
+        if self._messages:
+            return self._messages.pop(0)
+        self.drained.set()
+        self._closed.wait()
+        raise IOError("connection closed")
+
+    def close(self):
+        self._closed.set()
+
 
 class TestALPACABroker(WithSimParams, ZiplineTestCase):
     ASSET_FINDER_EQUITY_SIDS = (1, 2)
@@ -959,6 +1438,46 @@ class TestALPACABroker(WithSimParams, ZiplineTestCase):
         ret = broker.get_realtime_bars([asset], '1m')
         assert ret[asset, 'close'].values[1] == 103.1
 
+    @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
+    def test_get_realtime_bars_cached_per_minute(self, tradeapi):
+        api = tradeapi.REST()
+
+        def bar(time, close):
+            return {'time': time, 'open': close, 'high': close,
+                    'low': close, 'close': close, 'volume': 100}
+
+        def list_bars(symbols, timeframe, start_dt=None, limit=None):
+            assert symbols == ['SPY']
+            if start_dt is None:
+                bars = [bar('2017-06-19T10:31:00-0400', 102.0),
+                        bar('2017-06-19T10:32:00-0400', 103.0)]
+            else:
+                assert pd.Timestamp(start_dt) == \
+                    pd.Timestamp('2017-06-19T10:32:00-0400')
+                bars = [bar('2017-06-19T10:32:00-0400', 103.5),
+                        bar('2017-06-19T10:33:00-0400', 104.0)]
+            return [apca.AssetBars({'symbol': 'SPY', 'bars': bars})]
+        api.list_bars.side_effect = list_bars
+
+        broker = ALPACABroker('')
+        asset = self.env.asset_finder.retrieve_asset(1)
+        now = pd.Timestamp('2017-06-19 14:32:30', tz='UTC')
+        with patch.object(ALPACABroker, '_now', side_effect=lambda: now):
+            close = broker.get_realtime_bars([asset], '1m')[asset, 'close']
+            volume = broker.get_realtime_bars([asset], '1m')[asset, 'volume']
+            high = broker.get_realtime_bars(asset, '1m')[asset, 'high']
+            assert api.list_bars.call_count == 1
+            assert list(close.values) == [102.0, 103.0]
+            assert list(volume.values) == [100, 100]
+            assert list(high.values) == [102.0, 103.0]
+
+            # After the minute boundary only the new bars are requested and
+            # the partial last bar gets replaced.
+            now = pd.Timestamp('2017-06-19 14:33:30', tz='UTC')
+            close = broker.get_realtime_bars([asset], '1m')[asset, 'close']
+            assert api.list_bars.call_count == 2
+            assert list(close.values) == [102.0, 103.5, 104.0]
+
     @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
     def test_get_spot_value(self, tradeapi):
         api = tradeapi.REST()
@@ -1226,6 +1745,60 @@ class TestALPACABroker(WithSimParams, ZiplineTestCase):
 
         portfolio = broker.portfolio
 
+    @patch('zipline.gens.brokers.alpaca_broker.symbols_lookup')
+    @patch('zipline.gens.brokers.alpaca_broker.symbol_lookup')
+    @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
+    def test_account_snapshot(self, tradeapi, symbol_lookup, symbols_lookup):
+        api = tradeapi.REST()
+        assets = {
+            'SPY': self.env.asset_finder.retrieve_asset(1),
+            'XIV': self.env.asset_finder.retrieve_asset(2),
+        }
+        symbols_lookup.side_effect = lambda *symbols: [assets[s]
+                                                       for s in symbols]
+        api.get_account.return_value = apca.Account({
+            'cash': '5000.00',
+            'portfolio_value': '7000.00'
+        })
+        api.list_positions.return_value = [
+            apca.Position({'symbol': 'SPY', 'qty': '10',
+                           'cost_basis': '210.00'}),
+            apca.Position({'symbol': 'XIV', 'qty': '-5',
+                           'cost_basis': '100.00'}),
+        ]
+        api.list_quotes.return_value = [
+            apca.Quote({'symbol': 'SPY', 'last': 210.05,
+                        'last_timestamp': '2017-06-01T10:03:03-0400'}),
+            apca.Quote({'symbol': 'XIV', 'last': 99.5,
+                        'last_timestamp': '2017-06-01T10:03:04-0400'}),
+        ]
+        broker = ALPACABroker('')
+
+        now = pd.Timestamp('2017-06-01 14:03:30', tz='UTC')
+        with patch.object(ALPACABroker, '_now', side_effect=lambda: now):
+            portfolio = broker.portfolio
+            account = broker.account
+            positions = broker.positions
+
+            assert api.get_account.call_count == 1
+            assert api.list_positions.call_count == 1
+            assert api.list_quotes.call_count == 1
+            assert symbols_lookup.call_count == 1
+            assert not symbol_lookup.called
+
+            assert portfolio.positions is positions
+            assert account.total_position_value == 2000.0
+            assert positions[assets['SPY']].amount == 10
+            assert positions[assets['XIV']].amount == -5
+            assert positions[assets['XIV']].last_sale_price == 99.5
+
+            # Next bar: fresh snapshot, symbols are resolved already
+            now = pd.Timestamp('2017-06-01 14:04:30', tz='UTC')
+            broker.portfolio
+            assert api.get_account.call_count == 2
+            assert api.list_positions.call_count == 2
+            assert symbols_lookup.call_count == 1
+
     @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
     def test_last_trade_dt(self, tradeapi):
         asset = self.env.asset_finder.retrieve_asset(1)
@@ -1243,6 +1816,170 @@ class TestALPACABroker(WithSimParams, ZiplineTestCase):
         ret = broker.get_last_traded_dt(asset)
         assert ret.minute == 27
 
+    @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
+    def test_streaming(self, tradeapi):
+        api = tradeapi.REST()
+        asset = self.env.asset_finder.retrieve_asset(1)
+        api.list_bars.return_value = [
+            apca.AssetBars({
+                'symbol': 'SPY',
+                'bars': [{
+                    'time': '2017-06-19T10:30:00-0400',
+                    'open': 101.0,
+                    'high': 101.5,
+                    'low': 100.5,
+                    'close': 101.1,
+                    'volume': 1000,
+                }],
+            })
+        ]
+
+        def epoch_ms(ts):
+            return pd.Timestamp(ts).value // 10 ** 6
+
+        messages = [
+            json.dumps({'stream': 'authorization',
+                        'data': {'status': 'authorized'}}),
+            json.dumps({'stream': 'AM.SPY',
+                        'data': {'ev': 'AM', 'sym': 'SPY',
+                                 'o': 102.0, 'h': 102.5, 'l': 101.5,
+                                 'c': 102.1, 'v': 998,
+                                 's': epoch_ms('2017-06-19 14:31'),
+                                 'e': epoch_ms('2017-06-19 14:32')}}),
+            json.dumps({'stream': 'T.SPY',
+                        'data': {'ev': 'T', 'sym': 'SPY',
+                                 'p': 102.2, 's': 100,
+                                 't': epoch_ms('2017-06-19 14:32:05')}}),
+            json.dumps({'stream': 'Q.SPY',
+                        'data': {'ev': 'Q', 'sym': 'SPY',
+                                 'bp': 102.19, 'bs': 3,
+                                 'ap': 102.21, 'as': 5,
+                                 't': epoch_ms('2017-06-19 14:32:06')}}),
+        ]
+        ws = FakeAlpacaWebSocket(messages)
+        broker = ALPACABroker('stream', stream_connect=lambda url: ws)
+        try:
+            assert ws.sent[0]['action'] == 'authenticate'
+
+            broker.subscribe_to_market_data(asset)
+            assert broker.subscribed_assets() == [asset]
+            assert ws.sent[-1] == {
+                'action': 'listen',
+                'data': {'streams': ['T.SPY', 'Q.SPY', 'AM.SPY']}}
+            assert ws.drained.wait(5)
+
+            price = broker.get_spot_value(asset, 'price', None, 'minute')
+            assert price == 102.2
+            last_traded = broker.get_last_traded_dt(asset)
+            assert last_traded == pd.Timestamp('2017-06-19 14:32:05',
+                                               tz='UTC')
+            volume = broker.get_spot_value([asset], 'volume', None, 'minute')
+            assert volume == [998]
+            assert not api.list_quotes.called
+            assert not api.get_quote.called
+
+            bars = broker.get_realtime_bars([asset], '1m')
+            assert len(bars) == 2
+            assert list(bars[asset, 'close'].values) == [101.1, 102.1]
+            assert bars.index[-1] == pd.Timestamp('2017-06-19 14:31',
+                                                  tz='UTC')
+            # Bars were seeded once at subscription, served locally since
+            assert api.list_bars.call_count == 1
+        finally:
+            broker._stream.stop()
+
+    @patch('zipline.gens.brokers.alpaca_broker.symbol_lookup')
+    @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
+    def test_streamed_trade_updates(self, tradeapi, symbol_lookup):
+        asset = self.env.asset_finder.retrieve_asset(1)
+        symbol_lookup.return_value = asset
+
+        def trade_update(event, filled_qty, filled_at=None, price=None):
+            data = {
+                'event': event,
+                'timestamp': '2017-06-19T10:31:05-0400',
+                'order': {
+                    'id': 'order1',
+                    'client_order_id': 'zp-1',
+                    'symbol': 'SPY',
+                    'qty': '10',
+                    'side': 'sell',
+                    'submitted_at': '2017-06-19T10:31:00-0400',
+                    'filled_at': filled_at,
+                    'filled_qty': filled_qty,
+                    'canceled_at': None,
+                    'failed_at': None,
+                    'limit_price': None,
+                    'stop_price': None,
+                },
+            }
+            if price is not None:
+                data['price'] = price
+            return json.dumps({'stream': 'trade_updates', 'data': data})
+
+        messages = [
+            trade_update('new', '0'),
+            trade_update('partial_fill', '4', price='210.1'),
+            trade_update('fill', '10', filled_at='2017-06-19T10:31:06-0400',
+                         price='210.2'),
+        ]
+        ws = FakeAlpacaWebSocket(messages)
+        broker = ALPACABroker('stream', stream_connect=lambda url: ws)
+        try:
+            assert ws.sent[1] == {'action': 'listen',
+                                  'data': {'streams': ['trade_updates']}}
+            blotter = BlotterLive(data_frequency='minute', broker=broker)
+            broker.subscribe_to_market_data(asset)
+            assert ws.drained.wait(5)
+            broker._snapshot = sentinel.snapshot
+
+            transactions, commissions, closed_orders = \
+                blotter.get_transactions(None)
+            # The fills invalidate the cached positions
+            assert broker._snapshot is None
+            assert [tx.amount for tx in transactions] == [-4, -6]
+            assert [tx.price for tx in transactions] == [210.1, 210.2]
+            assert [c['cost'] for c in commissions] == [0, 0]
+            assert [o.id for o in closed_orders] == ['zp-1']
+            assert not blotter.open_orders
+            assert blotter.orders['zp-1'].status == ORDER_STATUS.FILLED
+        finally:
+            broker._stream.stop()
+
+    @patch('zipline.gens.brokers.alpaca_broker.symbol_lookup')
+    @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
+    def test_streamed_orders_seeded_from_listed_orders(self,
+                                                       tradeapi,
+                                                       symbol_lookup):
+        asset = self.env.asset_finder.retrieve_asset(1)
+        symbol_lookup.return_value = asset
+        api = tradeapi.REST()
+        # Placed before the broker was started and not updated since.
+        api.list_orders.return_value = [apca.Order({
+            'id': 'order1',
+            'symbol': 'SPY',
+            'qty': '10',
+            'side': 'buy',
+            'filled_at': None,
+            'submitted_at': '2017-06-01T10:04:30-0400',
+            'filled_qty': None,
+            'failed_at': None,
+            'canceled_at': None,
+            'limit_price': '210.32',
+            'stop_price': None,
+            'client_order_id': 'zp-1',
+        })]
+
+        ws = FakeAlpacaWebSocket([])
+        broker = ALPACABroker('stream', stream_connect=lambda url: ws)
+        try:
+            api.list_orders.assert_called_once_with(status='all')
+            blotter = BlotterLive(data_frequency='minute', broker=broker)
+            assert list(blotter.orders) == ['zp-1']
+            assert [o.id for o in blotter.open_orders[asset]] == ['zp-1']
+        finally:
+            broker._stream.stop()
+
     @patch('zipline.gens.brokers.alpaca_broker.tradeapi')
     def test_misc(self, tradeapi):
         broker = ALPACABroker('')
@@ -1391,3 +2128,103 @@ class TestBlotterLive(WithTradingEnvironment, ZiplineTestCase):
         assert not new_transactions
         assert not new_commissions
         assert not new_closed_orders
+
+    def test_order_journal_drops_read_events(self):
+        class Consumer(object):
+            pass
+
+        journal = OrderJournal()
+        first, second = Consumer(), Consumer()
+        _, first_cursor = journal.read(0, consumer=first)
+        _, second_cursor = journal.read(0, consumer=second)
+
+        journal.record_order(sentinel.order1)
+        journal.record_order(sentinel.order2)
+        events, first_cursor = journal.read(first_cursor, consumer=first)
+        assert [order for _, order in events] == \
+            [sentinel.order1, sentinel.order2]
+
+        # Kept until every consumer has read them.
+        assert len(journal._events) == 2
+        events, second_cursor = journal.read(second_cursor, consumer=second)
+        assert len(events) == 2
+        assert not journal._events
+
+        journal.record_order(sentinel.order3)
+        assert len(journal) == 3
+        events, first_cursor = journal.read(first_cursor, consumer=first)
+        assert [order for _, order in events] == [sentinel.order3]
+        assert first_cursor == 3
+
+        # The journal does not hold on to consumers which are gone.
+        del second
+        gc.collect()
+        journal.read(first_cursor, consumer=first)
+        assert not journal._events
+
+    def test_order_journal_caps_unread_events(self):
+        class Consumer(object):
+            pass
+
+        # Without consumers, only the latest events are kept.
+        journal = OrderJournal(max_unread=3)
+        for i in range(10):
+            journal.record_order(i)
+        assert len(journal) == 10
+        assert list(journal._events) == [('order', i) for i in (7, 8, 9)]
+
+        # A consumer that fell behind reads the events still kept.
+        consumer = Consumer()
+        events, cursor = journal.read(2, consumer=consumer)
+        assert [order for _, order in events] == [7, 8, 9]
+        assert cursor == 10
+        assert not journal._events
+
+    def test_order_journal(self):
+        broker = MagicMock(Broker)
+        broker.order_journal = OrderJournal()
+        blotter = BlotterLive(data_frequency='minute', broker=broker)
+        assert not blotter.open_orders
+
+        asset1 = self.env.asset_finder.retrieve_asset(1)
+        asset2 = self.env.asset_finder.retrieve_asset(2)
+        orders = self._get_orders(asset1, asset2)
+        for order in orders.values():
+            broker.order_journal.record_order(order)
+
+        assert len(blotter.open_orders) == 2
+        assert len(blotter.open_orders[asset1]) == 2
+        assert len(blotter.open_orders[asset2]) == 2
+        assert broker.sync_order_journal.called
+        new_transactions, new_commissions, new_closed_orders = \
+            blotter.get_transactions(None)
+        assert not new_transactions
+        assert not new_commissions
+        assert not new_closed_orders
+
+        order = orders[sentinel.order_id4]
+        order.filled = order.amount
+        tx = Transaction(asset=asset2, amount=order.amount,
+                         dt=pd.to_datetime('now', utc=True),
+                         price=123, order_id=order.id, commission=12)
+        broker.order_journal.record_order(order)
+        broker.order_journal.record_transaction(tx)
+
+        assert len(blotter.open_orders[asset2]) == 1
+        assert blotter.open_orders[asset2][0].id == sentinel.order_id3
+        new_transactions, new_commissions, new_closed_orders = \
+            blotter.get_transactions(None)
+        assert new_transactions == [tx]
+        assert new_commissions == [{'asset': asset2,
+                                    'cost': 12,
+                                    'order': order}]
+        assert new_closed_orders == [order]
+        assert blotter.orders[sentinel.order_id4] is order
+
+        # Repeated closed order updates are reported once
+        broker.order_journal.record_order(order)
+        new_transactions, new_commissions, new_closed_orders = \
+            blotter.get_transactions(None)
+        assert not new_transactions
+        assert not new_commissions
+        assert not new_closed_orders
@@ -4,7 +4,11 @@ Tests for zipline/utils/pandas_utils.py
 import pandas as pd
 
 from zipline.testing import parameter_space, ZiplineTestCase
-from zipline.utils.pandas_utils import nearest_unequal_elements
+from zipline.testing.predicates import assert_equal
+from zipline.utils.pandas_utils import (
+    categorical_df_concat,
+    nearest_unequal_elements,
+)
 
 
 class TestNearestUnequalElements(ZiplineTestCase):
@@ -80,3 +84,34 @@ class TestNearestUnequalElements(ZiplineTestCase):
             str(e.exception),
             'dts must be sorted in increasing order',
         )
+
+
+class TestCategoricalDFConcat(ZiplineTestCase):
+
+    def test_categorical_df_concat(self):
+        inputs = [
+            pd.DataFrame({
+                'A': pd.Series(['a', 'b', 'c'], dtype='category'),
+                'B': [1.0, 2.0, 3.0],
+            }),
+            pd.DataFrame({
+                'A': pd.Series(['c', 'd'], dtype='category'),
+                'B': [4.0, 5.0],
+            }),
+        ]
+
+        result = categorical_df_concat(inputs)
+
+        assert_equal(list(result['A'].cat.categories), ['a', 'b', 'c', 'd'])
+        assert_equal(list(result['A']), ['a', 'b', 'c', 'c', 'd'])
+        assert_equal(list(result['B']), [1.0, 2.0, 3.0, 4.0, 5.0])
+        # The inputs are not changed unless inplace is passed.
+        assert_equal(list(inputs[1]['A'].cat.categories), ['c', 'd'])
+
+    def test_categorical_df_concat_mismatched_dtypes(self):
+        inputs = [
+            pd.DataFrame({'A': pd.Series(['a'], dtype='category')}),
+            pd.DataFrame({'A': [1.0]}),
+        ]
+        with self.assertRaises(ValueError):
+            categorical_df_concat(inputs)
@@ -166,7 +166,7 @@ def ipython_only(option):
     '-e',
     '--end',
     type=Date(tz='utc', as_timestamp=True),
-    help='The end date of the simulation.',
+    help='The end date of the simulation or of live trading.',
 )
 @click.option(
     '-o',
@@ -32,6 +32,12 @@ from zipline.assets.continuous_futures import ContinuousFuture
 from zipline.zipline_warnings import ZiplineDeprecationWarning
 
 
+# Fields whose current values of many assets are read in one batch
+_BATCHED_SPOT_FIELDS = frozenset([
+    "open", "high", "low", "close", "volume", "price"
+])
+
+
 cdef bool _is_iterable(obj):
     return isinstance(obj, Iterable) and not isinstance(obj, string_types)
 
@@ -373,6 +379,18 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
+                    if field in _BATCHED_SPOT_FIELDS:
+                        assets = list(assets)
+                        return pd.Series(
+                            self.data_portal.get_spot_values(
+                                assets,
+                                field,
+                                self._get_current_minute(),
+                                self.data_frequency
+                            ),
+                            index=assets,
+                            name=fields,
+                        )
                     return pd.Series(data={
                         asset: self.data_portal.get_spot_value(
                                     asset,
@@ -399,7 +417,20 @@ cdef class BarData:
                 data = {}
 
                 if not self._adjust_minutes:
+                    assets = list(assets)
                     for field in fields:
+                        if field in _BATCHED_SPOT_FIELDS:
+                            data[field] = pd.Series(
+                                self.data_portal.get_spot_values(
+                                    assets,
+                                    field,
+                                    self._get_current_minute(),
+                                    self.data_frequency
+                                ),
+                                index=assets,
+                                name=field,
+                            )
+                            continue
                         series = pd.Series(data={
                             asset: self.data_portal.get_spot_value(
                                         asset,
@@ -670,21 +701,26 @@ cdef class BarData:
                 # columns are the assets, indexed by dt.
                 return df
         else:
-            if isinstance(assets, PricingDataAssociable):
-                # one asset, multiple fields. for now, just make multiple
-                # history calls, one per field, then stitch together the
-                # results. this can definitely be optimized!
-
-                df_dict = {
-                    field: self.data_portal.get_history_window(
-                        [assets],
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    )[assets] for field in fields
-                }
+            single_asset = isinstance(assets, PricingDataAssociable)
+
+            if single_asset:
+                asset_list = [assets]
+            else:
+                asset_list = assets
+
+            # read all of the fields in one pass over the history windows.
+            panel = self.data_portal.get_history_windows(
+                asset_list,
+                self._get_current_minute(),
+                bar_count,
+                frequency,
+                fields,
+                self.data_frequency,
+            )
+
+            if single_asset:
+                # one asset, multiple fields.
+                df_dict = {field: panel[field][assets] for field in fields}
 
                 if self._adjust_minutes:
                     adjs = {
@@ -704,17 +740,6 @@ cdef class BarData:
                 return pd.DataFrame(df_dict)
 
             else:
-                df_dict = {
-                    field: self.data_portal.get_history_window(
-                        assets,
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    ) for field in fields
-                }
-
                 if self._adjust_minutes:
                     adjs = {
                         field: self.data_portal.get_adjustments(
@@ -725,14 +750,14 @@ cdef class BarData:
                         ) for field in fields
                     }
 
-                    df_dict = {field: df * adjs[field]
-                               for field, df in iteritems(df_dict)}
+                    panel = pd.Panel({field: panel[field] * adjs[field]
+                                      for field in fields})
 
                 # returned panel has:
                 # items: fields
                 # major axis: dt
                 # minor axis: assets
-                return pd.Panel(df_dict)
+                return panel
 
     property current_dt:
         def __get__(self):
@@ -87,6 +87,7 @@ from zipline.finance.asset_restrictions import (
 from zipline.assets import Asset, Equity, Future
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline.pipeline import Pipeline
+from zipline.pipeline.columnar import ColumnarResults
 from zipline.pipeline.engine import (
     ExplodingPipelineEngine,
     SimplePipelineEngine,
@@ -2476,8 +2477,8 @@ class TradingAlgorithm(object):
             # of references:
 
             # 1. self._pipeline_cache holds a reference.
-            # 2. The dataframe itself holds a reference via cached .iloc/.loc
-            #    accessors.
+            # 2. A dataframe result holds a reference to itself via cached
+            #    .iloc/.loc accessors.
             # 3. The traceback held in sys.exc_info includes stack frames in
             #    which self._pipeline_cache is a local variable.
 
@@ -2500,9 +2501,20 @@ class TradingAlgorithm(object):
             )
             self._pipeline_cache = CachedObject(data, valid_until)
 
-        # Now that we have a cached result, try to return the data for today.
+        # Now that we have a cached result, return the data for today.
+        return self._pipeline_output_for_session(data, today)
+
+    @staticmethod
+    def _pipeline_output_for_session(data, session):
+        """
+        The rows of ``session`` in a result of ``_run_pipeline``.
+        """
+        if isinstance(data, ColumnarResults):
+            # Only the rows of the session are converted into a DataFrame.
+            return data.for_session(session)
+
         try:
-            return data.loc[today]
+            return data.loc[session]
         except KeyError:
             # This happens if no assets passed the pipeline screen on a given
             # day.
@@ -2520,11 +2532,13 @@ class TradingAlgorithm(object):
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        (data, valid_until) : tuple (ColumnarResults or pd.DataFrame,
+                                     pd.Timestamp)
 
         See Also
         --------
         PipelineEngine.run_pipeline
+        SimplePipelineEngine.run_columnar_pipeline
         """
         sessions = self.trading_calendar.all_sessions
 
@@ -2543,9 +2557,23 @@ class TradingAlgorithm(object):
         end_session = sessions[end_loc]
 
         return \
-            self.engine.run_pipeline(pipeline, start_session, end_session), \
+            self._compute_pipeline(pipeline, start_session, end_session), \
             end_session
 
+    def _compute_pipeline(self, pipeline, start_session, end_session):
+        """
+        Compute `pipeline` with the columnar output of the engine, or with
+        ``run_pipeline`` for engines which only implement ``run_pipeline``.
+        """
+        run_columnar_pipeline = getattr(
+            self.engine, 'run_columnar_pipeline', None,
+        )
+        if run_columnar_pipeline is None:
+            return self.engine.run_pipeline(
+                pipeline, start_session, end_session,
+            )
+        return run_columnar_pipeline(pipeline, start_session, end_session)
+
     ##################
     # End Pipeline API
     ##################
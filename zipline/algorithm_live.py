@@ -14,19 +14,23 @@ from datetime import time
 import os.path
 import logbook
 import pandas as pd
+from pandas.tseries.tools import normalize_date
 
 from zipline.finance.blotter_live import BlotterLive
 from zipline.algorithm import TradingAlgorithm
 from zipline.gens.realtimeclock import RealtimeClock
 from zipline.gens.tradesimulation import AlgorithmSimulator
+from zipline.pipeline.engine import SimplePipelineEngine
 from zipline.errors import ScheduleFunctionOutsideTradingStart
 from zipline.utils.api_support import (
     ZiplineAPI,
     api_method,
     allowed_only_in_before_trading_start)
 
+from zipline.utils.cache import Expired
 from zipline.utils.calendars.trading_calendar import days_at_time
-from zipline.utils.serialization_utils import load_context, store_context
+from zipline.utils.serialization_utils import (load_context,
+                                               ContextCheckpointer)
 
 log = logbook.Logger("Live Trading")
 
@@ -44,7 +48,10 @@ class LiveTradingAlgorithm(TradingAlgorithm):
         self.algo_filename = kwargs.get('algo_filename', "<algorithm>")
         self.state_filename = kwargs.pop('state_filename', None)
         self.realtime_bar_target = kwargs.pop('realtime_bar_target', None)
+        self.checkpoint_in_background = kwargs.pop('checkpoint_in_background',
+                                                   False)
         self._context_persistence_excludes = []
+        self._checkpointer = None
 
         if 'blotter' not in kwargs:
             blotter_live = BlotterLive(
@@ -59,6 +66,11 @@ class LiveTradingAlgorithm(TradingAlgorithm):
     def initialize(self, *args, **kwargs):
         self._context_persistence_excludes = (list(self.__dict__.keys()) +
                                               ['trading_client'])
+        self._checkpointer = ContextCheckpointer(
+            self.state_filename,
+            checksum=self.algo_filename,
+            exclude_list=self._context_persistence_excludes,
+            background=self.checkpoint_in_background)
 
         if os.path.isfile(self.state_filename):
             log.info("Loading state from {}".format(self.state_filename))
@@ -69,17 +81,61 @@ class LiveTradingAlgorithm(TradingAlgorithm):
 
         with ZiplineAPI(self):
             super(self.__class__, self).initialize(*args, **kwargs)
-            store_context(self.state_filename,
-                          context=self,
-                          checksum=self.algo_filename,
-                          exclude_list=self._context_persistence_excludes)
+            self._store_context()
+
+    def _store_context(self):
+        self._checkpointer.store(self)
+        log.debug("Checkpoint: {} field(s) stored in {:.1f} ms".format(
+            len(self._checkpointer.last_changed_fields),
+            self._checkpointer.last_cost * 1000))
+
+    def init_engine(self, get_loader):
+        # Pipelines are computed one session per day in live trading, so the
+        # engine keeps the loaded windows and advances them by the new
+        # session instead of reloading the lookback of every term.
+        if get_loader is not None:
+            self.engine = SimplePipelineEngine(
+                get_loader,
+                self.trading_calendar.all_sessions,
+                self.asset_finder,
+                incremental=True,
+            )
+        else:
+            super(self.__class__, self).init_engine(get_loader)
+
+    def _run_pipeline(self, pipeline, start_session, chunksize):
+        # The data of the sessions after today is not available yet, so only
+        # today's session is computed.
+        return (
+            self._compute_pipeline(pipeline, start_session, start_session),
+            start_session,
+        )
+
+    def before_trading_start(self, data):
+        super(self.__class__, self).before_trading_start(data)
+        self._subscribe_to_universe()
+
+    def _subscribe_to_universe(self):
+        # Subscribe to the market data of the day's universe in one batch
+        # before the market opens, so the first handle_data() does not have
+        # to wait for the subscriptions one asset at a time.
+        assets = set(self.broker.positions)
+
+        today = normalize_date(self.get_datetime())
+        if self._pipeline_cache is not None:
+            try:
+                output = self._pipeline_cache.unwrap(today)
+                assets.update(
+                    self._pipeline_output_for_session(output, today).index)
+            except (Expired, KeyError):
+                pass
+
+        if assets:
+            self.broker.subscribe_to_market_data(list(assets))
 
     def handle_data(self, data):
         super(self.__class__, self).handle_data(data)
-        store_context(self.state_filename,
-                      context=self,
-                      checksum=self.algo_filename,
-                      exclude_list=self._context_persistence_excludes)
+        self._store_context()
 
     def _create_clock(self):
         # This method is taken from TradingAlgorithm.
@@ -185,6 +241,24 @@ class LiveTradingAlgorithm(TradingAlgorithm):
         # 2) Tool - 10,000 Days is brilliant!
 
         asset = super(self.__class__, self).symbol(symbol_str)
+        return self._tradeable_asset(asset)
+
+    @api_method
+    def symbols(self, *args):
+        # Resolves the symbols in one pass through the asset finder instead
+        # of one symbol() call per symbol. Used by the brokers to map the
+        # positions and orders to assets.
+        _lookup_date = self._symbol_lookup_date \
+            if self._symbol_lookup_date is not None \
+            else self.sim_params.end_session
+
+        assets = self.asset_finder.lookup_symbols(
+            [symbol_str.upper() for symbol_str in args],
+            as_of_date=_lookup_date)
+        return [self._tradeable_asset(asset) for asset in assets]
+
+    @staticmethod
+    def _tradeable_asset(asset):
         tradeable_asset = asset.to_dict()
         tradeable_asset['end_date'] = (pd.Timestamp('now', tz='UTC') +
                                        pd.Timedelta('10000 days'))
@@ -193,6 +267,8 @@ class LiveTradingAlgorithm(TradingAlgorithm):
 
     def run(self, *args, **kwargs):
         daily_stats = super(self.__class__, self).run(*args, **kwargs)
+        if self._checkpointer is not None:
+            self._checkpointer.flush()
         self.on_exit()
         return daily_stats
 
@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+from multiprocessing.pool import ThreadPool
+import os
+from threading import Lock
+
+import numpy as np
+import pandas as pd
 from six import with_metaclass
 
 
@@ -30,6 +36,69 @@ class NoDataAfterDate(NoDataOnDate):
     pass
 
 
+def empty_spot_values(count, field):
+    """
+    Allocate the output of ``get_values``: NaNs for OHLC, zeros for volume.
+    """
+    if field == 'volume':
+        return np.zeros(count, dtype=np.int64)
+    return np.full(count, np.nan)
+
+
+_read_pools = {}
+_read_pools_lock = Lock()
+_read_pools_pid = os.getpid()
+
+
+def _reset_read_pools():
+    """
+    Forget the read pools of the parent process in a forked child.
+
+    The threads of the pools do not survive a fork, and the lock may have
+    been held by one of the parent's threads, so both are replaced rather
+    than closed.
+    """
+    global _read_pools, _read_pools_lock, _read_pools_pid
+    _read_pools = {}
+    _read_pools_lock = Lock()
+    _read_pools_pid = os.getpid()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_read_pools)
+
+
+def read_pool(size):
+    """
+    Get the thread pool with ``size`` workers shared by the bar readers of
+    this process.
+
+    bcolz releases the GIL while blosc decompresses a chunk, so reading
+    several carrays from a pool of threads decompresses them concurrently.
+    """
+    if _read_pools_pid != os.getpid():
+        # Forked without ``os.register_at_fork``.
+        _reset_read_pools()
+
+    with _read_pools_lock:
+        try:
+            return _read_pools[size]
+        except KeyError:
+            pool = _read_pools[size] = ThreadPool(size)
+            return pool
+
+
+def map_reads(read_threads, func, items):
+    """
+    Apply ``func`` to each of ``items``, on ``read_threads`` threads when
+    more than one is requested, and return the results in order.
+    """
+    items = list(items)
+    if read_threads is None or read_threads < 2 or len(items) < 2:
+        return list(map(func, items))
+    return read_pool(read_threads).map(func, items)
+
+
 class BarReader(with_metaclass(ABCMeta, object)):
     @abstractproperty
     def data_frequency(self):
@@ -115,6 +184,42 @@ class BarReader(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of many assets at the given dt.
+
+        Parameters
+        ----------
+        sids : iterable of int
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLVC name for the desired data points.
+
+        Returns
+        -------
+        values : np.ndarray
+            The values of the assets at ``dt``, ``float64`` for OHLC with NaN
+            where there is no data, ``int64`` for 'volume' with 0 where there
+            is no data.
+
+        Notes
+        -----
+        The default implementation calls ``get_value`` for each asset.
+        Readers which can read many assets at once should override it.
+        """
+        out = empty_spot_values(len(sids), field)
+        for i, sid in enumerate(sids):
+            try:
+                value = self.get_value(sid, dt, field)
+            except NoDataOnDate:
+                continue
+            if field == 'volume' and np.isnan(value):
+                continue
+            out[i] = value
+        return out
+
     @abstractmethod
     def get_last_traded_dt(self, asset, dt):
         """
@@ -136,3 +241,32 @@ class BarReader(with_metaclass(ABCMeta, object)):
             dt as a vantage point.
         """
         pass
+
+    def get_last_traded_dts(self, assets, dt):
+        """
+        Get the latest dt on or before ``dt`` in which each of ``assets``
+        traded.
+
+        Parameters
+        ----------
+        assets : iterable of zipline.asset.Asset
+            The assets for which to get the last traded dts.
+        dt : pd.Timestamp
+            The dt at which to start searching for the last traded dts.
+
+        Returns
+        -------
+        last_traded : pd.DatetimeIndex
+            The dt of the last trade of each asset, or NaT for the assets
+            with no trades on or before ``dt``.
+
+        Notes
+        -----
+        The default implementation calls ``get_last_traded_dt`` for each
+        asset. Readers which can search many assets at once should override
+        it.
+        """
+        return pd.DatetimeIndex(
+            [self.get_last_traded_dt(asset, dt) for asset in assets],
+            tz='UTC',
+        )
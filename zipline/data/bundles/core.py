@@ -2,6 +2,7 @@ from collections import namedtuple
 import errno
 import os
 import shutil
+from tempfile import mkdtemp
 import warnings
 
 from contextlib2 import ExitStack
@@ -12,12 +13,16 @@ from toolz import curry, complement, take
 from ..us_equity_pricing import (
     BcolzDailyBarReader,
     BcolzDailyBarWriter,
+    MemmapDailyBarReader,
     SQLiteAdjustmentReader,
     SQLiteAdjustmentWriter,
+    convert_bcolz_daily_bars_to_memmap,
 )
 from ..minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
+    MemmapMinuteBarReader,
+    convert_bcolz_minute_bars_to_memmap,
 )
 from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.assets.asset_db_migrations import downgrade
@@ -54,6 +59,13 @@ def daily_equity_path(bundle_name, timestr, environ=None):
     )
 
 
+def shared_data_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        shared_data_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
 def adjustment_db_path(bundle_name, timestr, environ=None):
     return pth.data_path(
         adjustment_db_relative(bundle_name, timestr, environ),
@@ -84,12 +96,63 @@ def minute_equity_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'minute_equities.bcolz'
 
 
+def shared_data_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'shared'
+
+
 def asset_db_relative(bundle_name, timestr, environ=None, db_version=None):
     db_version = ASSET_DB_VERSION if db_version is None else db_version
 
     return bundle_name, timestr, 'assets-%d.sqlite' % db_version
 
 
+SHARED_DAILY_EQUITIES = 'daily_equities'
+SHARED_MINUTE_EQUITIES = 'minute_equities'
+
+
+def ensure_shared_data(daily_path, minute_path, shared_path):
+    """Decompress the daily and minute bars of an ingestion to the
+    memory-mapped formats, unless this was already done.
+
+    Parameters
+    ----------
+    daily_path : str
+        The rootdir of the daily bcolz table.
+    minute_path : str
+        The rootdir of the bcolz minute bars.
+    shared_path : str
+        The directory to write the memory-mapped bars to.
+
+    Notes
+    -----
+    The bars are written to a temporary directory which is renamed to
+    ``shared_path`` once complete, so concurrent callers never read a partial
+    conversion; if several processes race, the first rename wins and the
+    other copies are discarded.
+    """
+    if os.path.isdir(shared_path):
+        return
+
+    tmp = mkdtemp(prefix='.shared-', dir=os.path.dirname(shared_path))
+    try:
+        convert_bcolz_daily_bars_to_memmap(
+            daily_path,
+            os.path.join(tmp, SHARED_DAILY_EQUITIES),
+        )
+        convert_bcolz_minute_bars_to_memmap(
+            minute_path,
+            os.path.join(tmp, SHARED_MINUTE_EQUITIES),
+        )
+        try:
+            os.rename(tmp, shared_path)
+        except OSError as e:
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                raise
+    finally:
+        if os.path.isdir(tmp):
+            shutil.rmtree(tmp)
+
+
 def to_bundle_ingest_dirname(ts):
     """Convert a pandas Timestamp into the name of the directory for the
     ingestion.
@@ -498,7 +561,7 @@ def _make_bundle_core():
                 ),
             )
 
-    def load(name, environ=os.environ, timestamp=None):
+    def load(name, environ=os.environ, timestamp=None, shared=False):
         """Loads a previously ingested bundle.
 
         Parameters
@@ -510,25 +573,50 @@ def _make_bundle_core():
         timestamp : datetime, optional
             The timestamp of the data to lookup.
             Defaults to the current time.
+        shared : bool, optional
+            Read the bars from uncompressed, memory-mapped copies of the
+            ingested bcolz data instead of decompressing them in this
+            process. The copies are written next to the ingestion by the
+            first shared load and reused afterwards, so the processes of a
+            parameter sweep all read one copy of the decoded bars from the
+            page cache. Defaults to False.
 
         Returns
         -------
         bundle_data : BundleData
             The raw data readers for this bundle.
+
+        Notes
+        -----
+        When loading a bundle with ``shared=True`` from a pool of workers,
+        load it once in the parent process first so the conversion does not
+        run in every worker.
         """
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+        daily_path = daily_equity_path(name, timestr, environ=environ)
+        minute_path = minute_equity_path(name, timestr, environ=environ)
+        if shared:
+            shared_path = shared_data_path(name, timestr, environ=environ)
+            ensure_shared_data(daily_path, minute_path, shared_path)
+            minute_reader = MemmapMinuteBarReader(
+                os.path.join(shared_path, SHARED_MINUTE_EQUITIES),
+            )
+            daily_reader = MemmapDailyBarReader(
+                daily_path,
+                os.path.join(shared_path, SHARED_DAILY_EQUITIES),
+            )
+        else:
+            minute_reader = BcolzMinuteBarReader(minute_path)
+            daily_reader = BcolzDailyBarReader(daily_path)
+
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
             ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
-                minute_equity_path(name, timestr, environ=environ),
-            ),
-            equity_daily_bar_reader=BcolzDailyBarReader(
-                daily_equity_path(name, timestr, environ=environ),
-            ),
+            equity_minute_bar_reader=minute_reader,
+            equity_daily_bar_reader=daily_reader,
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
             ),
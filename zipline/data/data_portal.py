@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from copy import copy
 from operator import mul
 
 from logbook import Logger
@@ -52,7 +53,9 @@ from zipline.data.resample import (
 from zipline.data.history_loader import (
     DailyHistoryLoader,
     MinuteHistoryLoader,
+    TradingMinuteIndex,
 )
+from zipline.data.bar_reader import empty_spot_values
 from zipline.data.us_equity_pricing import NoDataOnDate
 
 from zipline.utils.math_utils import (
@@ -61,7 +64,6 @@ from zipline.utils.math_utils import (
     nanstd
 )
 from zipline.utils.memoize import remember_last, weak_lru_cache
-from zipline.utils.pandas_utils import timedelta_to_integral_minutes
 from zipline.errors import (
     NoTradeDataAvailableTooEarly,
     NoTradeDataAvailableTooLate,
@@ -99,6 +101,18 @@ _DEF_M_HIST_PREFETCH = DEFAULT_MINUTE_HISTORY_PREFETCH
 _DEF_D_HIST_PREFETCH = DEFAULT_DAILY_HISTORY_PREFETCH
 
 
+def _with_read_threads(reader, read_threads):
+    """
+    A shallow copy of ``reader`` which reads on ``read_threads`` threads, or
+    ``reader`` itself if it does not support reading on threads.
+    """
+    if not hasattr(reader, 'read_threads'):
+        return reader
+    reader = copy(reader)
+    reader.read_threads = read_threads
+    return reader
+
+
 class DataPortal(object):
     """Interface to all of the data that a zipline simulation needs.
 
@@ -139,6 +153,22 @@ class DataPortal(object):
         The last session to make available in session-level data.
     last_available_minute : pd.Timestamp, optional
         The last minute to make available in minute-level data.
+    minute_history_prefetch_length : int, optional
+        The number of minutes loaded after the end of a minute history window,
+        to serve the following history calls.
+    daily_history_prefetch_length : int, optional
+        The number of sessions loaded after the end of a daily history window,
+        to serve the following history calls.
+    read_threads : int, optional
+        The number of threads the bar readers use to decompress the assets
+        and columns of a window concurrently. Overrides the ``read_threads``
+        of every reader which supports it, for this portal only: the readers
+        which are passed in are not modified. By default the readers keep
+        their own setting.
+    adaptive_minute_history_prefetch : bool, optional
+        Grow the minute history prefetch, up to four times
+        ``minute_history_prefetch_length``, while the history calls advance
+        minute by minute. See ``history_prefetch_stats`` for its hit rates.
     """
     def __init__(self,
                  asset_finder,
@@ -152,7 +182,9 @@ class DataPortal(object):
                  last_available_session=None,
                  last_available_minute=None,
                  minute_history_prefetch_length=_DEF_M_HIST_PREFETCH,
-                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH):
+                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH,
+                 read_threads=None,
+                 adaptive_minute_history_prefetch=False):
 
         self.trading_calendar = trading_calendar
         self.asset_finder = asset_finder
@@ -202,6 +234,18 @@ class DataPortal(object):
             else:
                 self._last_available_minute = None
 
+        if read_threads is not None:
+            # The readers may be shared with other portals, so read through
+            # copies of them which use ``read_threads``.
+            equity_daily_reader = _with_read_threads(
+                equity_daily_reader, read_threads)
+            equity_minute_reader = _with_read_threads(
+                equity_minute_reader, read_threads)
+            future_daily_reader = _with_read_threads(
+                future_daily_reader, read_threads)
+            future_minute_reader = _with_read_threads(
+                future_minute_reader, read_threads)
+
         aligned_equity_minute_reader = self._ensure_reader_aligned(
             equity_minute_reader)
         aligned_equity_session_reader = self._ensure_reader_aligned(
@@ -277,6 +321,7 @@ class DataPortal(object):
             self._roll_finders,
             prefetch_length=daily_history_prefetch_length,
         )
+        self._minute_index = TradingMinuteIndex(self.trading_calendar)
         self._minute_history_loader = MinuteHistoryLoader(
             self.trading_calendar,
             _dispatch_minute_reader,
@@ -284,6 +329,8 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=minute_history_prefetch_length,
+            adaptive_prefetch=adaptive_minute_history_prefetch,
+            minute_index=self._minute_index,
         )
 
         self._first_trading_day = first_trading_day
@@ -420,6 +467,15 @@ class DataPortal(object):
         return self._get_pricing_reader(data_frequency).get_last_traded_dt(
             asset, dt)
 
+    def get_last_traded_dts(self, assets, dt, data_frequency):
+        """
+        Given assets and a dt, returns the last traded dt of each asset from
+        the viewpoint of the given dt, with NaT for the assets that did not
+        trade on or before dt.
+        """
+        return self._get_pricing_reader(data_frequency).get_last_traded_dts(
+            list(assets), dt)
+
     @staticmethod
     def _is_extra_source(asset, field, map):
         """
@@ -483,51 +539,139 @@ class DataPortal(object):
                     .format(type(assets))
                 )
 
+        if assets_is_scalar:
+            session_label = self.trading_calendar.minute_to_session_label(dt)
+            return self._get_single_asset_value(
+                session_label, assets, field, dt, data_frequency,
+            )
+        else:
+            return self.get_spot_values(
+                assets, field, dt, data_frequency,
+            ).tolist()
+
+    def get_spot_values(self, assets, field, dt, data_frequency):
+        """
+        Public API method that returns the values of the desired field of many
+        assets at the given dt.
+
+        OHLCV and 'price' values of assets are read in one batch from the
+        pricing readers; any other field is read asset by asset.
+
+        Parameters
+        ----------
+        assets : iterable of Asset or ContinuousFuture
+            The assets whose data is desired.
+        field : {'open', 'high', 'low', 'close', 'volume',
+                 'price', 'last_traded'}
+            The desired field of the assets.
+        dt : pd.Timestamp
+            The timestamp for the desired values.
+        data_frequency : str
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars
+
+        Returns
+        -------
+        values : np.ndarray
+            The spot values of ``field`` for ``assets``, in the order of
+            ``assets``. See ``get_spot_value`` for the value of each asset.
+        """
+        assets = list(assets)
         session_label = self.trading_calendar.minute_to_session_label(dt)
 
-        def get_single_asset_value(asset):
-            if self._is_extra_source(
-                    asset, field, self._augmented_sources_map):
-                return self._get_fetcher_value(asset, field, dt)
+        if field in OHLCVP_FIELDS and not any(
+                self._is_extra_source(asset, field,
+                                      self._augmented_sources_map)
+                for asset in assets):
+            return self._get_spot_values_batch(
+                session_label, assets, field, dt, data_frequency,
+            )
 
-            if field not in BASE_FIELDS:
-                raise KeyError("Invalid column: " + str(field))
+        return np.array([
+            self._get_single_asset_value(
+                session_label, asset, field, dt, data_frequency,
+            )
+            for asset in assets
+        ])
 
-            if dt < asset.start_date or \
-                    (data_frequency == "daily" and
-                        session_label > asset.end_date) or \
-                    (data_frequency == "minute" and
-                     session_label > asset.end_date):
-                if field == "volume":
-                    return 0
-                elif field == "contract":
-                    return None
-                elif field != "last_traded":
-                    return np.NaN
-
-            if data_frequency == "daily":
-                if field == "contract":
-                    return self._get_current_contract(asset, session_label)
-                else:
-                    return self._get_daily_spot_value(
-                        asset, field, session_label,
-                    )
-            else:
-                if field == "last_traded":
-                    return self.get_last_traded_dt(asset, dt, 'minute')
-                elif field == "price":
-                    return self._get_minute_spot_value(
-                        asset, "close", dt, ffill=True,
-                    )
-                elif field == "contract":
-                    return self._get_current_contract(asset, dt)
-                else:
-                    return self._get_minute_spot_value(asset, field, dt)
+    def _get_spot_values_batch(self,
+                               session_label,
+                               assets,
+                               field,
+                               dt,
+                               data_frequency):
+        out = empty_spot_values(len(assets), field)
+        if not assets:
+            return out
+
+        start_dates = np.array([asset.start_date.value for asset in assets])
+        end_dates = np.array([asset.end_date.value for asset in assets])
+        alive = np.flatnonzero(
+            (start_dates <= dt.value) & (end_dates >= session_label.value)
+        )
+        if not len(alive):
+            return out
 
-        if assets_is_scalar:
-            return get_single_asset_value(assets)
+        column = 'close' if field == 'price' else field
+        query_dt = session_label if data_frequency == 'daily' else dt
+        values = self._get_pricing_reader(data_frequency).get_values(
+            [assets[i].sid for i in alive], query_dt, column,
+        )
+        out[alive] = values
+
+        if field == 'price':
+            # The assets which did not trade at dt are forward filled, and
+            # adjusted if the last trade is on an earlier session.
+            for i in alive[np.isnan(values)]:
+                out[i] = self._get_single_asset_value(
+                    session_label, assets[i], field, dt, data_frequency,
+                )
+
+        return out
+
+    def _get_single_asset_value(self,
+                                session_label,
+                                asset,
+                                field,
+                                dt,
+                                data_frequency):
+        if self._is_extra_source(
+                asset, field, self._augmented_sources_map):
+            return self._get_fetcher_value(asset, field, dt)
+
+        if field not in BASE_FIELDS:
+            raise KeyError("Invalid column: " + str(field))
+
+        if dt < asset.start_date or \
+                (data_frequency == "daily" and
+                    session_label > asset.end_date) or \
+                (data_frequency == "minute" and
+                 session_label > asset.end_date):
+            if field == "volume":
+                return 0
+            elif field == "contract":
+                return None
+            elif field != "last_traded":
+                return np.NaN
+
+        if data_frequency == "daily":
+            if field == "contract":
+                return self._get_current_contract(asset, session_label)
+            else:
+                return self._get_daily_spot_value(
+                    asset, field, session_label,
+                )
         else:
-            return list(map(get_single_asset_value, assets))
+            if field == "last_traded":
+                return self.get_last_traded_dt(asset, dt, 'minute')
+            elif field == "price":
+                return self._get_minute_spot_value(
+                    asset, "close", dt, ffill=True,
+                )
+            elif field == "contract":
+                return self._get_current_contract(asset, dt)
+            else:
+                return self._get_minute_spot_value(asset, field, dt)
 
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
@@ -648,6 +792,67 @@ class DataPortal(object):
 
         return spot_value
 
+    def get_adjusted_values(self, assets, field, dts,
+                            perspective_dt,
+                            data_frequency):
+        """
+        Returns the values of the desired field of many assets, each at its
+        own dt, with adjustments applied.
+
+        Parameters
+        ----------
+        assets : iterable of Asset
+            The assets whose data is desired.
+        field : {'open', 'high', 'low', 'close', 'volume', 'price'}
+            The desired field of the assets.
+        dts : pd.DatetimeIndex
+            The timestamp of the desired value of each asset. Assets with a
+            NaT timestamp get a NaN value.
+        perspective_dt : pd.Timestamp
+            The timestamp from which the data is being viewed back from.
+        data_frequency : str
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars
+
+        Returns
+        -------
+        values : np.ndarray[float64]
+            The value of ``field`` for each asset at its dt, with any
+            adjustments known by ``perspective_dt`` applied.
+        """
+        assets = list(assets)
+        dts = pd.DatetimeIndex(dts)
+        out = np.full(len(assets), nan)
+
+        # The assets which share a dt are read in one batch.
+        groups = {}
+        for i, (asset, dt) in enumerate(zip(assets, dts)):
+            if isnull(dt):
+                continue
+            if self._is_extra_source(asset, field,
+                                     self._augmented_sources_map):
+                out[i] = self.get_adjusted_value(
+                    asset, field, dt, perspective_dt, data_frequency,
+                )
+                continue
+            groups.setdefault(dt, []).append(i)
+
+        for dt, positions in iteritems(groups):
+            group = [assets[i] for i in positions]
+            values = self.get_spot_values(group, field, dt, data_frequency)
+            ratios = np.ones(len(group))
+            equities = [
+                j for j, asset in enumerate(group)
+                if isinstance(asset, Equity)
+            ]
+            if equities:
+                ratios[equities] = self.get_adjustments(
+                    [group[j] for j in equities], field, dt, perspective_dt,
+                )
+            out[positions] = values * ratios
+
+        return out
+
     def _get_minute_spot_value(self, asset, column, dt, ffill=False):
         reader = self._get_pricing_reader('minute')
 
@@ -762,56 +967,93 @@ class DataPortal(object):
             columns=assets
         )
 
+    def _get_history_daily_windows(self,
+                                   assets,
+                                   end_dt,
+                                   bar_count,
+                                   fields_to_use,
+                                   data_frequency):
+        """
+        Internal method that returns the sessions of a daily history window
+        and the history bars of each of the given fields.
+        """
+        session = self.trading_calendar.minute_to_session_label(end_dt)
+        days_for_window = self._get_days_for_window(session, bar_count)
+
+        if len(assets) == 0:
+            data = [
+                np.empty((len(days_for_window), 0))
+                for field in fields_to_use
+            ]
+        else:
+            data = self._get_history_daily_windows_data(
+                assets, days_for_window, end_dt, fields_to_use, data_frequency
+            )
+        return days_for_window, data
+
     def _get_history_daily_window_data(self,
                                        assets,
                                        days_for_window,
                                        end_dt,
                                        field_to_use,
                                        data_frequency):
+        return self._get_history_daily_windows_data(
+            assets, days_for_window, end_dt, [field_to_use], data_frequency
+        )[0]
+
+    def _get_history_daily_windows_data(self,
+                                        assets,
+                                        days_for_window,
+                                        end_dt,
+                                        fields_to_use,
+                                        data_frequency):
         if data_frequency == 'daily':
             # two cases where we use daily data for the whole range:
             # 1) the history window ends at midnight utc.
             # 2) the last desired day of the window is after the
             # last trading day, use daily data for the whole range.
-            return self._get_daily_window_data(
+            return self._get_daily_windows_data(
                 assets,
-                field_to_use,
+                fields_to_use,
                 days_for_window,
                 extra_slot=False
             )
         else:
             # minute mode, requesting '1d'
-            daily_data = self._get_daily_window_data(
+            daily_data = self._get_daily_windows_data(
                 assets,
-                field_to_use,
+                fields_to_use,
                 days_for_window[0:-1]
             )
 
-            if field_to_use == 'open':
-                minute_value = self._daily_aggregator.opens(
-                    assets, end_dt)
-            elif field_to_use == 'high':
-                minute_value = self._daily_aggregator.highs(
-                    assets, end_dt)
-            elif field_to_use == 'low':
-                minute_value = self._daily_aggregator.lows(
-                    assets, end_dt)
-            elif field_to_use == 'close':
-                minute_value = self._daily_aggregator.closes(
-                    assets, end_dt)
-            elif field_to_use == 'volume':
-                minute_value = self._daily_aggregator.volumes(
-                    assets, end_dt)
-            elif field_to_use == 'sid':
-                minute_value = [
-                    int(self._get_current_contract(asset, end_dt))
-                    for asset in assets]
-
-            # append the partial day.
-            daily_data[-1] = minute_value
+            for field_to_use, field_data in zip(fields_to_use, daily_data):
+                # append the partial day.
+                field_data[-1] = self._get_partial_day_values(
+                    assets, field_to_use, end_dt,
+                )
 
             return daily_data
 
+    def _get_partial_day_values(self, assets, field_to_use, end_dt):
+        """
+        Internal method that returns the values of the given field for the
+        session of ``end_dt``, up to ``end_dt``.
+        """
+        if field_to_use == 'open':
+            return self._daily_aggregator.opens(assets, end_dt)
+        elif field_to_use == 'high':
+            return self._daily_aggregator.highs(assets, end_dt)
+        elif field_to_use == 'low':
+            return self._daily_aggregator.lows(assets, end_dt)
+        elif field_to_use == 'close':
+            return self._daily_aggregator.closes(assets, end_dt)
+        elif field_to_use == 'volume':
+            return self._daily_aggregator.volumes(assets, end_dt)
+        elif field_to_use == 'sid':
+            return [
+                int(self._get_current_contract(asset, end_dt))
+                for asset in assets]
+
     def _handle_minute_history_out_of_bounds(self, bar_count):
         cal = self.trading_calendar
 
@@ -834,23 +1076,28 @@ class DataPortal(object):
             suggested_start_day=suggested_start_day.date(),
         )
 
-    def _get_history_minute_window(self, assets, end_dt, bar_count,
-                                   field_to_use):
+    def _get_minutes_for_window(self, end_dt, bar_count):
         """
-        Internal method that returns a dataframe containing history bars
-        of minute frequency for the given sids.
+        Internal method that returns the minutes of a minute history window.
         """
-        # get all the minutes for this window
         try:
-            minutes_for_window = self.trading_calendar.minutes_window(
-                end_dt, -bar_count
-            )
+            minutes_for_window = self._minute_index.window(end_dt, bar_count)
         except KeyError:
             self._handle_minute_history_out_of_bounds(bar_count)
 
         if minutes_for_window[0] < self._first_trading_minute:
             self._handle_minute_history_out_of_bounds(bar_count)
 
+        return minutes_for_window
+
+    def _get_history_minute_window(self, assets, end_dt, bar_count,
+                                   field_to_use):
+        """
+        Internal method that returns a dataframe containing history bars
+        of minute frequency for the given sids.
+        """
+        minutes_for_window = self._get_minutes_for_window(end_dt, bar_count)
+
         asset_minute_data = self._get_minute_window_data(
             assets,
             field_to_use,
@@ -923,54 +1170,152 @@ class DataPortal(object):
 
         # forward-fill price
         if ffill and field == "price":
-            if frequency == "1m":
-                data_frequency = 'minute'
-            elif frequency == "1d":
-                data_frequency = 'daily'
-            else:
-                raise Exception(
-                    "Only 1d and 1m are supported for forward-filling.")
-
-            assets_with_leading_nan = np.where(isnull(df.iloc[0]))[0]
-
-            history_start, history_end = df.index[[0, -1]]
-            initial_values = []
-            for asset in df.columns[assets_with_leading_nan]:
-                last_traded = self.get_last_traded_dt(
-                    asset,
-                    history_start,
-                    data_frequency,
+            df = self._ffill_price_window(df, frequency)
+        return df
+
+    def get_history_windows(self,
+                            assets,
+                            end_dt,
+                            bar_count,
+                            frequency,
+                            fields,
+                            data_frequency,
+                            ffill=True):
+        """
+        Public API method that returns a panel containing the requested
+        history windows of several fields.  Data is fully adjusted.
+
+        The window is resolved once and the bars of all of the fields are
+        read together, instead of once per field as with
+        ``get_history_window``.
+
+        Parameters
+        ----------
+        assets : list of zipline.data.Asset objects
+            The assets whose data is desired.
+
+        bar_count: int
+            The number of bars desired.
+
+        frequency: string
+            "1d" or "1m"
+
+        fields: iterable of string
+            The desired fields of the assets.
+
+        data_frequency: string
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars.
+
+        ffill: boolean
+            Forward-fill missing values. Only has effect on the 'price'
+            field.
+
+        Returns
+        -------
+        A panel with the fields as items, the dts as the major axis and the
+        assets as the minor axis, where each item is the dataframe returned by
+        ``get_history_window`` for that field.
+        """
+        fields = list(fields)
+        for field in fields:
+            if field not in OHLCVP_FIELDS and field != 'sid':
+                raise ValueError("Invalid field: {0}".format(field))
+
+        fields_to_use = sorted(
+            set('close' if field == 'price' else field for field in fields)
+        )
+
+        if frequency == "1d":
+            index, data = self._get_history_daily_windows(
+                assets, end_dt, bar_count, fields_to_use, data_frequency,
+            )
+        elif frequency == "1m":
+            index = self._get_minutes_for_window(end_dt, bar_count)
+            data = self._minute_history_loader.history_fields(
+                assets, index, fields_to_use, False,
+            )
+        else:
+            raise ValueError("Invalid frequency: {0}".format(frequency))
+
+        data = dict(zip(fields_to_use, data))
+        frames = {}
+        for field in fields:
+            if field == "price":
+                # The closes may be requested as well, so fill a copy.
+                df = pd.DataFrame(
+                    data["close"],
+                    index=index,
+                    columns=assets,
+                    copy=True,
                 )
-                if isnull(last_traded):
-                    initial_values.append(nan)
-                else:
-                    initial_values.append(
-                        self.get_adjusted_value(
-                            asset,
-                            field,
-                            dt=last_traded,
-                            perspective_dt=history_end,
-                            data_frequency=data_frequency,
-                        )
-                    )
+                if ffill:
+                    df = self._ffill_price_window(df, frequency)
+            else:
+                df = pd.DataFrame(data[field], index=index, columns=assets)
+            frames[field] = df
+
+        return pd.Panel(frames)
 
-            # Set leading values for assets that were missing data, then ffill.
-            df.ix[0, assets_with_leading_nan] = np.array(
-                initial_values,
-                dtype=np.float64
+    def _ffill_price_window(self, df, frequency):
+        """
+        Forward-fill a history window of prices, seeding assets which have no
+        price at the start of the window with their last traded price.
+        """
+        if frequency == "1m":
+            data_frequency = 'minute'
+        elif frequency == "1d":
+            data_frequency = 'daily'
+        else:
+            raise Exception(
+                "Only 1d and 1m are supported for forward-filling.")
+
+        assets_with_leading_nan = np.where(isnull(df.iloc[0]))[0]
+
+        history_start, history_end = df.index[[0, -1]]
+        if len(assets_with_leading_nan):
+            leading_nan_assets = df.columns[assets_with_leading_nan]
+            last_traded = self.get_last_traded_dts(
+                leading_nan_assets,
+                history_start,
+                data_frequency,
             )
-            df.fillna(method='ffill', inplace=True)
-
-            # forward-filling will incorrectly produce values after the end of
-            # an asset's lifetime, so write NaNs back over the asset's
-            # end_date.
-            normed_index = df.index.normalize()
-            for asset in df.columns:
-                if history_end >= asset.end_date:
-                    # if the window extends past the asset's end date, set
-                    # all post-end-date values to NaN in that asset's series
-                    df.loc[normed_index > asset.end_date, asset] = nan
-        return df
+            initial_values = self.get_adjusted_values(
+                leading_nan_assets,
+                "price",
+                last_traded,
+                perspective_dt=history_end,
+                data_frequency=data_frequency,
+            )
+
+            # Set leading values for assets that were missing data.
+            df.ix[0, assets_with_leading_nan] = initial_values
+        df.fillna(method='ffill', inplace=True)
+
+        # forward-filling will incorrectly produce values after the end of
+        # an asset's lifetime, so write NaNs back over the asset's
+        # end_date.
+        end_dates = np.array(
+            [asset.end_date.value for asset in df.columns],
+            dtype=int64,
+        )
+        normed_index = df.index.normalize().asi8
+        return df.mask(normed_index[:, np.newaxis] > end_dates)
+
+    def history_prefetch_stats(self):
+        """
+        The statistics of the sliding history windows of each frequency.
+
+        Returns
+        -------
+        stats : dict[str -> dict]
+            The ``HistoryLoader.prefetch_stats`` of the 'minute' and 'daily'
+            history windows.
+        """
+        return {
+            'minute': self._minute_history_loader.prefetch_stats(),
+            'daily': self._history_loader.prefetch_stats(),
+        }
 
     def _get_minute_window_data(self, assets, field, minutes_for_window):
         """
@@ -1036,29 +1381,58 @@ class DataPortal(object):
         A numpy array with requested values.  Any missing slots filled with
         nan.
 
+        """
+        return self._get_daily_windows_data(
+            assets,
+            [field],
+            days_in_window,
+            extra_slot,
+        )[0]
+
+    def _get_daily_windows_data(self,
+                                assets,
+                                fields,
+                                days_in_window,
+                                extra_slot=True):
+        """
+        Internal method that gets windows of adjusted daily data for several
+        fields, reading the bars of all of the fields together.
+
+        See ``_get_daily_window_data`` for the parameters.
+
+        Returns
+        -------
+        A list of numpy arrays with the requested values of each field.
         """
         bar_count = len(days_in_window)
-        # create an np.array of size bar_count
-        dtype = float64 if field != 'sid' else int64
         if extra_slot:
-            return_array = np.zeros((bar_count + 1, len(assets)), dtype=dtype)
+            shape = (bar_count + 1, len(assets))
         else:
-            return_array = np.zeros((bar_count, len(assets)), dtype=dtype)
+            shape = (bar_count, len(assets))
 
-        if field != "volume":
-            # volumes default to 0, so we don't need to put NaNs in the array
-            return_array[:] = np.NAN
+        out = []
+        for field in fields:
+            # create an np.array of size bar_count
+            dtype = float64 if field != 'sid' else int64
+            return_array = np.zeros(shape, dtype=dtype)
+
+            if field != "volume":
+                # volumes default to 0, so we don't need to put NaNs in the
+                # array
+                return_array[:] = np.NAN
+            out.append(return_array)
 
         if bar_count != 0:
-            data = self._history_loader.history(assets,
-                                                days_in_window,
-                                                field,
-                                                extra_slot)
-            if extra_slot:
-                return_array[:len(return_array) - 1, :] = data
-            else:
-                return_array[:len(data)] = data
-        return return_array
+            data = self._history_loader.history_fields(assets,
+                                                       days_in_window,
+                                                       fields,
+                                                       extra_slot)
+            for return_array, field_data in zip(out, data):
+                if extra_slot:
+                    return_array[:len(return_array) - 1, :] = field_data
+                else:
+                    return_array[:len(field_data)] = field_data
+        return out
 
     def _get_adjustment_list(self, asset, adjustments_dict, table_name):
         """
@@ -1252,59 +1626,30 @@ class DataPortal(object):
     # handle deprecated API.
     @weak_lru_cache(20)
     def _get_minute_count_for_transform(self, ending_minute, days_count):
-        # This function works in three steps.
-        # Step 1. Count the minutes from ``ending_minute`` to the start of its
-        #         session.
-        # Step 2. Count the minutes from the prior ``days_count - 1`` sessions.
-        # Step 3. Return the sum of the results from steps (1) and (2).
+        # Count the minutes from the start of the session ``days_count - 1``
+        # sessions before the session of ``ending_minute`` through
+        # ``ending_minute``.
 
         # Example (NYSE Calendar)
         #     ending_minute = 2016-12-28 9:40 AM US/Eastern
         #     days_count = 3
-        # Step 1. Calculate that there are 10 minutes in the ending session.
-        # Step 2. Calculate that there are 390 + 210 = 600 minutes in the prior
-        #         two sessions. (Prior sessions are 2015-12-23 and 2015-12-24.)
-        #         2015-12-24 is a half day.
-        # Step 3. Return 600 + 10 = 610.
-
-        cal = self.trading_calendar
+        # There are 10 minutes in the ending session, and 390 + 210 = 600
+        # minutes in the prior two sessions. (Prior sessions are 2015-12-23
+        # and 2015-12-24.) 2015-12-24 is a half day. The result is 610.
 
-        ending_session = cal.minute_to_session_label(
-            ending_minute,
-            direction="none",  # It's an error to pass a non-trading minute.
-        )
-
-        # Assume that calendar days are always full of contiguous minutes,
-        # which means we can just take 1 + (number of minutes between the last
-        # minute and the start of the session). We add one so that we include
-        # the ending minute in the total.
-        ending_session_minute_count = timedelta_to_integral_minutes(
-            ending_minute - cal.open_and_close_for_session(ending_session)[0]
-        ) + 1
-
-        if days_count == 1:
-            # We just need sessions for the active day.
-            return ending_session_minute_count
-
-        # XXX: We're subtracting 2 here to account for two offsets:
-        # 1. We only want ``days_count - 1`` sessions, since we've already
-        #    accounted for the ending session above.
-        # 2. The API of ``sessions_window`` is to return one more session than
-        #    the requested number.  I don't think any consumers actually want
-        #    that behavior, but it's the tested and documented behavior right
-        #    now, so we have to request one less session than we actually want.
-        completed_sessions = cal.sessions_window(
-            cal.previous_session_label(ending_session),
-            2 - days_count,
-        )
-
-        completed_sessions_minute_count = (
-            self.trading_calendar.minutes_count_for_sessions_in_range(
-                completed_sessions[0],
-                completed_sessions[-1]
+        # Calendar days are always full of contiguous minutes, so this is the
+        # distance between two positions in the trading minutes.
+        try:
+            return self._minute_index.minutes_since_session_start(
+                ending_minute, days_count,
             )
-        )
-        return ending_session_minute_count + completed_sessions_minute_count
+        except KeyError:
+            # It's an error to pass a non-trading minute.
+            self.trading_calendar.minute_to_session_label(
+                ending_minute,
+                direction="none",
+            )
+            raise
 
     def get_simple_transform(self, asset, transform_name, dt, data_frequency,
                              bars=None):
@@ -11,6 +11,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+import pandas as pd
+
 from zipline.data.data_portal import DataPortal
 
 from logbook import Logger
@@ -26,9 +29,25 @@ class DataPortalLive(DataPortal):
     def get_last_traded_dt(self, asset, dt, data_frequency):
         return self.broker.get_last_traded_dt(asset)
 
+    def get_last_traded_dts(self, assets, dt, data_frequency):
+        return pd.DatetimeIndex(
+            [self.broker.get_last_traded_dt(asset) for asset in assets],
+            tz='UTC',
+        )
+
     def get_spot_value(self, assets, field, dt, data_frequency):
         return self.broker.get_spot_value(assets, field, dt, data_frequency)
 
+    def get_spot_values(self, assets, field, dt, data_frequency):
+        if self.broker.batch_spot_values:
+            return np.array(self.broker.get_spot_value(
+                list(assets), field, dt, data_frequency,
+            ))
+        return np.array([
+            self.broker.get_spot_value(asset, field, dt, data_frequency)
+            for asset in assets
+        ])
+
     def get_history_window(self,
                            assets,
                            end_dt,
@@ -53,14 +72,44 @@ class DataPortalLive(DataPortal):
             assets, end_dt, bar_count, frequency, field, data_frequency,
             ffill=False)
 
+        realtime_bars = self._get_realtime_bars(assets, frequency, bar_count)
+
+        return self._combine_bars(
+            historical_bars, realtime_bars, field, bar_count, ffill)
+
+    def get_history_windows(self,
+                            assets,
+                            end_dt,
+                            bar_count,
+                            frequency,
+                            fields,
+                            data_frequency,
+                            ffill=True):
+        # Same as get_history_window(), for each of the fields. The real-time
+        # bars are requested from the Broker once for all of the fields.
+        historical_bars = super(DataPortalLive, self).get_history_windows(
+            assets, end_dt, bar_count, frequency, fields, data_frequency,
+            ffill=False)
+
+        realtime_bars = self._get_realtime_bars(assets, frequency, bar_count)
+
+        return pd.Panel({
+            field: self._combine_bars(
+                historical_bars[field], realtime_bars, field, bar_count, ffill)
+            for field in historical_bars.items
+        })
+
+    def _get_realtime_bars(self, assets, frequency, bar_count):
         realtime_bars = self.broker.get_realtime_bars(
-            assets, frequency)
+            assets, frequency, bar_count=bar_count)
 
         # Broker.get_realtime_history() returns the asset as level 0 column,
         # open, high, low, close, volume returned as level 1 columns.
         # To filter for field the levels needs to be swapped
-        realtime_bars = realtime_bars.swaplevel(0, 1, axis=1)
+        return realtime_bars.swaplevel(0, 1, axis=1)
 
+    def _combine_bars(self, historical_bars, realtime_bars, field, bar_count,
+                      ffill):
         ohlcv_field = 'close' if field == 'price' else field
 
         # TODO: end_dt is ignored when historical & realtime bars are merged.
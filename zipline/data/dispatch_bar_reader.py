@@ -20,8 +20,11 @@ from numpy import (
     int64,
     zeros
 )
+from pandas import DatetimeIndex
+from pandas.tslib import iNaT
 from six import iteritems, with_metaclass
 
+from zipline.data.bar_reader import empty_spot_values
 from zipline.utils.memoize import lazyval
 
 
@@ -96,10 +99,42 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_value(asset, dt, field)
 
+    def get_values(self, sids, dt, field):
+        out = empty_spot_values(len(sids), field)
+        sid_groups = {}
+        out_pos = {}
+
+        for i, asset in enumerate(self._asset_finder.retrieve_all(sids)):
+            t = type(asset)
+            sid_groups.setdefault(t, []).append(asset)
+            out_pos.setdefault(t, []).append(i)
+
+        for t, assets in iteritems(sid_groups):
+            out[out_pos[t]] = self._readers[t].get_values(assets, dt, field)
+
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
 
+    def get_last_traded_dts(self, assets, dt):
+        out = full(len(assets), iNaT, dtype=int64)
+        asset_groups = {}
+        out_pos = {}
+
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            asset_groups.setdefault(t, []).append(asset)
+            out_pos.setdefault(t, []).append(i)
+
+        for t, group in iteritems(asset_groups):
+            out[out_pos[t]] = self._readers[t].get_last_traded_dts(
+                group, dt,
+            ).asi8
+
+        return DatetimeIndex(out, tz='UTC')
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         asset_types = self._asset_types
         sid_groups = {t: [] for t in asset_types}
@@ -17,14 +17,15 @@ from abc import (
     abstractmethod,
     abstractproperty,
 )
+from collections import OrderedDict
 
-from numpy import concatenate
+from numpy import concatenate, nan
 from lru import LRU
 from pandas import isnull
 from pandas.tslib import normalize_date
 from toolz import sliding_window
 
-from six import with_metaclass
+from six import iteritems, with_metaclass
 
 from zipline.assets import Equity, Future
 from zipline.assets.continuous_futures import ContinuousFuture
@@ -294,6 +295,126 @@ class SlidingWindow(object):
         return self.current
 
 
+class TradingMinuteIndex(object):
+    """
+    The positions of the trading minutes of a calendar.
+
+    Looking up a minute is a binary search over the minutes of the whole
+    calendar; the position of the last minute looked up is kept, as is the
+    index of the recent windows, so the history calls made on the same bar
+    share a single lookup and a single ``DatetimeIndex``.
+
+    Parameters
+    ----------
+    trading_calendar : TradingCalendar
+        The calendar whose ``all_minutes`` are indexed. They are only
+        computed on the first lookup.
+    window_cache_size : int, optional
+        The number of windows of minutes kept.
+    """
+    def __init__(self, trading_calendar, window_cache_size=64):
+        self.trading_calendar = trading_calendar
+        self._windows = LRU(window_cache_size)
+        self._last_lookup = (None, None)
+
+    @lazyval
+    def minutes(self):
+        return self.trading_calendar.all_minutes
+
+    @lazyval
+    def _minutes_nanos(self):
+        return self.minutes.asi8
+
+    def position(self, dt):
+        """
+        The position of the last trading minute at or before ``dt``.
+
+        Raises
+        ------
+        KeyError
+            If ``dt`` is before the first minute or after the last minute.
+        """
+        dt_nanos = dt.value
+        last_nanos, last_pos = self._last_lookup
+        if dt_nanos == last_nanos:
+            return last_pos
+
+        minutes_nanos = self._minutes_nanos
+        pos = minutes_nanos.searchsorted(dt_nanos, side='right') - 1
+        if pos < 0 or (pos == len(minutes_nanos) - 1 and
+                       dt_nanos > minutes_nanos[pos]):
+            raise KeyError("{0} is not in the trading minutes".format(dt))
+
+        self._last_lookup = (dt_nanos, pos)
+        return pos
+
+    def get_loc(self, dt):
+        """
+        The position of ``dt``, which must be a trading minute.
+
+        Raises
+        ------
+        KeyError
+            If ``dt`` is not a trading minute.
+        """
+        pos = self.position(dt)
+        if self._minutes_nanos[pos] != dt.value:
+            raise KeyError("{0} is not a trading minute".format(dt))
+        return pos
+
+    @lazyval
+    def _session_start_positions(self):
+        opens = self.trading_calendar.schedule.market_open.values
+        return self._minutes_nanos.searchsorted(opens.view('int64'))
+
+    def minutes_since_session_start(self, dt, sessions_count=1):
+        """
+        The number of trading minutes from the open of the session
+        ``sessions_count - 1`` sessions before the session of ``dt`` through
+        ``dt``, which must be a trading minute.
+        """
+        pos = self.get_loc(dt)
+        session_starts = self._session_start_positions
+        session_loc = session_starts.searchsorted(pos, side='right') - 1
+        first_session_loc = max(session_loc - sessions_count + 1, 0)
+        return pos - session_starts[first_session_loc] + 1
+
+    def window_positions(self, dt, count):
+        """
+        The range of positions of the ``count`` trading minutes ending at the
+        last trading minute at or before ``dt``.
+
+        Returns
+        -------
+        start, stop : int
+            The window is ``minutes[start:stop]``.
+
+        Raises
+        ------
+        KeyError
+            If the window does not fit in the trading minutes.
+        """
+        stop = self.position(dt) + 1
+        start = stop - count
+        if start < 0:
+            raise KeyError(
+                "Can't end a window of {0} minutes at {1}".format(count, dt)
+            )
+        return start, stop
+
+    def window(self, dt, count):
+        """
+        The ``count`` trading minutes ending at the last trading minute at or
+        before ``dt``, as a view of ``minutes``.
+        """
+        start, stop = self.window_positions(dt, count)
+        try:
+            return self._windows[start, stop]
+        except KeyError:
+            window = self._windows[start, stop] = self.minutes[start:stop]
+            return window
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -306,6 +427,16 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
         Reader for adjustment data.
+    prefetch_length : int, optional
+        The number of bars after the end of a window which are loaded with
+        it, so the following history calls are served without a read.
+    adaptive_prefetch : bool, optional
+        Whether to grow the prefetch of a (field, window length) once its
+        windows are rebuilt because the history calls advanced past the
+        prefetched bars, and to shrink it back when the calls rewind.
+    max_prefetch_length : int, optional
+        The upper bound of the adaptive prefetch. Defaults to four times
+        ``prefetch_length``.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume', 'sid')
 
@@ -313,7 +444,9 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                  asset_finder,
                  roll_finders=None,
                  sid_cache_size=1000,
-                 prefetch_length=0):
+                 prefetch_length=0,
+                 adaptive_prefetch=False,
+                 max_prefetch_length=None):
         self.trading_calendar = trading_calendar
         self._asset_finder = asset_finder
         self._reader = reader
@@ -334,6 +467,16 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             for field in self.FIELDS
         }
         self._prefetch_length = prefetch_length
+        self._adaptive_prefetch = adaptive_prefetch
+        if max_prefetch_length is None:
+            max_prefetch_length = 4 * prefetch_length
+        self._max_prefetch_length = max(max_prefetch_length, prefetch_length)
+        # (field, size, is_perspective_after) ->
+        #     (prefetch length, calendar index of the last prefetched bar)
+        self._prefetch_state = {}
+        self._window_hits = 0
+        self._window_misses = 0
+        self._block_loads = 0
 
     @abstractproperty
     def _frequency(self):
@@ -344,9 +487,56 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         pass
 
     @abstractmethod
-    def _array(self, start, end, assets, field):
+    def _arrays(self, dts, assets, fields):
         pass
 
+    def _calendar_loc(self, dt):
+        """
+        The position of ``dt`` in ``_calendar``.
+        """
+        return find_in_sorted_index(self._calendar, dt)
+
+    def _next_prefetch_length(self, key, end_ix):
+        """
+        The prefetch length of the next block of windows for ``key``.
+        """
+        base = self._prefetch_length
+        if not self._adaptive_prefetch:
+            return base
+        try:
+            length, last_prefetch_end_ix = self._prefetch_state[key]
+        except KeyError:
+            return base
+        if end_ix > last_prefetch_end_ix:
+            # The calls advanced past the previous block.
+            return min(max(2 * length, 1), self._max_prefetch_length)
+        if end_ix < last_prefetch_end_ix - length:
+            # The calls rewound before the previous block.
+            return base
+        return length
+
+    def prefetch_stats(self):
+        """
+        Statistics of the sliding windows served by this loader.
+
+        Returns
+        -------
+        stats : dict
+            ``hits`` and ``misses`` count the windows of an asset which were
+            served from a prefetched block or had to be loaded,
+            ``block_loads`` counts the reads of the underlying bars and
+            ``hit_rate`` is the share of hits.
+        """
+        requests = self._window_hits + self._window_misses
+        return {
+            'hits': self._window_hits,
+            'misses': self._window_misses,
+            'block_loads': self._block_loads,
+            'hit_rate': (
+                float(self._window_hits) / requests if requests else nan
+            ),
+        }
+
     def _decimal_places_for_asset(self, asset, reference_date):
         if isinstance(asset, Future) and asset.tick_size:
             return number_of_decimal_places(asset.tick_size)
@@ -362,17 +552,21 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
-    def _ensure_sliding_windows(self, assets, dts, field,
+    def _ensure_sliding_windows(self, assets, dts, fields,
                                 is_perspective_after):
         """
-        Ensure that there is a Float64Multiply window for each asset that can
-        provide data for the given parameters.
+        Ensure that there is a Float64Multiply window for each asset and field
+        that can provide data for the given parameters.
         If the corresponding window for the (assets, len(dts), field) does not
         exist, then create a new one.
         If a corresponding window does exist for (assets, len(dts), field), but
         can not provide data for the current dts range, then create a new
         one and replace the expired window.
 
+        The windows which need to be created for the same assets are loaded
+        together, with one read of the underlying bars for all of their
+        fields.
+
         Parameters
         ----------
         assets : iterable of Assets
@@ -381,84 +575,141 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             The datetimes for which to fetch data.
             Makes an assumption that all dts are present and contiguous,
             in the calendar.
-        field : str
-            The OHLCV field for which to retrieve data.
+        fields : list[str]
+            The OHLCV fields for which to retrieve data.
         is_perspective_after : bool
             see: `PricingHistoryLoader.history`
 
         Returns
         -------
-        out : list of Float64Window with sufficient data so that each asset's
-        window can provide `get` for the index corresponding with the last
-        value in `dts`
+        out : list of list of Float64Window, one list for each of ``fields``,
+        with sufficient data so that each asset's window can provide `get` for
+        the index corresponding with the last value in `dts`
         """
         end = dts[-1]
         size = len(dts)
-        asset_windows = {}
-        needed_assets = []
-        cal = self._calendar
 
         assets = self._asset_finder.retrieve_all(assets)
-        end_ix = find_in_sorted_index(cal, end)
-
-        for asset in assets:
-            try:
-                window = self._window_blocks[field].get(
-                    (asset, size, is_perspective_after), end)
-            except KeyError:
-                needed_assets.append(asset)
-            else:
-                if end_ix < window.most_recent_ix:
-                    # Window needs reset. Requested end index occurs before the
-                    # end index from the previous history call for this window.
-                    # Grab new window instead of rewinding adjustments.
+        end_ix = self._calendar_loc(end)
+
+        field_windows = []
+        # needed assets -> positions in ``fields`` of the windows to create
+        loads = OrderedDict()
+        for i, field in enumerate(fields):
+            asset_windows = {}
+            needed_assets = []
+            for asset in assets:
+                try:
+                    window = self._window_blocks[field].get(
+                        (asset, size, is_perspective_after), end)
+                except KeyError:
                     needed_assets.append(asset)
                 else:
-                    asset_windows[asset] = window
-
-        if needed_assets:
-            offset = 0
-            start_ix = find_in_sorted_index(cal, dts[0])
-
-            prefetch_end_ix = min(end_ix + self._prefetch_length, len(cal) - 1)
-            prefetch_end = cal[prefetch_end_ix]
-            prefetch_dts = cal[start_ix:prefetch_end_ix + 1]
-            if is_perspective_after:
-                adj_end_ix = min(prefetch_end_ix + 1, len(cal) - 1)
-                adj_dts = cal[start_ix:adj_end_ix + 1]
-            else:
-                adj_dts = prefetch_dts
-            prefetch_len = len(prefetch_dts)
-            array = self._array(prefetch_dts, needed_assets, field)
+                    if end_ix < window.most_recent_ix:
+                        # Window needs reset. Requested end index occurs
+                        # before the end index from the previous history call
+                        # for this window. Grab new window instead of
+                        # rewinding adjustments.
+                        needed_assets.append(asset)
+                    else:
+                        asset_windows[asset] = window
+
+            self._window_hits += len(asset_windows)
+            self._window_misses += len(needed_assets)
+            field_windows.append(asset_windows)
+            if needed_assets:
+                loads.setdefault(tuple(needed_assets), []).append(i)
+
+        if loads:
+            start_ix = self._calendar_loc(dts[0])
+
+        for needed_assets, positions in iteritems(loads):
+            new_windows = self._load_sliding_windows(
+                needed_assets,
+                [fields[i] for i in positions],
+                start_ix,
+                end_ix,
+                size,
+                is_perspective_after,
+                end,
+            )
+            for i, windows in zip(positions, new_windows):
+                field_windows[i].update(windows)
+
+        return [
+            [asset_windows[asset] for asset in assets]
+            for asset_windows in field_windows
+        ]
+
+    def _load_sliding_windows(self, assets, fields, start_ix, end_ix, size,
+                              is_perspective_after, reference_date):
+        """
+        Read a prefetched block of each of ``fields`` for ``assets`` and cache
+        a sliding window over it for each asset and field.
 
+        Returns
+        -------
+        out : list[dict[Asset -> SlidingWindow]]
+            The new windows of each of ``fields``.
+        """
+        self._block_loads += 1
+        cal = self._calendar
+        offset = 0
+
+        prefetch_keys = [
+            (field, size, is_perspective_after) for field in fields
+        ]
+        prefetch_length = max(
+            self._next_prefetch_length(key, end_ix) for key in prefetch_keys
+        )
+        prefetch_end_ix = min(end_ix + prefetch_length, len(cal) - 1)
+        for key in prefetch_keys:
+            self._prefetch_state[key] = (prefetch_length, prefetch_end_ix)
+        prefetch_end = cal[prefetch_end_ix]
+        prefetch_dts = cal[start_ix:prefetch_end_ix + 1]
+        if is_perspective_after:
+            adj_end_ix = min(prefetch_end_ix + 1, len(cal) - 1)
+            adj_dts = cal[start_ix:adj_end_ix + 1]
+        else:
+            adj_dts = prefetch_dts
+        prefetch_len = len(prefetch_dts)
+        arrays = self._arrays(prefetch_dts, assets, fields)
+
+        adjustments = []
+        decimal_places = []
+        for asset in assets:
+            adj_reader = self._adjustment_readers.get(type(asset))
+            if adj_reader is not None:
+                adjustments.append(
+                    adj_reader.load_adjustments(fields, adj_dts, [asset])
+                )
+            else:
+                adjustments.append([{} for _ in fields])
+            decimal_places.append(
+                self._decimal_places_for_asset(asset, reference_date)
+            )
+
+        view_kwargs = {}
+        out = []
+        for j, (field, array) in enumerate(zip(fields, arrays)):
             if field == 'sid':
                 window_type = Int64Window
             else:
                 window_type = Float64Window
 
-            view_kwargs = {}
             if field == 'volume':
                 array = array.astype(float64_dtype)
 
-            for i, asset in enumerate(needed_assets):
-                adj_reader = None
-                try:
-                    adj_reader = self._adjustment_readers[type(asset)]
-                except KeyError:
-                    adj_reader = None
-                if adj_reader is not None:
-                    adjs = adj_reader.load_adjustments(
-                        [field], adj_dts, [asset])[0]
-                else:
-                    adjs = {}
+            asset_windows = {}
+            for i, asset in enumerate(assets):
                 window = window_type(
                     array[:, i].reshape(prefetch_len, 1),
                     view_kwargs,
-                    adjs,
+                    adjustments[i][j],
                     offset,
                     size,
                     int(is_perspective_after),
-                    self._decimal_places_for_asset(asset, dts[-1]),
+                    decimal_places[i],
                 )
                 sliding_window = SlidingWindow(window, size, start_ix, offset)
                 asset_windows[asset] = sliding_window
@@ -466,8 +717,9 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     (asset, size, is_perspective_after),
                     sliding_window,
                     prefetch_end)
+            out.append(asset_windows)
 
-        return [asset_windows[asset] for asset in assets]
+        return out
 
     def history(self, assets, dts, field, is_perspective_after):
         """
@@ -544,16 +796,51 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         -------
         out : np.ndarray with shape(len(days between start, end), len(assets))
         """
-        block = self._ensure_sliding_windows(assets,
-                                             dts,
-                                             field,
-                                             is_perspective_after)
-        end_ix = self._calendar.searchsorted(dts[-1])
+        return self.history_fields(
+            assets,
+            dts,
+            [field],
+            is_perspective_after,
+        )[0]
 
-        return concatenate(
-            [window.get(end_ix) for window in block],
-            axis=1,
-        )
+    def history_fields(self, assets, dts, fields, is_perspective_after):
+        """
+        Windows of several fields of pricing data, with the same semantics as
+        ``history``.
+
+        The bars of all of the fields are read in one pass over the reader,
+        instead of once per field.
+
+        Parameters
+        ----------
+        assets : iterable of Assets
+            The assets in the window.
+        dts : iterable of datetime64-like
+            The datetimes for which to fetch data.
+        fields : list[str]
+            The OHLCV fields for which to retrieve data.
+        is_perspective_after : bool
+            see: `history`
+
+        Returns
+        -------
+        out : list[np.ndarray]
+            The window of each of ``fields``, with shape
+            (len(dts), len(assets)).
+        """
+        blocks = self._ensure_sliding_windows(assets,
+                                              dts,
+                                              fields,
+                                              is_perspective_after)
+        end_ix = self._calendar_loc(dts[-1])
+
+        return [
+            concatenate(
+                [window.get(end_ix) for window in block],
+                axis=1,
+            )
+            for block in blocks
+        ]
 
 
 class DailyHistoryLoader(HistoryLoader):
@@ -566,32 +853,61 @@ class DailyHistoryLoader(HistoryLoader):
     def _calendar(self):
         return self._reader.sessions
 
-    def _array(self, dts, assets, field):
+    def _arrays(self, dts, assets, fields):
         return self._reader.load_raw_arrays(
-            [field],
+            fields,
             dts[0],
             dts[-1],
             assets,
-        )[0]
+        )
 
 
 class MinuteHistoryLoader(HistoryLoader):
+    """
+    Loader for sliding minute history windows.
+
+    Parameters
+    ----------
+    minute_index : TradingMinuteIndex, optional
+        The index of the minutes of ``trading_calendar``, which can be shared
+        with the caller looking up the windows. See ``HistoryLoader`` for the
+        other parameters.
+    """
+    def __init__(self, *args, **kwargs):
+        minute_index = kwargs.pop('minute_index', None)
+        super(MinuteHistoryLoader, self).__init__(*args, **kwargs)
+        if minute_index is None:
+            minute_index = TradingMinuteIndex(self.trading_calendar)
+        self._minute_index = minute_index
 
     @property
     def _frequency(self):
         return 'minute'
 
+    @lazyval
+    def _calendar_start(self):
+        return self.trading_calendar.all_minutes.searchsorted(
+            self._reader.first_trading_day,
+        )
+
     @lazyval
     def _calendar(self):
         mm = self.trading_calendar.all_minutes
-        start = mm.searchsorted(self._reader.first_trading_day)
         end = mm.searchsorted(self._reader.last_available_dt, side='right')
-        return mm[start:end]
+        return mm[self._calendar_start:end]
+
+    def _calendar_loc(self, dt):
+        ix = self._minute_index.get_loc(dt) - self._calendar_start
+        if not 0 <= ix < len(self._calendar):
+            raise KeyError(
+                "{0} is not in the minutes of the reader".format(dt)
+            )
+        return ix
 
-    def _array(self, dts, assets, field):
+    def _arrays(self, dts, assets, fields):
         return self._reader.load_raw_arrays(
-            [field],
+            fields,
             dts[0],
             dts[-1],
             assets,
-        )[0]
+        )
@@ -26,6 +26,7 @@ import logbook
 import numpy as np
 import pandas as pd
 from pandas import HDFStore
+from pandas.tslib import iNaT
 import tables
 from six import with_metaclass
 from toolz import keymap, valmap
@@ -38,7 +39,12 @@ from zipline.data._minute_bar_internal import (
 
 from zipline.gens.sim_engine import NANOS_IN_MINUTE
 
-from zipline.data.bar_reader import BarReader, NoDataOnDate
+from zipline.data.bar_reader import (
+    BarReader,
+    NoDataOnDate,
+    empty_spot_values,
+    map_reads,
+)
 from zipline.data.us_equity_pricing import check_uint32_safe
 from zipline.utils.calendars import get_calendar
 from zipline.utils.cli import maybe_show_progress
@@ -892,6 +898,9 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    read_threads : int, optional
+        The number of threads used by ``load_raw_arrays`` to decompress the
+        sids of a window concurrently. By default the sids are read serially.
 
     See Also
     --------
@@ -899,8 +908,9 @@ class BcolzMinuteBarReader(MinuteBarReader):
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
-    def __init__(self, rootdir, sid_cache_size=1000):
+    def __init__(self, rootdir, sid_cache_size=1000, read_threads=None):
         self._rootdir = rootdir
+        self.read_threads = read_threads
 
         metadata = self._get_metadata()
 
@@ -1104,16 +1114,7 @@ class BcolzMinuteBarReader(MinuteBarReader):
             Returns the integer value of the volume.
             (A volume of 0 signifies no trades for the given dt.)
         """
-        if self._last_get_value_dt_value == dt.value:
-            minute_pos = self._last_get_value_dt_position
-        else:
-            try:
-                minute_pos = self._find_position_of_minute(dt)
-            except ValueError:
-                raise NoDataOnDate()
-
-            self._last_get_value_dt_value = dt.value
-            self._last_get_value_dt_position = minute_pos
+        minute_pos = self._minute_position(dt)
 
         try:
             value = self._open_minute_file(field, sid)[minute_pos]
@@ -1129,6 +1130,66 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def _minute_position(self, dt):
+        if self._last_get_value_dt_value == dt.value:
+            return self._last_get_value_dt_position
+
+        try:
+            minute_pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        self._last_get_value_dt_value = dt.value
+        self._last_get_value_dt_position = minute_pos
+        return minute_pos
+
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info of many sids for the given dt and field.
+
+        The position of the minute is found once for all the sids, and the
+        missing values and price ratios are applied to all the values at
+        once.
+
+        Parameters:
+        -----------
+        sids : iterable of int
+            Asset identifiers.
+        dt : datetime-like
+            The datetime at which the trade occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns:
+        --------
+        out : np.ndarray
+            float64 for OHLC with NaN where no trade occurred, int64 for
+            volume.
+        """
+        out = empty_spot_values(len(sids), field)
+        try:
+            minute_pos = self._minute_position(dt)
+        except NoDataOnDate:
+            return out
+
+        values = np.zeros(len(sids), dtype=np.uint32)
+        for i, sid in enumerate(sids):
+            try:
+                values[i] = self._open_minute_file(field, sid)[minute_pos]
+            except IndexError:
+                pass
+
+        if field == 'volume':
+            out[:] = values
+            return out
+
+        traded = values != 0
+        ratios = np.array([self._ohlc_ratio_inverse_for_sid(int(sid))
+                           for sid in sids], dtype=np.float64)
+        out[traded] = values[traded] * ratios[traded]
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
@@ -1137,8 +1198,8 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
     def _find_last_traded_position(self, asset, dt):
         volumes = self._open_minute_file('volume', asset)
-        start_date_minute = asset.start_date.value / NANOS_IN_MINUTE
-        dt_minute = dt.value / NANOS_IN_MINUTE
+        start_date_minute = asset.start_date.value // NANOS_IN_MINUTE
+        dt_minute = dt.value // NANOS_IN_MINUTE
 
         try:
             # if we know of a dt before which this asset has no volume,
@@ -1172,6 +1233,94 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         return pos
 
+    def get_last_traded_dts(self, assets, dt):
+        minutes_per_day = self._minutes_per_day
+        market_opens = self._market_open_values
+        market_closes = self._market_close_values
+
+        dt_minute = dt.value // NANOS_IN_MINUTE
+        # The position of dt, or of the last market minute before it, is
+        # shared by every asset.
+        end_pos = find_position_of_minute(
+            market_opens,
+            market_closes,
+            dt_minute,
+            minutes_per_day,
+            True,
+        )
+
+        positions = np.full(len(assets), -1, dtype=np.int64)
+        for i, asset in enumerate(assets):
+            try:
+                earliest_minute = self._known_zero_volume_dict[asset.sid]
+            except KeyError:
+                earliest_minute = asset.start_date.value // NANOS_IN_MINUTE
+            if dt_minute < earliest_minute:
+                continue
+
+            volumes = self._open_minute_file('volume', asset)
+            pos = self._last_nonzero_position(
+                volumes,
+                self._first_position_at_or_after(earliest_minute),
+                min(end_pos, len(volumes) - 1),
+            )
+            if pos == -1:
+                # if we didn't find any volume before this dt, save it to
+                # avoid work in the future.
+                self._known_zero_volume_dict[asset.sid] = max(
+                    dt_minute,
+                    self._known_zero_volume_dict.get(asset.sid, dt_minute),
+                )
+            positions[i] = pos
+
+        traded = positions != -1
+        out = np.full(len(assets), iNaT, dtype=np.int64)
+        traded_positions = positions[traded]
+        out[traded] = (
+            market_opens[traded_positions // minutes_per_day] +
+            traded_positions % minutes_per_day
+        ) * NANOS_IN_MINUTE
+        return pd.DatetimeIndex(out, tz='UTC')
+
+    def _first_position_at_or_after(self, minute):
+        """
+        The position of the first market minute at or after ``minute``.
+        """
+        market_opens = self._market_open_values
+        session_loc = market_opens.searchsorted(minute, side='right') - 1
+        if session_loc < 0:
+            return 0
+        if minute > self._market_close_values[session_loc]:
+            return (session_loc + 1) * self._minutes_per_day
+        return (session_loc * self._minutes_per_day +
+                minute - market_opens[session_loc])
+
+    def _last_nonzero_position(self, volumes, first_pos, last_pos):
+        """
+        The position of the last nonzero volume of a market minute in
+        ``volumes[first_pos:last_pos + 1]``, or -1. The volumes are read a
+        block at a time, from one session up, instead of one minute at a time.
+        """
+        minutes_per_day = self._minutes_per_day
+        block_size = minutes_per_day
+        stop = last_pos + 1
+        while stop > first_pos:
+            start = max(first_pos, stop - block_size)
+            traded = start + np.flatnonzero(volumes[start:stop])
+            if len(traded):
+                # Skip the volumes written after an early close.
+                session_locs = traded // minutes_per_day
+                traded = traded[
+                    self._market_open_values[session_locs] +
+                    traded % minutes_per_day <=
+                    self._market_close_values[session_locs]
+                ]
+                if len(traded):
+                    return traded[-1]
+            stop = start
+            block_size *= 2
+        return -1
+
     def _pos_to_minute(self, pos):
         minute_epoch = minute_value(
             self._market_open_values,
@@ -1231,46 +1380,185 @@ class BcolzMinuteBarReader(MinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        num_minutes = (end_idx - start_idx + 1)
+        num_raw_minutes = end_idx - start_idx + 1
+        kept_minutes = self._kept_positions_for_range(start_idx, end_idx)
 
         results = []
+        ratios = None
 
-        indices_to_exclude = self._exclusion_indices_for_range(
-            start_idx, end_idx)
-        if indices_to_exclude is not None:
-            for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
+        for field in fields:
+            # Gather the window of every sid into one (minutes, sids) matrix,
+            # then drop the early close minutes and scale all of the sids at
+            # once.
+            raw = np.zeros((num_raw_minutes, len(sids)), dtype=np.uint32)
+            # Open the carrays up front, the sid cache is not thread safe;
+            # only the decompression of the window runs on the read pool.
+            carrays = [self._open_minute_file(field, sid) for sid in sids]
 
-        shape = num_minutes, len(sids)
+            def read_window(i):
+                values = carrays[i][start_idx:end_idx + 1]
+                # we might not have written data for all the minutes
+                # requested
+                raw[:len(values), i] = values
+
+            map_reads(self.read_threads, read_window, range(len(sids)))
+
+            if kept_minutes is not None:
+                raw = raw[kept_minutes]
 
-        for field in fields:
             if field != 'volume':
-                out = np.full(shape, np.nan)
+                if ratios is None:
+                    ratios = np.array(
+                        [self._ohlc_ratio_inverse_for_sid(sid)
+                         for sid in sids],
+                        dtype=np.float64,
+                    )
+                out = raw * ratios
+                out[raw == 0] = np.nan
             else:
-                out = np.zeros(shape, dtype=np.uint32)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
+                out = raw
 
             results.append(out)
         return results
 
+    def _kept_positions_for_range(self, start_idx, end_idx):
+        """
+        Returns
+        -------
+        np.ndarray[intp] or None
+            The positions, relative to start_idx, of the minutes of the range
+            which are not excluded because of early closes, or None if no
+            minute is excluded.
+        """
+        indices_to_exclude = self._exclusion_indices_for_range(
+            start_idx, end_idx)
+        if indices_to_exclude is None:
+            return None
+
+        kept = np.ones(end_idx - start_idx + 1, dtype=bool)
+        for excl_start, excl_stop in indices_to_exclude:
+            kept[excl_start - start_idx:excl_stop - start_idx + 1] = False
+        return np.flatnonzero(kept)
+
+
+MEMMAP_MINUTE_FILE_SUFFIX = '.uint32'
+MEMMAP_SID_ATTRS_FILENAME = 'attrs.json'
+
+
+def _memmap_sid_path(rootdir, sid):
+    """
+    The directory of the column files of the given sid in a memory-mapped
+    minute bar directory, e.g. 1 is stored in 00/00/000001
+    """
+    return os.path.join(rootdir, os.path.splitext(_sid_subdir_path(sid))[0])
+
+
+class MemmapMinuteBarReader(BcolzMinuteBarReader):
+    """
+    Reader for minute bars stored as uncompressed column files, as written by
+    ``convert_bcolz_minute_bars_to_memmap``.
+
+    Every field of every sid is a flat file of uint32 values with the same
+    layout as the bcolz carrays of ``BcolzMinuteBarWriter``. The files are
+    opened with ``np.memmap``, so reads are served from the page cache without
+    decompression and slices are views of the mapped files.
+
+    Parameters:
+    -----------
+    rootdir : string
+        The root directory containing the metadata and the sid directories.
+    sid_cache_size : int
+        The number of memory-mapped files kept open per field.
+
+    See Also
+    --------
+    zipline.data.minute_bars.convert_bcolz_minute_bars_to_memmap
+    """
+    def _get_carray_path(self, sid, field):
+        return os.path.join(_memmap_sid_path(self._rootdir, sid),
+                            field + MEMMAP_MINUTE_FILE_SUFFIX)
+
+    def _open_minute_file(self, field, sid):
+        sid = int(sid)
+
+        try:
+            return self._carrays[field][sid]
+        except KeyError:
+            pass
+
+        path = self._get_carray_path(sid, field)
+        if os.path.getsize(path) == 0:
+            # Empty files can not be memory-mapped
+            values = np.zeros(0, dtype=np.uint32)
+        else:
+            values = np.memmap(path, dtype=np.uint32, mode='r')
+
+        self._carrays[field][sid] = values
+        return values
+
+    def get_sid_attr(self, sid, name):
+        attrs_path = os.path.join(_memmap_sid_path(self._rootdir, sid),
+                                  MEMMAP_SID_ATTRS_FILENAME)
+        try:
+            with open(attrs_path) as fp:
+                attrs = json.load(fp)
+        except IOError:
+            return None
+        return attrs.get(name)
+
+
+def convert_bcolz_minute_bars_to_memmap(bcolz_rootdir,
+                                        memmap_rootdir,
+                                        show_progress=False):
+    """Convert the minute bars written by ``BcolzMinuteBarWriter`` to the
+    uncompressed format read by ``MemmapMinuteBarReader``.
+
+    Parameters
+    ----------
+    bcolz_rootdir : string
+        The root directory of the bcolz minute bars.
+    memmap_rootdir : string
+        The root directory to write the memory-mapped minute bars to.
+    show_progress : bool
+        Whether or not to show a progress bar while converting.
+
+    Notes
+    -----
+    The metadata is written last, so an interrupted conversion does not
+    leave a readable directory behind.
+    """
+    metadata = BcolzMinuteBarMetadata.read(bcolz_rootdir)
+    if not os.path.isdir(memmap_rootdir):
+        os.makedirs(memmap_rootdir)
+
+    sid_paths = sorted(glob(os.path.join(bcolz_rootdir, "*", "*", "*.bcolz")))
+
+    ctx = maybe_show_progress(
+        sid_paths,
+        show_progress=show_progress,
+        item_show_func=lambda p: p if p is None else os.path.basename(p),
+        label="Converting minute files:",
+    )
+    with ctx as it:
+        for sid_path in it:
+            sid = int(os.path.splitext(os.path.basename(sid_path))[0])
+            table = bcolz.open(rootdir=sid_path, mode='r')
+
+            dest = _memmap_sid_path(memmap_rootdir, sid)
+            if not os.path.isdir(dest):
+                os.makedirs(dest)
+
+            for field in BcolzMinuteBarReader.FIELDS:
+                table[field][:].astype(np.uint32, copy=False).tofile(
+                    os.path.join(dest, field + MEMMAP_MINUTE_FILE_SUFFIX),
+                )
+
+            with open(os.path.join(dest, MEMMAP_SID_ATTRS_FILENAME),
+                      'w') as fp:
+                json.dump(dict(table.attrs.attrs), fp)
+
+    metadata.write(memmap_rootdir)
+
 
 class MinuteBarUpdateReader(with_metaclass(ABCMeta, object)):
     """
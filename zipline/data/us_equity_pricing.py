@@ -13,7 +13,8 @@
 # limitations under the License.
 from errno import ENOENT
 from functools import partial
-from os import remove
+from os import getpid, makedirs, remove
+from os.path import getsize, isdir, join
 import sqlite3
 import warnings
 
@@ -48,6 +49,7 @@ from pandas import (
 from pandas.tslib import iNaT
 from six import (
     iteritems,
+    itervalues,
     string_types,
     viewkeys,
 )
@@ -58,6 +60,8 @@ from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
     NoDataOnDate,
+    empty_spot_values,
+    map_reads,
 )
 from zipline.utils.calendars import get_calendar
 from zipline.utils.functional import apply
@@ -67,7 +71,11 @@ from zipline.utils.input_validation import (
     preprocess,
     verify_indices_all_unique,
 )
-from zipline.utils.sqlite_utils import group_into_chunks, coerce_string_to_conn
+from zipline.utils.sqlite_utils import (
+    coerce_string_to_conn,
+    database_path,
+    group_into_chunks,
+)
 from zipline.utils.memoize import lazyval
 from zipline.utils.cli import maybe_show_progress
 from ._equities import _compute_row_slices, _read_bcolz_data
@@ -438,6 +446,10 @@ class BcolzDailyBarReader(SessionBarReader):
         all of the data for all assets into memory and then indexing into that
         array for each day and asset pair.  Used to tune performance of reads
         when using a small or large number of equities.
+    read_threads : int, optional
+        The number of threads used by ``load_raw_arrays`` to decompress the
+        columns, and below ``read_all_threshold`` groups of assets, of a
+        window concurrently. By default the data is read serially.
 
     Attributes
     ----------
@@ -494,7 +506,7 @@ class BcolzDailyBarReader(SessionBarReader):
     --------
     zipline.data.us_equity_pricing.BcolzDailyBarWriter
     """
-    def __init__(self, table, read_all_threshold=3000):
+    def __init__(self, table, read_all_threshold=3000, read_threads=None):
         self._maybe_table_rootdir = table
         # Cache of fully read np.array for the carrays in the daily bar table.
         # raw_array does not use the same cache, but it could.
@@ -503,6 +515,7 @@ class BcolzDailyBarReader(SessionBarReader):
         self._spot_cols = {}
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
         self._read_all_threshold = read_all_threshold
+        self.read_threads = read_threads
 
     @lazyval
     def _table(self):
@@ -511,6 +524,13 @@ class BcolzDailyBarReader(SessionBarReader):
             return maybe_table_rootdir
         return ctable(rootdir=maybe_table_rootdir, mode='r')
 
+    @property
+    def _columns(self):
+        """
+        The mapping from column name to the OHLCV values read by this reader.
+        """
+        return self._table
+
     @lazyval
     def sessions(self):
         if 'calendar' in self._table.attrs.attrs:
@@ -629,15 +649,58 @@ class BcolzDailyBarReader(SessionBarReader):
             assets,
         )
         read_all = len(assets) > self._read_all_threshold
-        return _read_bcolz_data(
-            self._table,
-            (end_idx - start_idx + 1, len(assets)),
-            list(columns),
-            first_rows,
-            last_rows,
-            offsets,
-            read_all,
+        num_days = end_idx - start_idx + 1
+        read_threads = self.read_threads
+        if read_threads is None or read_threads < 2:
+            return _read_bcolz_data(
+                self._columns,
+                (num_days, len(assets)),
+                list(columns),
+                first_rows,
+                last_rows,
+                offsets,
+                read_all,
+            )
+
+        # Split the read into one task per column and, when each asset is
+        # sliced out of the carray on its own, per group of assets.  When
+        # read_all is set every task would decompress the whole column, so
+        # only the columns are split.
+        if read_all or len(assets) < 2:
+            groups = [slice(None)]
+        else:
+            group_size = -(-len(assets) // read_threads)
+            groups = [
+                slice(start, start + group_size)
+                for start in range(0, len(assets), group_size)
+            ]
+
+        table = self._columns
+
+        def read_group(task):
+            column, group = task
+            group_first_rows = first_rows[group]
+            return _read_bcolz_data(
+                table,
+                (num_days, len(group_first_rows)),
+                [column],
+                group_first_rows,
+                last_rows[group],
+                offsets[group],
+                read_all,
+            )[0]
+
+        parts = map_reads(
+            read_threads,
+            read_group,
+            ((column, group) for column in columns for group in groups),
         )
+        num_groups = len(groups)
+        return [
+            np.hstack(parts[i:i + num_groups])
+            if num_groups > 1 else parts[i]
+            for i in range(0, len(parts), num_groups)
+        ]
 
     def _spot_col(self, colname):
         """
@@ -658,33 +721,96 @@ class BcolzDailyBarReader(SessionBarReader):
         try:
             col = self._spot_cols[colname]
         except KeyError:
-            col = self._spot_cols[colname] = self._table[colname]
+            col = self._spot_cols[colname] = self._columns[colname]
         return col
 
+    @lazyval
+    def _last_traded_rows(self):
+        """
+        For each row of the table, the last row at or before it of the same
+        asset with a nonzero volume, or -1 if the asset did not trade yet.
+        """
+        volumes = self._columns['volume'][:]
+        rows = np.arange(len(volumes), dtype=int64)
+        last_traded = np.maximum.accumulate(np.where(volumes != 0, rows, -1))
+
+        # Do not look back into the block of the previous asset.
+        block_starts = np.unique(
+            np.fromiter(itervalues(self._first_rows), dtype=int64),
+        )
+        if len(block_starts):
+            owner = block_starts.searchsorted(rows, side='right') - 1
+            block_start = block_starts[owner.clip(0)]
+            last_traded[last_traded < block_start] = -1
+        return last_traded
+
     def get_last_traded_dt(self, asset, day):
-        volumes = self._spot_col('volume')
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except KeyError:
+            return NaT
 
-        search_day = day
+        sid = int(asset)
+        first_row = self._first_rows[sid]
+        calendar_offset = self._calendar_offsets[sid]
+        offset = day_loc - calendar_offset
+        if offset < 0:
+            return NaT
 
-        while True:
-            try:
-                ix = self.sid_day_index(asset, search_day)
-            except NoDataBeforeDate:
-                return NaT
-            except NoDataAfterDate:
-                prev_day_ix = self.sessions.get_loc(search_day) - 1
-                if prev_day_ix > -1:
-                    search_day = self.sessions[prev_day_ix]
-                continue
-            except NoDataOnDate:
-                return NaT
-            if volumes[ix] != 0:
-                return search_day
-            prev_day_ix = self.sessions.get_loc(search_day) - 1
-            if prev_day_ix > -1:
-                search_day = self.sessions[prev_day_ix]
-            else:
-                return NaT
+        # After the asset's last row, the last trade is at or before it.
+        ix = min(first_row + offset, self._last_rows[sid])
+        if ix < first_row:
+            return NaT
+
+        last_traded = self._last_traded_rows[ix]
+        if last_traded < 0:
+            return NaT
+        return self.sessions[calendar_offset + last_traded - first_row]
+
+    def get_last_traded_dts(self, assets, day):
+        """
+        Get the latest day on or before ``day`` on which each of the assets
+        traded.
+
+        Parameters
+        ----------
+        assets : iterable of int or Asset
+            The assets for which to get the last traded days.
+        day : pd.Timestamp
+            The day at which to start searching backwards.
+
+        Returns
+        -------
+        last_traded : pd.DatetimeIndex
+            The last traded day of each asset, or NaT if the asset did not
+            trade on or before ``day``.
+        """
+        sids = [int(asset) for asset in assets]
+        out = full(len(sids), iNaT, dtype=int64)
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except KeyError:
+            return DatetimeIndex(out, tz='UTC')
+
+        first_rows = array([self._first_rows.get(sid, 0) for sid in sids],
+                           dtype=int64)
+        last_rows = array([self._last_rows.get(sid, -1) for sid in sids],
+                          dtype=int64)
+        calendar_offsets = array(
+            [self._calendar_offsets.get(sid, 0) for sid in sids],
+            dtype=int64,
+        )
+        offsets = day_loc - calendar_offsets
+        ix = np.minimum(first_rows + offsets, last_rows)
+        valid = (offsets >= 0) & (ix >= first_rows)
+
+        last_traded = full(len(sids), -1, dtype=int64)
+        last_traded[valid] = self._last_traded_rows[ix[valid]]
+        valid &= last_traded >= 0
+
+        session_locs = (calendar_offsets + last_traded - first_rows)[valid]
+        out[valid] = self.sessions.asi8[session_locs]
+        return DatetimeIndex(out, tz='UTC')
 
     def sid_day_index(self, sid, day):
         """
@@ -749,6 +875,131 @@ class BcolzDailyBarReader(SessionBarReader):
         else:
             return price
 
+    def get_values(self, sids, dt, field):
+        """
+        Parameters
+        ----------
+        sids : iterable of int
+            The asset identifiers.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        np.ndarray
+            The spot values for ``field`` of the given sids on the given day,
+            float64 for prices (NaN where the price is 0 or the day is outside
+            of the date range of the equity), int64 for volume.
+        """
+        out = empty_spot_values(len(sids), field)
+        try:
+            day_loc = self.sessions.get_loc(dt)
+        except KeyError:
+            return out
+
+        sids = [int(sid) for sid in sids]
+        first_rows = array([self._first_rows.get(sid, -1) for sid in sids],
+                           dtype=int64)
+        last_rows = array([self._last_rows.get(sid, -2) for sid in sids],
+                          dtype=int64)
+        offsets = day_loc - array(
+            [self._calendar_offsets.get(sid, 0) for sid in sids],
+            dtype=int64,
+        )
+        ix = first_rows + offsets
+        valid = (offsets >= 0) & (ix <= last_rows)
+        if not valid.any():
+            return out
+
+        values = self._spot_col(field)[ix[valid]]
+        if field == 'volume':
+            out[valid] = values
+        else:
+            prices = values * 0.001
+            prices[values == 0] = nan
+            out[valid] = prices
+        return out
+
+
+MEMMAP_DAILY_FILE_SUFFIX = '.uint32'
+
+
+def _memmap_column_path(memmap_dir, colname):
+    return join(memmap_dir, colname + MEMMAP_DAILY_FILE_SUFFIX)
+
+
+class MemmapDailyBarReader(BcolzDailyBarReader):
+    """
+    Reader for daily bars whose OHLCV columns were decompressed to flat files
+    by ``convert_bcolz_daily_bars_to_memmap``.
+
+    The columns are opened with ``np.memmap``, so every process reading the
+    same files shares one copy of the decoded data through the page cache.
+    The bcolz table is only used for its attributes.
+
+    Parameters
+    ----------
+    table : bcolz.ctable or str
+        The ctable, or its rootdir, from which the columns were converted.
+    memmap_dir : str
+        The directory containing the converted columns.
+    read_all_threshold : int
+        See ``BcolzDailyBarReader``.
+    read_threads : int, optional
+        See ``BcolzDailyBarReader``.
+
+    See Also
+    --------
+    zipline.data.us_equity_pricing.convert_bcolz_daily_bars_to_memmap
+    """
+    def __init__(self,
+                 table,
+                 memmap_dir,
+                 read_all_threshold=3000,
+                 read_threads=None):
+        super(MemmapDailyBarReader, self).__init__(
+            table,
+            read_all_threshold=read_all_threshold,
+            read_threads=read_threads,
+        )
+        self._memmap_dir = memmap_dir
+
+    @lazyval
+    def _columns(self):
+        columns = {}
+        for colname in US_EQUITY_PRICING_BCOLZ_COLUMNS[:5]:
+            path = _memmap_column_path(self._memmap_dir, colname)
+            if getsize(path) == 0:
+                # Empty files can not be memory-mapped
+                columns[colname] = np.zeros(0, dtype=uint32)
+            else:
+                columns[colname] = np.memmap(path, dtype=uint32, mode='r')
+        return columns
+
+
+def convert_bcolz_daily_bars_to_memmap(table, memmap_dir):
+    """Decompress the OHLCV columns written by ``BcolzDailyBarWriter`` to
+    the flat files read by ``MemmapDailyBarReader``.
+
+    Parameters
+    ----------
+    table : bcolz.ctable or str
+        The ctable, or its rootdir, to convert.
+    memmap_dir : str
+        The directory to write the columns to.
+    """
+    if not isinstance(table, ctable):
+        table = ctable(rootdir=table, mode='r')
+    if not isdir(memmap_dir):
+        makedirs(memmap_dir)
+
+    for colname in US_EQUITY_PRICING_BCOLZ_COLUMNS[:5]:
+        table[colname][:].astype(uint32, copy=False).tofile(
+            _memmap_column_path(memmap_dir, colname),
+        )
+
 
 class PanelBarReader(SessionBarReader):
     """
@@ -1275,6 +1526,13 @@ class SQLiteAdjustmentReader(object):
     conn : str or sqlite3.Connection
         Connection from which to load data.
 
+    Notes
+    -----
+    A process forked from the one which created the reader connects to the
+    database again on its first read, since SQLite connections must not be
+    used across a fork. Databases held in memory are read through the
+    inherited connection.
+
     See Also
     --------
     :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentWriter`
@@ -1282,7 +1540,9 @@ class SQLiteAdjustmentReader(object):
 
     @preprocess(conn=coerce_string_to_conn)
     def __init__(self, conn):
-        self.conn = conn
+        self._conn = conn
+        self._conn_pid = getpid()
+        self._path = database_path(conn)
 
         # Given the tables in the adjustments.db file, dict which knows which
         # col names contain dates that have been coerced into ints.
@@ -1296,6 +1556,14 @@ class SQLiteAdjustmentReader(object):
                                        'record_date')
         }
 
+    @property
+    def conn(self):
+        if self._conn_pid != getpid():
+            if self._path:
+                self._conn = sqlite3.connect(self._path)
+            self._conn_pid = getpid()
+        return self._conn
+
     def load_adjustments(self, columns, dates, assets):
         return load_adjustments_from_sqlite(
             self.conn,
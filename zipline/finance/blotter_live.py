@@ -10,10 +10,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import defaultdict
+
 from logbook import Logger
 from six import itervalues
 
 from zipline.finance.blotter import Blotter
+from zipline.gens.brokers.broker import (OrderJournal,
+                                         ORDER_EVENT,
+                                         TRANSACTION_EVENT)
 from zipline.utils.input_validation import expect_types
 
 from zipline.assets import Asset
@@ -22,6 +27,14 @@ log = Logger('Blotter Live')
 
 
 class BlotterLive(Blotter):
+    """Blotter delegating the order management to the broker.
+
+    If the broker records its order updates in an
+    :class:`~zipline.gens.brokers.broker.OrderJournal` the blotter consumes
+    only the events since its previous read and keeps the orders and the
+    open orders (indexed by asset) up to date incrementally. Otherwise the
+    full order and transaction lists of the broker are diffed on every bar.
+    """
     def __init__(self, data_frequency, broker):
         self.broker = broker
         self._processed_closed_orders = []
@@ -29,6 +42,15 @@ class BlotterLive(Blotter):
         self.data_frequency = data_frequency
         self.new_orders = []
 
+        journal = getattr(broker, 'order_journal', None)
+        self._journal = journal if isinstance(journal, OrderJournal) else None
+        self._journal_cursor = 0
+        self._orders = {}
+        self._open_orders = defaultdict(dict)
+        self._closed_order_ids = set()
+        self._pending_transactions = []
+        self._pending_closed_orders = []
+
     def __repr__(self):
         return """
     {class_name}(
@@ -40,19 +62,51 @@ class BlotterLive(Blotter):
                        orders=self.orders,
                        new_orders=self.new_orders)
 
+    def _consume_journal(self):
+        self.broker.sync_order_journal()
+        events, self._journal_cursor = self._journal.read(
+            self._journal_cursor, consumer=self)
+
+        for event_type, obj in events:
+            if event_type == TRANSACTION_EVENT:
+                self._pending_transactions.append(obj)
+                continue
+
+            assert event_type == ORDER_EVENT
+            order = obj
+            self._orders[order.id] = order
+            asset_orders = self._open_orders[order.asset]
+            if order.open:
+                asset_orders[order.id] = order
+                continue
+
+            asset_orders.pop(order.id, None)
+            if not asset_orders:
+                del self._open_orders[order.asset]
+            if order.id not in self._closed_order_ids:
+                self._closed_order_ids.add(order.id)
+                self._pending_closed_orders.append(order)
+
     @property
     def orders(self):
-        return self.broker.orders
+        if self._journal is None:
+            return self.broker.orders
+
+        self._consume_journal()
+        return self._orders
 
     @property
     def open_orders(self):
-        assets = set([order.asset for order in itervalues(self.orders)
-                      if order.open])
-        return {
-            asset: [order for order in itervalues(self.orders)
-                    if order.asset == asset and order.open]
-            for asset in assets
-        }
+        if self._journal is None:
+            open_orders = defaultdict(list)
+            for order in itervalues(self.orders):
+                if order.open:
+                    open_orders[order.asset].append(order)
+            return dict(open_orders)
+
+        self._consume_journal()
+        return {asset: list(itervalues(orders))
+                for asset, orders in self._open_orders.items()}
 
     @expect_types(asset=Asset)
     def order(self, asset, amount, style, order_id=None):
@@ -81,21 +135,37 @@ class BlotterLive(Blotter):
     def get_transactions(self, bar_data):
         # All returned values from this function are delta between
         # the previous and actual call.
+        if self._journal is not None:
+            self._consume_journal()
+            new_transactions = self._pending_transactions
+            new_closed_orders = self._pending_closed_orders
+            self._pending_transactions = []
+            self._pending_closed_orders = []
+
+            new_commissions = [{'asset': tx.asset,
+                                'cost': tx.commission,
+                                'order': self._orders[tx.order_id]}
+                               for tx in new_transactions]
+
+            return new_transactions, new_commissions, new_closed_orders
+
         def _list_delta(lst_a, lst_b):
-            return [elem for elem in lst_a if elem not in set(lst_b)]
+            lst_b = set(lst_b)
+            return [elem for elem in lst_a if elem not in lst_b]
 
         all_transactions = list(self.broker.transactions.values())
         new_transactions = _list_delta(all_transactions,
                                        self._processed_transactions)
         self._processed_transactions = all_transactions
 
+        orders = self.orders
         new_commissions = [{'asset': tx.asset,
                             'cost': tx.commission,
-                            'order': self.orders[tx.order_id]}
+                            'order': orders[tx.order_id]}
                            for tx in new_transactions]
 
         all_closed_orders = [order
-                             for order in itervalues(self.orders)
+                             for order in itervalues(orders)
                              if not order.open]
         new_closed_orders = _list_delta(all_closed_orders,
                                         self._processed_closed_orders)
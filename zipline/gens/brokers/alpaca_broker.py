@@ -12,93 +12,458 @@
 # limitations under the License.
 
 import alpaca_trade_api as tradeapi
-from zipline.gens.brokers.broker import Broker
+from alpaca_trade_api.entity import Order as AlpacaOrder
+from zipline.gens.brokers.broker import Broker, OrderJournal
 import zipline.protocol as zp
 from zipline.finance.order import (Order as ZPOrder,
                                    ORDER_STATUS as ZP_ORDER_STATUS)
+from zipline.finance.transaction import Transaction
 from zipline.finance.execution import (MarketOrder,
                                        LimitOrder,
                                        StopOrder,
                                        StopLimitOrder)
-from zipline.api import symbol as symbol_lookup
+from zipline.api import (symbol as symbol_lookup,
+                         symbols as symbols_lookup)
 from zipline.errors import SymbolNotFound
 import pandas as pd
+import numpy as np
 import uuid
+import json
+import os
+import threading
+from collections import deque, namedtuple
+from time import sleep
 
 from logbook import Logger
 import sys
 
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
 if sys.version_info > (3,):
     long = int
 
 log = Logger('Alpaca Broker')
 NY = 'America/New_York'
 
+_stream_reconnect_delay = 5  # Seconds
+_bar_fields = ('open', 'high', 'low', 'close', 'volume')
+
+AccountSnapshot = namedtuple('AccountSnapshot', ['account', 'positions'])
+
+
+class _SymbolTape(object):
+    """In-memory market data of a single symbol fed by the stream.
+
+    Minute bars are kept in a ring buffer of ``maxlen`` entries, each entry
+    being a ``(dt, open, high, low, close, volume)`` tuple.
+    """
+    __slots__ = ('bars', 'last_price', 'last_size', 'last_trade_dt',
+                 'bid_price', 'ask_price', 'last_quote_dt')
+
+    def __init__(self, maxlen):
+        self.bars = deque(maxlen=maxlen)
+        self.last_price = None
+        self.last_size = None
+        self.last_trade_dt = None
+        self.bid_price = None
+        self.ask_price = None
+        self.last_quote_dt = None
+
+    def add_bar(self, dt, open_, high, low, close, volume):
+        bar = (dt, open_, high, low, close, volume)
+        if self.bars and self.bars[-1][0] == dt:
+            # Updated version of the last bar
+            self.bars[-1] = bar
+        elif not self.bars or self.bars[-1][0] < dt:
+            self.bars.append(bar)
+
+    def bar_field(self, field):
+        if not self.bars:
+            return None
+        return self.bars[-1][1 + _bar_fields.index(field)]
+
+
+class AlpacaStream(object):
+    """Websocket market data stream for Alpaca.
+
+    Subscribes to the trade (``T.``), quote (``Q.``) and minute bar
+    (``AM.``) channels of the requested symbols and keeps the received data
+    in per-symbol ring buffers, so readers are served from local memory.
+
+    If ``on_trade_update`` is given, the account's ``trade_updates``
+    channel is listened too and the callback is called with the data of
+    each order event.
+
+    The connection is made through ``connect`` (defaults to
+    ``websocket.create_connection``) which makes it possible to run the
+    stream against a local fake server in tests.
+    """
+
+    def __init__(self,
+                 url,
+                 key_id,
+                 secret_key,
+                 bar_buffer_size=500,
+                 connect=None,
+                 on_trade_update=None):
+        if connect is None:
+            if websocket is None:
+                raise ImportError(
+                    "websocket-client is required for Alpaca streaming")
+            connect = websocket.create_connection
+        self.url = url
+        self._key_id = key_id
+        self._secret_key = secret_key
+        self._connect = connect
+        self._on_trade_update = on_trade_update
+        self._bar_buffer_size = bar_buffer_size
+        self._tapes = {}
+        self._symbols = []
+        self._lock = threading.RLock()
+        self._ws = None
+        self._thread = None
+        self._running = False
+
+    @property
+    def symbols(self):
+        return list(self._symbols)
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._open()
+        self._thread = threading.Thread(target=self._run,
+                                        name='AlpacaStream')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+
+    def _open(self):
+        log.info("Connecting to stream: {}".format(self.url))
+        self._ws = self._connect(self.url)
+        self._send('authenticate', {'key_id': self._key_id,
+                                    'secret_key': self._secret_key})
+        if self._on_trade_update is not None:
+            self._send('listen', {'streams': ['trade_updates']})
+        if self._symbols:
+            self._listen(self._symbols)
+
+    def _send(self, action, data):
+        self._ws.send(json.dumps({'action': action, 'data': data}))
+
+    def _listen(self, symbols):
+        streams = []
+        for symbol in symbols:
+            streams.extend(['T.' + symbol, 'Q.' + symbol, 'AM.' + symbol])
+        self._send('listen', {'streams': streams})
+
+    def subscribe(self, symbols):
+        """Subscribe to the data channels of the given symbols.
+
+        Returns the list of symbols which were not subscribed before.
+        """
+        with self._lock:
+            new_symbols = [s for s in symbols if s not in self._tapes]
+            for symbol in new_symbols:
+                self._tapes[symbol] = _SymbolTape(self._bar_buffer_size)
+                self._symbols.append(symbol)
+        if new_symbols and self._ws is not None:
+            self._listen(new_symbols)
+        return new_symbols
+
+    def _run(self):
+        while self._running:
+            try:
+                message = self._ws.recv()
+            except Exception as e:
+                if not self._running:
+                    return
+                log.error("Stream connection lost: {}".format(e))
+                self._reconnect()
+                continue
+            if message:
+                self.process_message(message)
+
+    def _reconnect(self):
+        while self._running:
+            sleep(_stream_reconnect_delay)
+            try:
+                self._open()
+                return
+            except Exception as e:
+                log.error("Stream reconnection failed: {}".format(e))
+
+    def process_message(self, message):
+        try:
+            msg = json.loads(message)
+            stream = msg.get('stream', '')
+            data = msg.get('data', {})
+        except (ValueError, AttributeError):
+            log.warning("Malformed stream message: {}".format(message))
+            return
+
+        if stream == 'trade_updates':
+            if self._on_trade_update is not None:
+                self._on_trade_update(data)
+            return
+
+        channel, _, symbol = stream.partition('.')
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is None:
+                if channel not in ('authorization', 'listening'):
+                    log.debug("Ignored stream message: {}".format(stream))
+                return
+            if channel == 'T':
+                tape.last_price = float(data['p'])
+                tape.last_size = int(data['s'])
+                tape.last_trade_dt = pd.to_datetime(data['t'], unit='ms',
+                                                    utc=True)
+            elif channel == 'Q':
+                tape.bid_price = float(data['bp'])
+                tape.ask_price = float(data['ap'])
+                tape.last_quote_dt = pd.to_datetime(data['t'], unit='ms',
+                                                    utc=True)
+            elif channel == 'AM':
+                tape.add_bar(pd.to_datetime(data['s'], unit='ms', utc=True),
+                             float(data['o']), float(data['h']),
+                             float(data['l']), float(data['c']),
+                             int(data['v']))
+
+    def seed_bars(self, symbol, bars):
+        """Pre-fill the bar buffer of ``symbol`` from REST bar entities."""
+        with self._lock:
+            tape = self._tapes[symbol]
+            for bar in bars:
+                raw = bar._raw
+                dt = pd.Timestamp(raw['time'])
+                if dt.tz is None:
+                    dt = dt.tz_localize(NY)
+                tape.add_bar(dt.tz_convert('UTC'),
+                             float(raw['open']), float(raw['high']),
+                             float(raw['low']), float(raw['close']),
+                             int(raw['volume']))
+
+    def spot_values(self, symbols, field):
+        """Current values of ``field`` for ``symbols``.
+
+        Returns None if any of the symbols has not received the data yet.
+        """
+        values = []
+        with self._lock:
+            for symbol in symbols:
+                tape = self._tapes.get(symbol)
+                if tape is None:
+                    return None
+                if field == 'price':
+                    value = tape.last_price
+                    if value is None:
+                        value = tape.bar_field('close')
+                elif field == 'last_traded':
+                    value = tape.last_trade_dt
+                    if value is None and tape.bars:
+                        value = tape.bars[-1][0]
+                else:
+                    value = tape.bar_field(field)
+                if value is None:
+                    return None
+                values.append(value)
+        return values
+
+    def bars_frame(self, symbol):
+        """Buffered minute bars of ``symbol`` as an OHLCV DataFrame."""
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            rows = list(tape.bars) if tape is not None else []
+        if not rows:
+            return None
+        dts = [row[0] for row in rows]
+        data = np.array([row[1:] for row in rows], dtype=np.float64)
+        return pd.DataFrame(data,
+                            index=pd.DatetimeIndex(dts),
+                            columns=list(_bar_fields))
+
 
 class ALPACABroker(Broker):
     '''
     Broker class for Alpaca.
-    The uri parameter is not used. Instead, the API key must be
-    set via environment variables (APCA_API_KEY_ID and APCA_API_SECRET_KEY).
+    The uri parameter is only used to enable streaming (see below).
+    The API key must be set via environment variables (APCA_API_KEY_ID and
+    APCA_API_SECRET_KEY).
     Orders are identified by the UUID (v4) generated here and
     associated in the broker side using client_order_id attribute.
-    Currently this class makes use of REST API only, but websocket
-    streaming can possibly used too.
+
+    By default market data is requested through the REST API on every
+    call. With ``streaming=True`` (or ``stream`` passed as the uri) the
+    broker subscribes to the websocket trade, quote and minute bar channels
+    and serves ``get_spot_value``, ``get_last_traded_dt`` and minutely
+    ``get_realtime_bars`` from local memory, falling back to REST only for
+    data not received yet. The order updates of the account are streamed
+    too and recorded to the ``order_journal`` consumed by the blotter.
     '''
 
-    def __init__(self, uri):
+    batch_spot_values = True
+
+    def __init__(self,
+                 uri,
+                 streaming=False,
+                 stream_url=None,
+                 bar_buffer_size=500,
+                 stream_connect=None):
         self._api = tradeapi.REST()
+        self._stream = None
+        self._subscribed_assets = set()
+        self._bar_cache = {}
+        self._bar_cache_expiry = {}
+        self._bar_cache_size = bar_buffer_size
+        self._asset_memo = {}
+        self._snapshot = None
+        self._snapshot_expiry = None
+        if streaming or uri == 'stream':
+            if stream_url is None:
+                base_url = os.environ.get('APCA_API_BASE_URL',
+                                          'https://api.alpaca.markets')
+                stream_url = base_url.replace('http', 'ws', 1).rstrip('/') \
+                    + '/stream'
+            self.order_journal = OrderJournal()
+            self._trade_updates = deque()
+            self._filled_qty = {}
+            # The stream only reports the orders placed before a restart
+            # once they change again, so the journal starts from the listed
+            # orders. They are recorded by the first sync, as the symbol
+            # lookup requires the algorithm's thread.
+            self._listed_orders = deque(self._api.list_orders(status='all'))
+            for order in self._listed_orders:
+                self._filled_qty[order.client_order_id] = \
+                    int(order.filled_qty or 0)
+            self._stream = AlpacaStream(
+                stream_url,
+                key_id=os.environ.get('APCA_API_KEY_ID'),
+                secret_key=os.environ.get('APCA_API_SECRET_KEY'),
+                bar_buffer_size=bar_buffer_size,
+                connect=stream_connect,
+                on_trade_update=self._trade_updates.append)
+            self._stream.start()
 
     def subscribe_to_market_data(self, asset):
-        '''Do nothing to comply the interface'''
-        pass
+        '''Subscribe to the streamed data of the asset(s).
+        Does nothing if streaming is not enabled.'''
+        if self._stream is None:
+            return
+        assets = asset if isinstance(asset, (list, set, tuple)) else [asset]
+        new_assets = [a for a in assets if a not in self._subscribed_assets]
+        if not new_assets:
+            return
+        new_symbols = self._stream.subscribe([a.symbol for a in new_assets])
+        self._subscribed_assets.update(new_assets)
+        if new_symbols:
+            # The stream only delivers bars from now on, fill the buffers
+            # with the recent history once.
+            bars_list = self._api.list_bars(new_symbols, '1Min',
+                                            limit=self._bar_cache_size)
+            for asset_bars in bars_list:
+                self._stream.seed_bars(asset_bars.symbol, asset_bars.bars)
 
     def subscribed_assets(self):
-        '''Do nothing to comply the interface'''
-        return []
+        return list(self._subscribed_assets)
 
-    @property
-    def positions(self):
-        z_positions = zp.Positions()
-        positions = self._api.list_positions()
-        position_map = {}
-        symbols = []
-        for pos in positions:
-            symbol = pos.symbol
+    def _lookup_assets(self, symbols):
+        """Resolve symbols to assets, None for the unknown ones.
+
+        Each symbol is resolved once for the lifetime of the broker, the
+        not yet seen ones are looked up in bulk.
+        """
+        unresolved = [symbol for symbol in set(symbols)
+                      if symbol not in self._asset_memo]
+        if len(unresolved) > 1:
+            try:
+                assets = symbols_lookup(*unresolved)
+            except SymbolNotFound:
+                # Fall back to one by one lookup to find the unknown ones
+                pass
+            else:
+                self._asset_memo.update(zip(unresolved, assets))
+                unresolved = []
+        for symbol in unresolved:
             try:
-                z_position = zp.Position(symbol_lookup(symbol))
+                self._asset_memo[symbol] = symbol_lookup(symbol)
             except SymbolNotFound:
+                self._asset_memo[symbol] = None
+        return [self._asset_memo[symbol] for symbol in symbols]
+
+    def _account_snapshot(self):
+        """Account and positions of the current bar.
+
+        Fetched with a single account, positions and quotes request and
+        shared by ``portfolio``, ``account`` and ``positions`` until the next
+        minute boundary or until an order is placed or cancelled.
+        """
+        now = self._now()
+        if self._snapshot is not None and self._snapshot_expiry > now:
+            return self._snapshot
+
+        account = self._api.get_account()
+        positions = self._api.list_positions()
+
+        z_positions = zp.Positions()
+        position_map = {}
+        symbols = [pos.symbol for pos in positions]
+        for pos, asset in zip(positions, self._lookup_assets(symbols)):
+            if asset is None:
                 continue
-            z_position.amount = pos.qty
+            z_position = zp.Position(asset)
+            z_position.amount = int(pos.qty)
             z_position.cost_basis = float(pos.cost_basis)
             z_position.last_sale_price = None
             z_position.last_sale_date = None
-            z_positions[symbol_lookup(symbol)] = z_position
-            symbols.append(symbol)
-            position_map[symbol] = z_position
-
-        quotes = self._api.list_quotes(symbols)
-        for quote in quotes:
-            price = quote.last
-            dt = quote.last_timestamp
-            z_position = position_map[quote.symbol]
-            z_position.last_sale_price = float(price)
-            z_position.last_sale_date = dt
-        return z_positions
+            z_positions[asset] = z_position
+            position_map[pos.symbol] = z_position
+
+        if position_map:
+            quotes = self._api.list_quotes(list(position_map))
+            for quote in quotes:
+                z_position = position_map[quote.symbol]
+                z_position.last_sale_price = float(quote.last)
+                z_position.last_sale_date = quote.last_timestamp
+
+        self._snapshot = AccountSnapshot(account=account,
+                                         positions=z_positions)
+        self._snapshot_expiry = now.floor('1 min') + pd.Timedelta('1 min')
+        return self._snapshot
+
+    def _invalidate_account_snapshot(self):
+        self._snapshot = None
+
+    @property
+    def positions(self):
+        return self._account_snapshot().positions
 
     @property
     def portfolio(self):
-        account = self._api.get_account()
+        snapshot = self._account_snapshot()
+        account = snapshot.account
         z_portfolio = zp.Portfolio()
         z_portfolio.cash = float(account.cash)
-        z_portfolio.positions = self.positions
+        z_portfolio.positions = snapshot.positions
         z_portfolio.positions_value = float(
             account.portfolio_value) - float(account.cash)
         return z_portfolio
 
     @property
     def account(self):
-        account = self._api.get_account()
+        account = self._account_snapshot().account
         z_account = zp.Account()
         z_account.buying_power = float(account.cash)
         z_account.total_position_value = float(
@@ -117,9 +482,12 @@ class ALPACABroker(Broker):
             return False
 
     def _order2zp(self, order):
+        asset = self._lookup_assets([order.symbol])[0]
+        if asset is None:
+            raise SymbolNotFound(symbol=order.symbol)
         zp_order = ZPOrder(
             id=order.client_order_id,
-            asset=symbol_lookup(order.symbol),
+            asset=asset,
             amount=int(order.qty) if order.side == 'buy' else -int(order.qty),
             stop=float(order.stop_price) if order.stop_price else None,
             limit=float(order.limit_price) if order.limit_price else None,
@@ -136,6 +504,51 @@ class ALPACABroker(Broker):
             zp_order.filled = int(order.filled_qty)
         return zp_order
 
+    def sync_order_journal(self):
+        # The trade updates are queued by the stream thread and processed
+        # here, as the symbol lookup requires the algorithm's thread.
+        if self.order_journal is None:
+            return
+        while self._listed_orders:
+            try:
+                zp_order = self._order2zp(self._listed_orders.popleft())
+            except SymbolNotFound:
+                continue
+            self.order_journal.record_order(zp_order)
+            if zp_order.filled:
+                # The cached positions may predate the fill
+                self._invalidate_account_snapshot()
+        while self._trade_updates:
+            self._process_trade_update(self._trade_updates.popleft())
+
+    def _process_trade_update(self, data):
+        try:
+            zp_order = self._order2zp(AlpacaOrder(data['order']))
+        except SymbolNotFound:
+            return
+
+        sign = 1 if zp_order.amount > 0 else -1
+        filled_qty = int(data['order'].get('filled_qty') or 0)
+        if filled_qty and data.get('event') == 'partial_fill':
+            zp_order.filled = sign * filled_qty
+        self.order_journal.record_order(zp_order)
+
+        new_qty = filled_qty - self._filled_qty.get(zp_order.id, 0)
+        if new_qty > 0 and data.get('event') in ('fill', 'partial_fill'):
+            self._filled_qty[zp_order.id] = filled_qty
+            price = data.get('price') or \
+                data['order'].get('filled_avg_price')
+            self.order_journal.record_transaction(Transaction(
+                asset=zp_order.asset,
+                amount=sign * new_qty,
+                dt=pd.Timestamp(data['timestamp']),
+                price=float(price),
+                order_id=zp_order.id,
+                commission=0,
+            ))
+            # The fill changes the positions and cash of the account
+            self._invalidate_account_snapshot()
+
     def _new_order_id(self):
         return uuid.uuid4().hex
 
@@ -177,32 +590,43 @@ class ALPACABroker(Broker):
             stop_price=stop_price,
             client_order_id=zp_order.id,
         )
+        self._invalidate_account_snapshot()
         zp_order = self._order2zp(order)
+        if self.order_journal is not None:
+            self.order_journal.record_order(zp_order)
         return zp_order
 
-    @property
-    def orders(self):
+    def _orders2zp(self, orders):
+        # Resolve the symbols of all orders at once
+        self._lookup_assets([o.symbol for o in orders])
         return {
             o.client_order_id: self._order2zp(o)
-            for o in self._api.list_orders()
+            for o in orders
         }
 
+    @property
+    def orders(self):
+        return self._orders2zp(self._api.list_orders())
+
     @property
     def transactions(self):
-        return {
-            o.client_order_id: self._order2zp(o)
-            for o in self._api.list_orders(status='all')
-        }
+        return self._orders2zp(self._api.list_orders(status='all'))
 
     def cancel_order(self, zp_order_id):
         try:
             order = self._api.get_order_by_client_order_id(zp_order_id)
             self._api.cancel_order(order.id)
+            self._invalidate_account_snapshot()
         except Exception as e:
             log.error(e)
             return
 
     def get_last_traded_dt(self, asset):
+        if self._stream is not None:
+            self.subscribe_to_market_data(asset)
+            values = self._stream.spot_values([asset.symbol], 'last_traded')
+            if values is not None:
+                return values[0]
         quote = self._api.get_quote(asset.symbol)
         return pd.Timestamp(quote.last_timestamp)
 
@@ -214,6 +638,11 @@ class ALPACABroker(Broker):
             symbols = [assets.symbol]
         else:
             symbols = [asset.symbol for asset in assets]
+        if self._stream is not None:
+            self.subscribe_to_market_data(assets)
+            values = self._stream.spot_values(symbols, field)
+            if values is not None:
+                return values[0] if assets_is_scalar else values
         if field in ('price', 'last_traded'):
             quotes = self._api.list_quotes(symbols)
             if assets_is_scalar:
@@ -236,24 +665,82 @@ class ALPACABroker(Broker):
             for symbol in symbols
         ]
 
-    def get_realtime_bars(self, assets, data_frequency):
-        # TODO: cache the result. The caller
-        # (DataPortalLive#get_history_window) makes use of only one
-        # column at a time.
+    @staticmethod
+    def _now():
+        return pd.to_datetime('now', utc=True)
+
+    def _list_bars_cached(self, symbols, timeframe):
+        """Bars of ``symbols`` as a dict of DataFrames.
+
+        The result of each (symbol, timeframe) pair is cached until the next
+        minute boundary. Expired entries are refreshed incrementally with the
+        bars since the last cached one, so a symbol is requested at most once
+        per minute, whichever column the caller needs.
+        """
+        now = self._now()
+        frames = {}
+        missing, stale = [], []
+        for symbol in symbols:
+            key = (symbol, timeframe)
+            if key not in self._bar_cache:
+                missing.append(symbol)
+            elif self._bar_cache_expiry[key] <= now:
+                stale.append(symbol)
+            else:
+                frames[symbol] = self._bar_cache[key]
+
+        if missing:
+            for asset_bars in self._api.list_bars(missing, timeframe,
+                                                  limit=self._bar_cache_size):
+                frames[asset_bars.symbol] = asset_bars.df
+
+        if stale:
+            start_dt = min(self._bar_cache[(symbol, timeframe)].index[-1]
+                           for symbol in stale)
+            new_bars = {
+                asset_bars.symbol: asset_bars.df
+                for asset_bars in self._api.list_bars(
+                    stale, timeframe, start_dt=start_dt.isoformat())
+            }
+            for symbol in stale:
+                df = self._bar_cache[(symbol, timeframe)]
+                new_df = new_bars.get(symbol)
+                if new_df is not None and not new_df.empty:
+                    # The last cached bar might have been partial
+                    df = pd.concat([df[df.index < new_df.index[0]], new_df])
+                    df = df.iloc[-self._bar_cache_size:]
+                frames[symbol] = df
+
+        expiry = now.floor('1 min') + pd.Timedelta('1 min')
+        for symbol in missing + stale:
+            if symbol in frames:
+                self._bar_cache[(symbol, timeframe)] = frames[symbol]
+                self._bar_cache_expiry[(symbol, timeframe)] = expiry
+        return frames
+
+    def get_realtime_bars(self, assets, data_frequency, bar_count=None):
         assets_is_scalar = not isinstance(assets, (list, set, tuple))
         is_daily = 'd' in data_frequency  # 'daily' or '1d'
         if assets_is_scalar:
-            symbols = [assets.symbol]
-        else:
-            symbols = [asset.symbol for asset in assets]
+            assets = [assets]
+        symbols = [asset.symbol for asset in assets]
         timeframe = '1D' if is_daily else '1Min'
 
-        bars_list = self._api.list_bars(symbols, timeframe, limit=500)
-        bars_map = {a.symbol: a for a in bars_list}
-        dfs = []
-        for asset in assets if not assets_is_scalar else [assets]:
-            symbol = asset.symbol
-            df = bars_map[symbol].df.copy()
-            df.columns = pd.MultiIndex.from_product([[asset, ], df.columns])
-            dfs.append(df)
-        return pd.concat(dfs, axis=1)
+        frames = {}
+        if self._stream is not None and not is_daily:
+            self.subscribe_to_market_data(assets)
+            for symbol in symbols:
+                df = self._stream.bars_frame(symbol)
+                if df is not None:
+                    frames[symbol] = df
+
+        missing = [symbol for symbol in symbols if symbol not in frames]
+        if missing:
+            frames.update(self._list_bars_cached(missing, timeframe))
+
+        # Asset as level 0 column, open, high, low, close, volume as level 1
+        return pd.concat([frames[symbol] if bar_count is None
+                          else frames[symbol].iloc[-bar_count:]
+                          for symbol in symbols],
+                         axis=1,
+                         keys=list(assets))
@@ -12,11 +12,101 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections import deque
+from itertools import islice
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+from logbook import Logger
+from six import itervalues
+
+log = Logger('Broker')
+
+ORDER_EVENT = 'order'
+TRANSACTION_EVENT = 'transaction'
+
+
+class OrderJournal(object):
+    """Log of order updates and transactions.
+
+    Brokers record the orders as they are created or change state and the
+    transactions as they are executed. Consumers keep an integer cursor and
+    read only the events recorded since their previous read.
+
+    Consumers which pass themselves to ``read`` are tracked, and the events
+    which all of them have read are dropped, so a long running journal only
+    holds the events which are still unread. At most ``max_unread`` unread
+    events are kept, the oldest ones are dropped beyond that, so a journal
+    which no consumer reads, or which one stopped reading, stays bounded.
+    """
+
+    def __init__(self, max_unread=10000):
+        self._max_unread = max_unread
+        self._events = deque()
+        # The number of events dropped from the front of ``_events``.
+        self._offset = 0
+        self._cursors = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def __len__(self):
+        return self._offset + len(self._events)
+
+    def record_order(self, order):
+        self._record((ORDER_EVENT, order))
+
+    def record_transaction(self, transaction):
+        self._record((TRANSACTION_EVENT, transaction))
+
+    def _record(self, event):
+        with self._lock:
+            self._events.append(event)
+            if len(self._events) > self._max_unread:
+                if self._cursors and \
+                        min(itervalues(self._cursors)) <= self._offset:
+                    log.warning("Dropping unread order journal events, "
+                                "more than {} are pending".format(
+                                    self._max_unread))
+                self._events.popleft()
+                self._offset += 1
+
+    def read(self, cursor, consumer=None):
+        """Return the events after ``cursor`` and the new cursor.
+
+        If ``consumer`` is given, the events it has read are dropped once
+        every other consumer has read them too.
+        """
+        with self._lock:
+            start = max(cursor - self._offset, 0)
+            events = list(islice(self._events, start, None))
+            cursor = self._offset + len(self._events)
+            if consumer is not None:
+                self._cursors[consumer] = cursor
+                self._trim()
+        return events, cursor
+
+    def _trim(self):
+        read_by_all = min(itervalues(self._cursors))
+        while self._offset < read_by_all:
+            self._events.popleft()
+            self._offset += 1
 
 
 class Broker(object):
     __metaclass__ = ABCMeta
 
+    # Brokers pushing their order updates set this to an OrderJournal
+    order_journal = None
+
+    # Brokers whose get_spot_value accepts a list of assets, and returns a
+    # list of values, set this to True
+    batch_spot_values = False
+
+    def sync_order_journal(self):
+        """Record the order updates received since the last call to the
+        order journal. Brokers recording from their callbacks directly need
+        not override this."""
+        pass
+
     @abstractmethod
     def subscribe_to_market_data(self, asset):
         pass
@@ -69,5 +159,5 @@ class Broker(object):
         pass
 
     @abstractmethod
-    def get_realtime_bars(self, assets, frequency):
+    def get_realtime_bars(self, assets, frequency, bar_count=None):
         pass
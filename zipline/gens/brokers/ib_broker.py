@@ -12,15 +12,16 @@
 # limitations under the License.
 
 import sys
-from collections import namedtuple, defaultdict, OrderedDict
-from time import sleep
+from collections import namedtuple, defaultdict, OrderedDict, deque
+from threading import Event, Lock
+from time import sleep, time
 from math import fabs
 
-from six import iteritems
+from six import iteritems, string_types
 import pandas as pd
 import numpy as np
 
-from zipline.gens.brokers.broker import Broker
+from zipline.gens.brokers.broker import Broker, OrderJournal
 from zipline.finance.order import (Order as ZPOrder,
                                    ORDER_STATUS as ZP_ORDER_STATUS)
 from zipline.finance.execution import (MarketOrder,
@@ -52,7 +53,11 @@ Position = namedtuple('Position', ['contract', 'position', 'market_price',
                                    'account_name'])
 
 _connection_timeout = 15  # Seconds
+_market_data_timeout = 30  # Seconds
+_max_requests_per_second = 45  # TWS allows 50 messages per second
 _poll_frequency = 0.1
+_minute_bar_window = 1440  # Sealed minute bars kept per symbol
+_minute_ns = 60 * 10 ** 9
 
 
 symbol_to_exchange = defaultdict(lambda: 'SMART')
@@ -74,6 +79,274 @@ symbol_to_sec_type['GVZ'] = 'IND'
 symbol_to_sec_type['SPX'] = 'IND'
 
 
+class TickBuffer(object):
+    """Columnar store of the RTVolume ticks of a single symbol.
+
+    The ticks are appended to preallocated NumPy arrays which are doubled in
+    size when full, so appending costs amortized constant time regardless of
+    the number of ticks stored. The ``last_trade_*``, ``total_volume``,
+    ``vwap`` and ``single_trade_flag`` properties return views of the
+    filled part of the columns; trade times are stored as UTC nanoseconds.
+
+    ``drop_before`` discards the ticks which are no longer needed, the
+    columns are then replaced under a lock so readers on other threads never
+    see the columns of the trimmed buffer with its former size.
+    """
+
+    def __init__(self, capacity=1024):
+        self._lock = Lock()
+        self._size = 0
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._sizes = np.empty(capacity, dtype=np.int64)
+        self._times = np.empty(capacity, dtype=np.int64)
+        self._volumes = np.empty(capacity, dtype=np.int64)
+        self._vwaps = np.empty(capacity, dtype=np.float64)
+        self._flags = np.empty(capacity, dtype=np.bool_)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def empty(self):
+        return self._size == 0
+
+    @property
+    def capacity(self):
+        return len(self._prices)
+
+    def _grow(self):
+        capacity = 2 * self.capacity
+        for name in ('_prices', '_sizes', '_times', '_volumes', '_vwaps',
+                     '_flags'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def drop_before(self, time_ns, min_dropped=1):
+        """Drop the ticks traded before ``time_ns`` if there are at least
+        ``min_dropped`` of them.
+
+        Returns the number of ticks dropped.
+        """
+        n = self._size
+        if not 0 < min_dropped <= n:
+            return 0
+        # Ticks mostly arrive in order, the buffer can't free enough if the
+        # min_dropped-th tick is recent
+        if self._times[min_dropped - 1] >= time_ns:
+            return 0
+        keep = self._times[:n] >= time_ns
+        kept = int(keep.sum())
+        if n - kept < min_dropped:
+            return 0
+        columns = {}
+        for name in ('_prices', '_sizes', '_times', '_volumes', '_vwaps',
+                     '_flags'):
+            old = getattr(self, name)
+            new = np.empty(len(old), dtype=old.dtype)
+            new[:kept] = old[:n][keep]
+            columns[name] = new
+        with self._lock:
+            for name, new in iteritems(columns):
+                setattr(self, name, new)
+            self._size = kept
+        return n - kept
+
+    def _filled(self, name):
+        with self._lock:
+            return getattr(self, name)[:self._size]
+
+    def append(self, price, size, time, volume, vwap, single_trade_flag):
+        i = self._size
+        if i == self.capacity:
+            self._grow()
+        self._prices[i] = price
+        self._sizes[i] = size
+        self._times[i] = time
+        self._volumes[i] = volume
+        self._vwaps[i] = vwap
+        self._flags[i] = single_trade_flag
+        # Readers see the tick only after all of its fields are written
+        self._size = i + 1
+
+    @property
+    def last_trade_price(self):
+        return self._filled('_prices')
+
+    @property
+    def last_trade_size(self):
+        return self._filled('_sizes')
+
+    @property
+    def last_trade_time(self):
+        return self._filled('_times')
+
+    @property
+    def total_volume(self):
+        return self._filled('_volumes')
+
+    @property
+    def vwap(self):
+        return self._filled('_vwaps')
+
+    @property
+    def single_trade_flag(self):
+        return self._filled('_flags')
+
+    @property
+    def last_price(self):
+        prices = self._filled('_prices')
+        return prices[-1] if len(prices) else np.NaN
+
+    @property
+    def last_time(self):
+        times = self._filled('_times')
+        if not len(times):
+            return pd.NaT
+        return pd.Timestamp(times[-1], tz='UTC')
+
+    def ohlcv(self, freq):
+        """Aggregate the ticks to OHLCV bars of ``freq`` (a Timedelta).
+
+        The bars are labeled with their start and span the range between the
+        first and the last tick; bars without ticks are NaN.
+        """
+        with self._lock:
+            n = self._size
+            times = self._times[:n]
+            prices = self._prices[:n]
+            sizes = self._sizes[:n]
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        if not n:
+            return pd.DataFrame(columns=columns,
+                                index=pd.DatetimeIndex([], tz='UTC'))
+
+        if n > 1 and (np.diff(times) < 0).any():
+            order = np.argsort(times, kind='mergesort')
+            times, prices, sizes = times[order], prices[order], sizes[order]
+
+        freq_ns = pd.Timedelta(freq).value
+        buckets = times // freq_ns
+        starts = np.r_[0, np.flatnonzero(np.diff(buckets)) + 1]
+        ends = np.r_[starts[1:], n]
+
+        first = buckets[0]
+        positions = buckets[starts] - first
+        length = buckets[-1] - first + 1
+        data = np.full((length, len(columns)), np.NaN)
+        data[positions, 0] = prices[starts]
+        data[positions, 1] = np.maximum.reduceat(prices, starts)
+        data[positions, 2] = np.minimum.reduceat(prices, starts)
+        data[positions, 3] = prices[ends - 1]
+        data[positions, 4] = np.add.reduceat(sizes, starts)
+
+        index = pd.to_datetime((first + np.arange(length)) * freq_ns,
+                               utc=True)
+        return pd.DataFrame(data, index=index, columns=columns)
+
+
+class MinuteBarAggregator(object):
+    """Streaming minute OHLCV bars of a single symbol.
+
+    Each tick updates the currently open bar. When a tick of a later minute
+    arrives the open bar is sealed into a ring buffer of the last ``window``
+    bars, so the last N bars are served by an O(N) slice instead of
+    re-aggregating the ticks of the day.
+    """
+
+    def __init__(self, window=_minute_bar_window):
+        self._window = window
+        self._count = 0  # number of sealed bars ever
+        self._starts = np.empty(window, dtype=np.int64)
+        self._ohlcv = np.empty((window, 5), dtype=np.float64)
+        self._current_start = None
+        self._current = None
+
+    @property
+    def current_start(self):
+        return self._current_start
+
+    @property
+    def current_bar(self):
+        """(open, high, low, close, volume) of the open bar or None."""
+        return self._current
+
+    @property
+    def first_start(self):
+        """Start of the oldest bar kept (sealed or open) or None."""
+        if self._count > self._window:
+            return self._starts[self._count % self._window]
+        if self._count:
+            return self._starts[0]
+        return self._current_start
+
+    def add_tick(self, price, size, time_ns):
+        start = time_ns - time_ns % _minute_ns
+        current = self._current
+        if start == self._current_start:
+            self._current = (current[0],
+                             max(current[1], price),
+                             min(current[2], price),
+                             price,
+                             current[4] + size)
+        elif self._current_start is None or start > self._current_start:
+            if current is not None:
+                self._seal()
+            self._current_start = start
+            self._current = (price, price, price, price, size)
+        elif self._count and start == self._starts[
+                (self._count - 1) % self._window]:
+            # Late tick of the previously sealed bar
+            bar = self._ohlcv[(self._count - 1) % self._window]
+            bar[1] = max(bar[1], price)
+            bar[2] = min(bar[2], price)
+            bar[4] += size
+        else:
+            log.debug("Dropped out of order tick at {}".format(
+                pd.Timestamp(time_ns, tz='UTC')))
+
+    def _seal(self):
+        i = self._count % self._window
+        self._starts[i] = self._current_start
+        self._ohlcv[i] = self._current
+        self._count += 1
+
+    def bars(self, bar_count=None):
+        """The last ``bar_count`` bars including the open one as a DataFrame.
+
+        The index is contiguous minutes, minutes without ticks are NaN.
+        """
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        if self._current is None:
+            return pd.DataFrame(columns=columns,
+                                index=pd.DatetimeIndex([], tz='UTC'))
+
+        sealed = min(self._count, self._window)
+        if bar_count is not None:
+            sealed = min(sealed, bar_count - 1)
+        rows = (self._count - sealed + np.arange(sealed)) % self._window
+
+        starts = np.r_[self._starts[rows], self._current_start]
+        first = starts[0]
+        if bar_count is not None:
+            first = max(first, self._current_start -
+                        (bar_count - 1) * _minute_ns)
+            keep = starts >= first
+        else:
+            keep = slice(None)
+
+        length = (self._current_start - first) // _minute_ns + 1
+        data = np.full((length, len(columns)), np.NaN)
+        values = np.vstack([self._ohlcv[rows], self._current])
+        data[(starts[keep] - first) // _minute_ns] = values[keep]
+
+        index = pd.to_datetime(first + np.arange(length) * _minute_ns,
+                               utc=True)
+        return pd.DataFrame(data, index=index, columns=columns)
+
+
 def log_message(message, mapping):
     try:
         del (mapping['self'])
@@ -109,8 +382,11 @@ class TWSConnection(EClientSocket, EWrapper):
         self.managed_accounts = None
         self.symbol_to_ticker_id = {}
         self.ticker_id_to_symbol = {}
+        # Set when the first tick of the symbol arrives
+        self.market_data_ready = {}
         self.last_tick = defaultdict(dict)
         self.bars = {}
+        self.minute_bars = {}
         # accounts structure: accounts[account_id][currency][value]
         self.accounts = defaultdict(
             lambda: defaultdict(lambda: defaultdict(lambda: np.NaN)))
@@ -122,6 +398,9 @@ class TWSConnection(EClientSocket, EWrapper):
         self.executions = defaultdict(OrderedDict)
         self.commissions = defaultdict(OrderedDict)
         self._execution_to_order_id = {}
+        # Ids of the orders touched by the callbacks since the last
+        # consumption by IBBroker
+        self.order_updates = deque()
         self.time_skew = None
         self.unrecoverable_error = False
 
@@ -182,14 +461,13 @@ class TWSConnection(EClientSocket, EWrapper):
         self._next_order_id += 1
         return order_id
 
-    def subscribe_to_market_data(self,
-                                 symbol,
-                                 sec_type='STK',
-                                 exchange='SMART',
-                                 currency='USD'):
+    def request_market_data(self, symbol, currency='USD'):
+        """Send the market data request of ``symbol`` without waiting for
+        the data. Returns the event which is set when the first tick of the
+        symbol arrives."""
         if symbol in self.symbol_to_ticker_id:
             # Already subscribed to market data
-            return
+            return self.market_data_ready[symbol]
 
         contract = Contract()
         contract.m_symbol = symbol
@@ -198,6 +476,9 @@ class TWSConnection(EClientSocket, EWrapper):
         contract.m_currency = currency
         ticker_id = self.next_ticker_id
 
+        ready = self.market_data_ready[symbol] = Event()
+        if symbol in self.bars:
+            ready.set()
         self.symbol_to_ticker_id[symbol] = ticker_id
         self.ticker_id_to_symbol[ticker_id] = symbol
 
@@ -209,7 +490,34 @@ class TWSConnection(EClientSocket, EWrapper):
         else:
             tick_list = "233"  # RTVolume, return tick_type == 48
             self.reqMktData(ticker_id, contract, tick_list, False)
-            sleep(11)
+
+        return ready
+
+    def subscribe_to_market_data(self, symbols, timeout=_market_data_timeout):
+        """Subscribe to the market data of one or more symbols.
+
+        All the requests are sent first (respecting the TWS message rate
+        limit), then the first tick of every symbol is awaited for at most
+        ``timeout`` seconds in total.
+
+        Returns the list of symbols without data at the timeout.
+        """
+        if isinstance(symbols, string_types):
+            symbols = [symbols]
+
+        events = []
+        for symbol in symbols:
+            is_new = symbol not in self.symbol_to_ticker_id
+            events.append(self.request_market_data(symbol))
+            if is_new:
+                sleep(1.0 / _max_requests_per_second)
+
+        deadline = time() + timeout
+        for event in events:
+            event.wait(max(deadline - time(), 0))
+
+        return [symbol for symbol, event in zip(symbols, events)
+                if not event.is_set()]
 
     def _process_tick(self, ticker_id, tick_type, value):
         try:
@@ -232,27 +540,45 @@ class TWSConnection(EClientSocket, EWrapper):
             if len(last_trade_price) == 0:
                 return
 
-            last_trade_dt = pd.to_datetime(float(last_trade_time), unit='ms',
-                                           utc=True)
+            # Trade time is given in milliseconds since epoch
+            last_trade_time_ns = int(float(last_trade_time)) * 1000000
+
+            self._add_tick(symbol, float(last_trade_price),
+                           int(last_trade_size), last_trade_time_ns,
+                           int(total_volume), float(vwap),
+                           single_trade_flag == 'true')
 
-            self._add_bar(symbol, float(last_trade_price),
-                          int(last_trade_size), last_trade_dt,
-                          int(total_volume), float(vwap),
-                          single_trade_flag)
+    def _add_tick(self, symbol, last_trade_price, last_trade_size,
+                  last_trade_time_ns, total_volume, vwap, single_trade_flag):
+        try:
+            minute_bars = self.minute_bars[symbol]
+        except KeyError:
+            minute_bars = self.minute_bars[symbol] = MinuteBarAggregator()
+        minute_bars.add_tick(last_trade_price, last_trade_size,
+                             last_trade_time_ns)
+
+        try:
+            ticks = self.bars[symbol]
+        except KeyError:
+            ticks = self.bars[symbol] = TickBuffer()
+            if symbol in self.market_data_ready:
+                self.market_data_ready[symbol].set()
+        capacity = ticks.capacity
+        if len(ticks) == capacity:
+            # Make room from the ticks of the bars which are no longer kept
+            # by the aggregator. Compacting only when it frees half of the
+            # buffer, and growing it otherwise, keeps appends amortized
+            # constant time.
+            ticks.drop_before(minute_bars.first_start,
+                              min_dropped=capacity // 2)
+        ticks.append(last_trade_price, last_trade_size, last_trade_time_ns,
+                     total_volume, vwap, single_trade_flag)
 
     def _add_bar(self, symbol, last_trade_price, last_trade_size,
                  last_trade_time, total_volume, vwap, single_trade_flag):
-        bar = pd.DataFrame(index=pd.DatetimeIndex([last_trade_time]),
-                           data={'last_trade_price': last_trade_price,
-                                 'last_trade_size': last_trade_size,
-                                 'total_volume': total_volume,
-                                 'vwap': vwap,
-                                 'single_trade_flag': single_trade_flag})
-
-        if symbol not in self.bars:
-            self.bars[symbol] = bar
-        else:
-            self.bars[symbol] = self.bars[symbol].append(bar)
+        self._add_tick(symbol, last_trade_price, last_trade_size,
+                       pd.Timestamp(last_trade_time).value, total_volume,
+                       vwap, single_trade_flag)
 
     def tickPrice(self, ticker_id, field, price, can_auto_execute):
         self._process_tick(ticker_id, tick_type=field, value=price)
@@ -322,6 +648,7 @@ class TWSConnection(EClientSocket, EWrapper):
     def orderStatus(self, order_id, status, filled, remaining, avg_fill_price,
                     perm_id, parent_id, last_fill_price, client_id, why_held):
         self.order_statuses[order_id] = _method_params_to_dict(vars())
+        self.order_updates.append(order_id)
 
         log.debug(
             "Order-{order_id} {status}: "
@@ -339,6 +666,7 @@ class TWSConnection(EClientSocket, EWrapper):
 
     def openOrder(self, order_id, contract, order, state):
         self.open_orders[order_id] = _method_params_to_dict(vars())
+        self.order_updates.append(order_id)
 
         log.debug(
             "Order-{order_id} {status}: "
@@ -360,6 +688,7 @@ class TWSConnection(EClientSocket, EWrapper):
         order_id, exec_id = exec_detail.m_orderId, exec_detail.m_execId
         self.executions[order_id][exec_id] = _method_params_to_dict(vars())
         self._execution_to_order_id[exec_id] = order_id
+        self.order_updates.append(order_id)
 
         log.info(
             "Order-{order_id} executed @ {exec_time}: "
@@ -384,6 +713,7 @@ class TWSConnection(EClientSocket, EWrapper):
         exec_id = commission_report.m_execId
         order_id = self._execution_to_order_id[commission_report.m_execId]
         self.commissions[order_id][exec_id] = commission_report
+        self.order_updates.append(order_id)
 
         log.debug(
             "Order-{order_id} report: "
@@ -503,6 +833,7 @@ class IBBroker(Broker):
         self._tws_uri = tws_uri
         self._orders = {}
         self._transactions = {}
+        self.order_journal = OrderJournal()
 
         self._tws = TWSConnection(tws_uri)
         self.account_id = (self._tws.managed_accounts[0] if account_id is None
@@ -510,6 +841,7 @@ class IBBroker(Broker):
         self.currency = 'USD'
 
         self._subscribed_assets = []
+        self._subscribed_asset_set = set()
 
         super(self.__class__, self).__init__()
 
@@ -517,14 +849,27 @@ class IBBroker(Broker):
     def subscribed_assets(self):
         return self._subscribed_assets
 
-    def subscribe_to_market_data(self, asset):
-        if asset not in self.subscribed_assets:
-            # remove str() cast to have a fun debugging journey
-            self._tws.subscribe_to_market_data(str(asset.symbol))
-            self._subscribed_assets.append(asset)
+    def subscribe_to_market_data(self, asset, timeout=_market_data_timeout):
+        """Subscribe to the market data of an asset or a list of assets.
+
+        The requests of all the assets are sent at once and their first
+        ticks are awaited together for at most ``timeout`` seconds.
+        """
+        assets = asset if isinstance(asset, (list, set, tuple)) else [asset]
+        new_assets = [a for a in assets
+                      if a not in self._subscribed_asset_set]
+        if not new_assets:
+            return
+
+        # remove str() cast to have a fun debugging journey
+        not_ready = self._tws.subscribe_to_market_data(
+            [str(a.symbol) for a in new_assets], timeout=timeout)
+        self._subscribed_assets.extend(new_assets)
+        self._subscribed_asset_set.update(new_assets)
 
-            while asset.symbol not in self._tws.bars:
-                sleep(_poll_frequency)
+        if not_ready:
+            log.warning("No market data received within {}s for: {}".format(
+                timeout, ', '.join(not_ready)))
 
     @property
     def positions(self):
@@ -539,12 +884,11 @@ class IBBroker(Broker):
                 continue
             z_position.amount = int(ib_position.position)
             z_position.cost_basis = float(ib_position.average_cost)
-            # Check if symbol exists in bars df
-            if symbol in self._tws.bars:
+            # Check if symbol has received ticks
+            if symbol in self._tws.bars and not self._tws.bars[symbol].empty:
                 z_position.last_sale_price = \
-                    float(self._tws.bars[symbol].last_trade_price.iloc[-1])
-                z_position.last_sale_date = \
-                    self._tws.bars[symbol].index.values[-1]
+                    float(self._tws.bars[symbol].last_price)
+                z_position.last_sale_date = self._tws.bars[symbol].last_time
             else:
                 z_position.last_sale_price = None
                 z_position.last_sale_date = None
@@ -718,6 +1062,7 @@ class IBBroker(Broker):
             ))
 
         self._tws.placeOrder(ib_order_id, contract, order)
+        self.order_journal.record_order(zp_order)
 
         return zp_order
 
@@ -820,103 +1165,102 @@ class IBBroker(Broker):
         else:
             return None
 
+    def _update_from_order_status(self, zp_order, ib_order_id):
+        if ib_order_id in self._tws.open_orders:
+            open_order_state = self._tws.open_orders[ib_order_id]['state']
+
+            zp_status = self._ib_to_zp_status(open_order_state.m_status)
+            if zp_status:
+                zp_order.status = zp_status
+            else:
+                log.warning(
+                    "Order-{order_id}: "
+                    "unknown order status: {order_status}.".format(
+                        order_id=ib_order_id,
+                        order_status=open_order_state.m_status))
+
+        if ib_order_id in self._tws.order_statuses:
+            order_status = self._tws.order_statuses[ib_order_id]
+
+            zp_order.filled = order_status['filled']
+
+            zp_status = self._ib_to_zp_status(order_status['status'])
+            if zp_status:
+                zp_order.status = zp_status
+            else:
+                log.warning("Order-{order_id}: "
+                            "unknown order status: {order_status}."
+                            .format(order_id=ib_order_id,
+                                    order_status=order_status['status']))
+
+    def _update_from_execution(self, zp_order, ib_order_id):
+        if ib_order_id in self._tws.executions and \
+           ib_order_id not in self._tws.open_orders:
+            zp_order.status = ZP_ORDER_STATUS.FILLED
+            executions = self._tws.executions[ib_order_id]
+            last_exec_detail = \
+                list(executions.values())[-1]['exec_detail']
+            zp_order.filled = last_exec_detail.m_cumQty
+
     def _update_orders(self):
-        def _update_from_order_status(zp_order, ib_order_id):
-            if ib_order_id in self._tws.open_orders:
-                open_order_state = self._tws.open_orders[ib_order_id]['state']
-
-                zp_status = self._ib_to_zp_status(open_order_state.m_status)
-                if zp_status:
-                    zp_order.status = zp_status
-                else:
-                    log.warning(
-                        "Order-{order_id}: "
-                        "unknown order status: {order_status}.".format(
-                            order_id=ib_order_id,
-                            order_status=open_order_state.m_status))
-
-            if ib_order_id in self._tws.order_statuses:
-                order_status = self._tws.order_statuses[ib_order_id]
-
-                zp_order.filled = order_status['filled']
-
-                zp_status = self._ib_to_zp_status(order_status['status'])
-                if zp_status:
-                    zp_order.status = zp_status
-                else:
-                    log.warning("Order-{order_id}: "
-                                "unknown order status: {order_status}."
-                                .format(order_id=ib_order_id,
-                                        order_status=order_status['status']))
-
-        def _update_from_execution(zp_order, ib_order_id):
-            if ib_order_id in self._tws.executions and \
-               ib_order_id not in self._tws.open_orders:
-                zp_order.status = ZP_ORDER_STATUS.FILLED
-                executions = self._tws.executions[ib_order_id]
-                last_exec_detail = \
-                    list(executions.values())[-1]['exec_detail']
-                zp_order.filled = last_exec_detail.m_cumQty
-
-        all_ib_order_ids = (set([e.broker_order_id
-                                 for e in self._orders.values()]) |
-                            set(self._tws.open_orders.keys()) |
-                            set(self._tws.order_statuses.keys()) |
-                            set(self._tws.executions.keys()) |
-                            set(self._tws.commissions.keys()))
-        for ib_order_id in all_ib_order_ids:
+        # Only the orders touched by the TWS callbacks since the previous
+        # call are updated. Orders with changed state and their new
+        # executions are recorded to the order journal.
+        ib_order_ids = OrderedDict()
+        while self._tws.order_updates:
+            ib_order_ids[self._tws.order_updates.popleft()] = None
+
+        for ib_order_id in ib_order_ids:
+            is_new = self._ib_to_zp_order_id(ib_order_id) not in self._orders
             zp_order = self._get_or_create_zp_order(ib_order_id)
-            if zp_order:
-                _update_from_execution(zp_order, ib_order_id)
-                _update_from_order_status(zp_order, ib_order_id)
+            if not zp_order:
+                continue
+
+            state = (zp_order.status, zp_order.filled)
+            self._update_from_execution(zp_order, ib_order_id)
+            self._update_from_order_status(zp_order, ib_order_id)
+            if is_new or state != (zp_order.status, zp_order.filled):
+                self.order_journal.record_order(zp_order)
+
+            self._update_transactions(zp_order, ib_order_id)
+
+    def sync_order_journal(self):
+        self._update_orders()
 
     @property
     def transactions(self):
-        self._update_transactions()
+        self._update_orders()
         return self._transactions
 
-    def _update_transactions(self):
-        all_orders = list(self.orders.values())
-
-        for ib_order_id, executions in iteritems(self._tws.executions):
-            orders = [order
-                      for order in all_orders
-                      if order.broker_order_id == ib_order_id]
-
-            if not orders:
-                log.warning("No order found for executions: {}".format(
-                    executions))
+    def _update_transactions(self, order, ib_order_id):
+        executions = self._tws.executions.get(ib_order_id, {})
+        for exec_id, execution in iteritems(executions):
+            if exec_id in self._transactions:
                 continue
 
-            assert len(orders) == 1
-            order = orders[0]
-
-            for exec_id, execution in iteritems(executions):
-                if exec_id in self._transactions:
-                    continue
-
-                try:
-                    commission = self._tws.commissions[ib_order_id][exec_id]\
-                        .m_commission
-                except KeyError:
-                    log.warning(
-                        "Commission not found for execution: {}".format(
-                            exec_id))
-                    commission = 0
-
-                exec_detail = execution['exec_detail']
-                is_buy = order.amount > 0
-                amount = (exec_detail.m_shares if is_buy
-                          else -1 * exec_detail.m_shares)
-                tx = Transaction(
-                    asset=order.asset,
-                    amount=amount,
-                    dt=pd.to_datetime(exec_detail.m_time, utc=True),
-                    price=exec_detail.m_price,
-                    order_id=order.id,
-                    commission=commission
-                )
-                self._transactions[exec_id] = tx
+            try:
+                commission = self._tws.commissions[ib_order_id][exec_id]\
+                    .m_commission
+            except KeyError:
+                log.warning(
+                    "Commission not found for execution: {}".format(
+                        exec_id))
+                commission = 0
+
+            exec_detail = execution['exec_detail']
+            is_buy = order.amount > 0
+            amount = (exec_detail.m_shares if is_buy
+                      else -1 * exec_detail.m_shares)
+            tx = Transaction(
+                asset=order.asset,
+                amount=amount,
+                dt=pd.to_datetime(exec_detail.m_time, utc=True),
+                price=exec_detail.m_price,
+                order_id=order.id,
+                commission=commission
+            )
+            self._transactions[exec_id] = tx
+            self.order_journal.record_transaction(tx)
 
     def cancel_order(self, zp_order_id):
         ib_order_id = self.orders[zp_order_id].broker_order_id
@@ -927,65 +1271,52 @@ class IBBroker(Broker):
 
         self.subscribe_to_market_data(assets)
 
-        bars = self._tws.bars[symbol]
+        ticks = self._tws.bars.get(symbol)
 
-        last_event_time = bars.index[-1]
+        if ticks is None or ticks.empty:
+            return pd.NaT if field == 'last_traded' else np.NaN
 
-        minute_start = (last_event_time - pd.Timedelta('1 min')) \
-            .time()
-        minute_end = last_event_time.time()
+        if field == 'price':
+            return ticks.last_price
+        elif field == 'last_traded':
+            return ticks.last_time
 
-        if bars.empty:
-            return pd.NaT if field == 'last_traded' else np.NaN
-        else:
-            if field == 'price':
-                return bars.last_trade_price.iloc[-1]
-            elif field == 'last_traded':
-                return last_event_time or pd.NaT
-
-            minute_df = bars.between_time(minute_start, minute_end,
-                                          include_start=True, include_end=True)
-            if minute_df.empty:
-                return np.NaN
-            else:
-                if field == 'open':
-                    return minute_df.last_trade_price.iloc[0]
-                elif field == 'close':
-                    return minute_df.last_trade_price.iloc[-1]
-                elif field == 'high':
-                    return minute_df.last_trade_price.max()
-                elif field == 'low':
-                    return minute_df.last_trade_price.min()
-                elif field == 'volume':
-                    return minute_df.last_trade_size.sum()
+        # OHLCV of the current minute bar
+        bar = self._tws.minute_bars[symbol].current_bar
+        if bar is None:
+            return np.NaN
+        return bar[('open', 'high', 'low', 'close', 'volume').index(field)]
 
     def get_last_traded_dt(self, asset):
         self.subscribe_to_market_data(asset)
 
-        return self._tws.bars[asset.symbol].index[-1]
+        ticks = self._tws.bars.get(str(asset.symbol))
+        return pd.NaT if ticks is None else ticks.last_time
 
-    def get_realtime_bars(self, assets, frequency):
-        if frequency == '1m':
-            resample_freq = '1 Min'
-        elif frequency == '1d':
-            resample_freq = '24 H'
-        else:
+    def get_realtime_bars(self, assets, frequency, bar_count=None):
+        if frequency not in ('1m', '1d'):
             raise ValueError("Invalid frequency specified: %s" % frequency)
 
-        df = pd.DataFrame()
-        for asset in assets:
-            symbol = str(asset.symbol)
-            self.subscribe_to_market_data(asset)
-
-            trade_prices = self._tws.bars[symbol]['last_trade_price']
-            trade_sizes = self._tws.bars[symbol]['last_trade_size']
-            ohlcv = trade_prices.resample(resample_freq).ohlc()
-            ohlcv['volume'] = trade_sizes.resample(resample_freq).sum()
+        if not len(assets):
+            return pd.DataFrame()
 
-            # Add asset as level 0 column; ohlcv will be used as level 1 cols
-            ohlcv.columns = pd.MultiIndex.from_product([[asset, ],
-                                                        ohlcv.columns])
+        self.subscribe_to_market_data(list(assets))
 
-            df = pd.concat([df, ohlcv], axis=1)
+        ohlcvs = []
+        for asset in assets:
+            symbol = str(asset.symbol)
+            if symbol not in self._tws.bars:
+                # No data received yet
+                ohlcvs.append(pd.DataFrame(
+                    columns=['open', 'high', 'low', 'close', 'volume']))
+                continue
+            if frequency == '1m':
+                ohlcv = self._tws.minute_bars[symbol].bars(bar_count)
+            else:
+                ohlcv = self._tws.bars[symbol].ohlcv('24 H')
+                if bar_count is not None:
+                    ohlcv = ohlcv.iloc[-bar_count:]
+            ohlcvs.append(ohlcv)
 
-        return df
+        # Add asset as level 0 column; ohlcv will be used as level 1 cols
+        return pd.concat(ohlcvs, axis=1, keys=list(assets))
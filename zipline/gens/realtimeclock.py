@@ -27,6 +27,20 @@ from zipline.gens.sim_engine import (
 log = Logger('Realtime Clock')
 
 
+def _wall_time():
+    return pd.to_datetime('now', utc=True)
+
+
+def _sleep(seconds):
+    sleep(seconds)
+
+
+def _to_utc(dt):
+    if dt.tzinfo is None:
+        return dt.tz_localize('UTC')
+    return dt.tz_convert('UTC')
+
+
 class RealtimeClock(object):
     """Realtime clock for live trading.
 
@@ -37,10 +51,34 @@ class RealtimeClock(object):
     MinuteSimulationClock yields a new event on every iteration (regardless of
     wall clock).
 
+    Instead of polling the wall clock, the RealtimeClock computes the time of
+    the next event and sleeps until then.
+
+    The clock steps through all the sessions, idling between the close of a
+    session and the start of the next one. A session which has already
+    closed when the clock reaches it only emits SESSION_START and
+    SESSION_END, except for the last one which, started after hours,
+    emits SESSION_START and BEFORE_TRADING_START_BAR only.
+
     The :param:`time_skew` parameter represents the time difference between
     the Broker and the live trading machine's clock.
+
+    The :param:`emission_offset` parameter delays the emission of each bar
+    past the minute boundary (e.g. ``pd.Timedelta('250ms')`` to give the
+    broker time to finalize the bar's data). It must be less than a minute.
+
+    The :param:`time_source` and :param:`sleep` parameters replace the wall
+    clock (a callable returning the current UTC Timestamp) and
+    :func:`time.sleep` respectively.
+
+    The delay between the scheduled and the actual emission time of the last
+    bar is available as :attr:`emission_lag`.
     """
 
+    # Upper bound of a single sleep so the broker's liveness is checked
+    # regularly even when the next event is hours away.
+    max_sleep = 60.0
+
     def __init__(self,
                  sessions,
                  execution_opens,
@@ -48,7 +86,15 @@ class RealtimeClock(object):
                  before_trading_start_minutes,
                  minute_emission,
                  time_skew=pd.Timedelta("0s"),
-                 is_broker_alive=None):
+                 is_broker_alive=None,
+                 emission_offset=pd.Timedelta("0s"),
+                 time_source=None,
+                 sleep=None):
+        if not pd.Timedelta(0) <= emission_offset < pd.Timedelta('1 min'):
+            raise ValueError(
+                "emission_offset must be within [0s, 1min): {}".format(
+                    emission_offset))
+
         self.sessions = sessions
         self.execution_opens = execution_opens
         self.execution_closes = execution_closes
@@ -56,44 +102,95 @@ class RealtimeClock(object):
         self.minute_emission = minute_emission
         self.time_skew = time_skew
         self.is_broker_alive = is_broker_alive or (lambda: True)
+        self.emission_offset = emission_offset
+        self.time_source = time_source or _wall_time
+        self.sleep = sleep or _sleep
+        self.emission_lag = None
         self._last_emit = None
         self._before_trading_start_bar_yielded = False
 
+    def _server_time(self):
+        return self.time_source() + self.time_skew
+
+    def _sleep_until(self, server_time, now):
+        seconds = min((server_time - now).total_seconds(), self.max_sleep)
+        if seconds > 0:
+            self.sleep(seconds)
+
     def __iter__(self):
-        yield self.sessions[0], SESSION_START
+        last_session = len(self.sessions) - 1
+
+        for index, session in enumerate(self.sessions):
+            if index > 0:
+                # Idle until the session's label (midnight UTC) so the
+                # session starts in chronological order
+                if not self._wait_until(_to_utc(session)):
+                    return
+
+            self._last_emit = None
+            self._before_trading_start_bar_yielded = False
+
+            yield session, SESSION_START
+
+            for event in self._session_events(index,
+                                              index == last_session):
+                yield event
+
+            if not self.is_broker_alive():
+                return
 
+    def _wait_until(self, server_time):
         while self.is_broker_alive():
-            current_time = pd.to_datetime('now', utc=True)
-            server_time = (current_time + self.time_skew).floor('1 min')
+            now = self._server_time()
+            if now >= server_time:
+                return True
+            self._sleep_until(server_time, now)
+        return False
 
-            if (server_time >= self.before_trading_start_minutes[0] and
-                    not self._before_trading_start_bar_yielded):
+    def _session_events(self, index, is_last_session):
+        execution_open = _to_utc(self.execution_opens[index])
+        execution_close = _to_utc(self.execution_closes[index])
+        before_trading_start = self.before_trading_start_minutes[index]
+        one_minute = pd.Timedelta('1 minute')
+
+        while self.is_broker_alive():
+            now = self._server_time()
+            server_time = (now - self.emission_offset).floor('1 min')
+
+            if (server_time >= before_trading_start and
+                    not self._before_trading_start_bar_yielded and
+                    (server_time <= execution_close or is_last_session)):
                 self._last_emit = server_time
                 self._before_trading_start_bar_yielded = True
                 yield server_time, BEFORE_TRADING_START_BAR
-            elif server_time < self.execution_opens[0].tz_localize('UTC'):
-                sleep(1)
-            elif (self.execution_opens[0].tz_localize('UTC') <= server_time <
-                  self.execution_closes[0].tz_localize('UTC')):
+            elif server_time < execution_open:
+                next_event = execution_open
+                if not self._before_trading_start_bar_yielded:
+                    next_event = min(next_event, before_trading_start)
+                self._sleep_until(next_event + self.emission_offset, now)
+            elif execution_open <= server_time <= execution_close:
                 if (self._last_emit is None or
-                        server_time - self._last_emit >=
-                        pd.Timedelta('1 minute')):
+                        server_time - self._last_emit >= one_minute or
+                        server_time == execution_close):
                     self._last_emit = server_time
+                    self.emission_lag = \
+                        now - (server_time + self.emission_offset)
                     yield server_time, BAR
                     if self.minute_emission:
                         yield server_time, MINUTE_END
+                    if server_time == execution_close:
+                        yield server_time, SESSION_END
+                        return
                 else:
-                    sleep(1)
-            elif server_time == self.execution_closes[0].tz_localize('UTC'):
-                self._last_emit = server_time
-                yield server_time, BAR
-                if self.minute_emission:
-                    yield server_time, MINUTE_END
-                yield server_time, SESSION_END
-
-                return
-            elif server_time > self.execution_closes[0].tz_localize('UTC'):
-                # Return with no yield if the algo is started in after hours
+                    self._sleep_until(
+                        server_time + one_minute + self.emission_offset, now)
+            elif server_time > execution_close:
+                if is_last_session:
+                    # Return with no yield if the algo is started in after
+                    # hours
+                    return
+                # Close the missed session so the next one can start
+                yield execution_close, SESSION_END
                 return
             else:
                 # We should never end up in this branch
@@ -0,0 +1,308 @@
+"""
+On-disk cache of computed pipeline terms.
+"""
+from functools import partial
+from hashlib import sha1
+import errno
+import os
+from types import CodeType, FunctionType
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from zipline.assets import Asset
+from zipline.lib.labelarray import LabelArray
+from zipline.utils.cache import working_file
+from zipline.utils.paths import ensure_directory
+
+from .term import Term
+
+
+class UncacheableTerm(Exception):
+    """
+    Raised when the structure of a term can not be identified across
+    processes, for example because one of its parameters has no stable repr.
+    """
+
+
+def _code_token(code):
+    return (
+        'code',
+        code.co_code,
+        code.co_names,
+        tuple(
+            _code_token(const) if isinstance(const, CodeType) else repr(const)
+            for const in code.co_consts
+        ),
+    )
+
+
+def _closure_token(func, memo):
+    """
+    A token of the values closed over by ``func``, which its code does not
+    include.
+    """
+    closure = getattr(func, '__closure__', None) or ()
+    token = ['closure']
+    for cell in closure:
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # The variable is not assigned yet.
+            token.append('empty')
+        else:
+            token.append(_token(contents, memo))
+    return tuple(token)
+
+
+def _qualified_name(obj):
+    return '.'.join((
+        obj.__module__,
+        getattr(obj, '__qualname__', obj.__name__),
+    ))
+
+
+def _term_token(term, memo):
+    """
+    A token of the structure of ``term`` which is equal for equal terms
+    constructed in different processes.
+
+    Parameters
+    ----------
+    term : Term
+        The term to identify.
+    memo : dict[Term or type or function -> tuple]
+        The tokens of the terms, classes and functions which were already
+        identified.
+
+    Raises
+    ------
+    UncacheableTerm
+        Raised when the structure of ``term`` can not be identified.
+    """
+    try:
+        return memo[term]
+    except KeyError:
+        pass
+
+    token = memo[term] = ('term', _token(term._identity, memo))
+    return token
+
+
+def _token(obj, memo):
+    if isinstance(obj, Term):
+        return _term_token(obj, memo)
+
+    token = partial(_token, memo=memo)
+    if isinstance(obj, (tuple, list)):
+        return (type(obj).__name__,) + tuple(map(token, obj))
+    if isinstance(obj, (set, frozenset)):
+        return ('set',) + tuple(sorted(map(repr, map(token, obj))))
+    if isinstance(obj, dict):
+        return ('dict',) + tuple(sorted(
+            (repr(token(k)), token(v)) for k, v in obj.items()
+        ))
+    if isinstance(obj, (type, FunctionType)):
+        try:
+            return memo[obj]
+        except KeyError:
+            pass
+        # Stand in for ``obj`` in the values it closes over, which may
+        # refer back to it.
+        memo[obj] = ('recursive', _qualified_name(obj))
+
+        if isinstance(obj, type):
+            kind, func = 'type', getattr(obj, 'compute', None)
+        else:
+            kind, func = 'function', obj
+        code = getattr(func, '__code__', None)
+        try:
+            token = (
+                kind,
+                _qualified_name(obj),
+                None if code is None else _code_token(code),
+                None if code is None else _closure_token(func, memo),
+            )
+        except UncacheableTerm:
+            del memo[obj]
+            raise
+        memo[obj] = token
+        return token
+    if isinstance(obj, np.dtype):
+        return ('dtype', obj.str)
+    if isinstance(obj, Asset):
+        return ('asset', int(obj))
+
+    r = repr(obj)
+    if ' at 0x' in r:
+        raise UncacheableTerm(r)
+    return r
+
+
+class TermCache(object):
+    """
+    An on-disk cache of the results of pipeline terms, which can be shared by
+    the runs of different pipelines over the same data.
+
+    Results are keyed by the structure of a term, the version of the data and
+    the dates, assets and asset lifetimes of the computation, and are stored
+    as ``.npy`` files which are memory mapped when they are read.
+
+    Parameters
+    ----------
+    path : str
+        The directory of the cache.
+    data_version : str
+        The version of the data which the terms are computed from, for
+        example the ingestion timestamp of a bundle. Results computed from
+        another version are never read.
+    max_bytes : int, optional
+        The size of the results to keep. When it is exceeded, the least
+        recently used results are removed. Defaults to no limit.
+
+    Notes
+    -----
+    A term is identified by its class, the code of its ``compute`` method, its
+    parameters and its inputs. Terms whose results depend on anything else,
+    like the state of a random number generator, should not be computed with
+    a cache.
+    """
+    SUFFIX = '.npy'
+
+    def __init__(self, path, data_version, max_bytes=None):
+        self.path = path
+        self.data_version = str(data_version)
+        self.max_bytes = max_bytes
+        # Hold the terms, classes and functions weakly so that the tokens of
+        # ones which are no longer used are dropped.
+        self._term_tokens = WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        ensure_directory(path)
+
+    def key(self, term, dates, assets, mask):
+        """
+        The key of the result of ``term`` for a computation.
+
+        Parameters
+        ----------
+        term : Term
+            The term to compute.
+        dates : pd.DatetimeIndex
+            The dates of the result.
+        assets : pd.Int64Index
+            The assets of the result.
+        mask : np.ndarray[bool]
+            The lifetimes of ``assets`` on ``dates``.
+
+        Returns
+        -------
+        key : str or None
+            The key of the result, or None if ``term`` can not be cached.
+        """
+        try:
+            token = _term_token(term, self._term_tokens)
+        except UncacheableTerm:
+            return None
+
+        digest = sha1(repr((token, self.data_version)).encode('utf-8'))
+        for array in (dates.asi8, assets.values, mask):
+            digest.update(repr(array.shape).encode('utf-8'))
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def _keypath(self, key):
+        return os.path.join(self.path, key + self.SUFFIX)
+
+    def get(self, key):
+        """
+        Read a cached result.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by ``key``.
+
+        Returns
+        -------
+        result : np.memmap or None
+            A copy-on-write memory map of the result, or None if it is not
+            cached.
+        """
+        path = self._keypath(key)
+        try:
+            result = np.load(path, mmap_mode='c')
+            # Mark the result as recently used.
+            os.utime(path, None)
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                raise
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def set(self, key, result):
+        """
+        Write a computed result, unless it can not be memory mapped.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by ``key``.
+        result : np.ndarray
+            The result of the term.
+        """
+        if (not isinstance(result, np.ndarray) or
+                isinstance(result, LabelArray) or
+                result.dtype.hasobject):
+            return
+
+        # Write to a temporary file that is invisible to readers and to the
+        # eviction, then move it into place.
+        with working_file(self._keypath(key),
+                          dir=self.path,
+                          prefix='.',
+                          suffix=self.SUFFIX) as f:
+            np.save(f.path, result)
+
+        if self.max_bytes is not None:
+            self._evict()
+
+    def _evict(self):
+        """
+        Remove the least recently used results until the size of the cache is
+        at most ``max_bytes``.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if name.startswith('.') or not name.endswith(self.SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            total -= size
+
+    def clear(self):
+        """
+        Remove all of the cached results.
+        """
+        self.max_bytes, max_bytes = 0, self.max_bytes
+        try:
+            self._evict()
+        finally:
+            self.max_bytes = max_bytes
@@ -0,0 +1,142 @@
+"""
+Columnar results of pipelines.
+"""
+from numpy import array, repeat, unique
+from pandas import DataFrame, Index, MultiIndex
+from six import iteritems
+
+from zipline.utils.memoize import lazyval
+
+
+class ColumnarResults(object):
+    """
+    The results of a pipeline, stored as one array per column with a row for
+    each (date, asset) pair which passed the screen.
+
+    The rows are labelled by their sids and dates, and Asset objects are only
+    retrieved for the rows which are converted to a DataFrame, so the results
+    of a long range can be kept in memory and sliced one date at a time.
+
+    Parameters
+    ----------
+    terms : dict[str -> Term]
+        Dict mapping column names to terms.
+    columns : dict[str -> np.ndarray]
+        Dict mapping column names to the values of their rows.
+    sessions : pd.DatetimeIndex
+        The dates for which the pipeline was computed.
+    counts : np.ndarray[int64]
+        The number of rows for each of ``sessions``.
+    sids : np.ndarray[int64]
+        The sid of each row.
+    asset_finder : zipline.assets.AssetFinder
+        The finder used to retrieve the assets of the rows.
+
+    Notes
+    -----
+    The rows are ordered by date and then by sid.
+    """
+    def __init__(self, terms, columns, sessions, counts, sids, asset_finder):
+        self.terms = terms
+        self.columns = columns
+        self.sessions = sessions
+        self.counts = counts
+        self.sids = sids
+        self._finder = asset_finder
+        self._ends = counts.cumsum()
+
+    def __len__(self):
+        return len(self.sids)
+
+    @lazyval
+    def dates(self):
+        """
+        The date of each row.
+        """
+        return repeat(self.sessions.values, self.counts)
+
+    @lazyval
+    def assets(self):
+        """
+        The Asset of each row.
+        """
+        return self._retrieve(self.sids)
+
+    def _retrieve(self, sids):
+        # Retrieve each asset once, no matter how many rows it has.
+        unique_sids, positions = unique(sids, return_inverse=True)
+        assets = array(self._finder.retrieve_all(unique_sids), dtype=object)
+        return assets[positions]
+
+    def _frame(self, start, stop, index):
+        return DataFrame(
+            data={
+                # As in the narrow DataFrame, each term postprocesses its
+                # values.
+                name: self.terms[name].postprocess(values[start:stop])
+                for name, values in iteritems(self.columns)
+            },
+            index=index,
+        )
+
+    def for_session(self, session):
+        """
+        The rows of one date.
+
+        Parameters
+        ----------
+        session : pd.Timestamp
+            One of the dates for which the pipeline was computed.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            A frame indexed by the assets which passed the screen on
+            ``session``, with one column per term.
+
+        Raises
+        ------
+        KeyError
+            Raised when the pipeline was not computed for ``session``.
+        """
+        ix = self.sessions.get_loc(session)
+        stop = self._ends[ix]
+        start = stop - self.counts[ix]
+        return self._frame(
+            start,
+            stop,
+            Index(self._retrieve(self.sids[start:stop])),
+        )
+
+    def to_frame(self):
+        """
+        Convert the results into the DataFrame returned by
+        ``SimplePipelineEngine.run_pipeline``.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            A frame indexed by a two-tiered MultiIndex of (date, asset), with
+            one column per term.
+        """
+        if not len(self):
+            # Manually handle the empty DataFrame case. This is a workaround
+            # to pandas failing to tz_localize an empty dataframe with a
+            # MultiIndex.
+            #
+            # Slicing `sessions` here to preserve pandas metadata.
+            empty_dates = self.sessions[:0]
+            empty_assets = array([], dtype=object)
+            return DataFrame(
+                data={
+                    name: array([], dtype=values.dtype)
+                    for name, values in iteritems(self.columns)
+                },
+                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
+            )
+
+        return self._frame(
+            0,
+            len(self),
+            MultiIndex.from_arrays([self.dates, self.assets]),
+        ).tz_localize('UTC', level=0)
@@ -5,26 +5,30 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from collections import deque
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import sys
+from time import time
 from uuid import uuid4
 
 from six import (
     iteritems,
+    reraise,
     with_metaclass,
 )
-from numpy import array
-from pandas import DataFrame, MultiIndex
+from six.moves.queue import Queue
 from toolz import groupby, juxt
 from toolz.curried.operator import getitem
 
 from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
 from zipline.errors import NoFurtherDataError
-from zipline.utils.numpy_utils import (
-    as_column,
-    repeat_first_axis,
-    repeat_last_axis,
-)
-from zipline.utils.pandas_utils import explode
+from zipline.utils.numpy_utils import as_column
+from zipline.utils.pandas_utils import categorical_df_concat, explode
+from zipline.utils.sqlite_utils import dispose_after_fork
 
+from .columnar import ColumnarResults
+from .incremental import LoadedWindows
 from .term import AssetExists, InputDates, LoadableTerm
 
 
@@ -114,6 +118,61 @@ def default_populate_initial_workspace(initial_workspace,
     return initial_workspace
 
 
+def _timed_call(key, f, args):
+    """
+    Call ``f(*args)``, returning ``key``, the result, the seconds the call
+    took and the ``sys.exc_info()`` of an exception raised by the call.
+    """
+    start = time()
+    try:
+        result = f(*args)
+    except Exception:
+        return key, None, None, sys.exc_info()
+    return key, result, time() - start, None
+
+
+# The engine and pipeline of the running ``run_chunked_pipeline``, which are
+# inherited by the worker processes it forks.
+_chunked_pipeline = None
+
+
+def _init_chunk_worker():
+    engine, _ = _chunked_pipeline
+    # The threads of a pool don't survive the fork.
+    engine._pool = None
+    # Nor can the connections to the assets db be used by the worker. The
+    # adjustment readers connect again by themselves.
+    sa_engine = getattr(engine._finder, 'engine', None)
+    if sa_engine is not None:
+        dispose_after_fork(sa_engine)
+
+
+def _run_pipeline_chunk(dates):
+    engine, pipeline = _chunked_pipeline
+    start_date, end_date = dates
+    return engine.run_pipeline(pipeline, start_date, end_date)
+
+
+def _fork_pool(processes):
+    """
+    A pool of ``processes`` worker processes forked from this one, or None
+    when processes can not be forked.
+    """
+    try:
+        get_context = multiprocessing.get_context
+    except AttributeError:
+        # Python 2 always forks, where it is possible.
+        if sys.platform == 'win32':
+            return None
+        return multiprocessing.Pool(processes, _init_chunk_worker)
+
+    try:
+        context = get_context('fork')
+    except ValueError:
+        return None
+    return context.Pool(processes, _init_chunk_worker)
+
+
 class SimplePipelineEngine(object):
     """
     PipelineEngine class that computes each term independently.
@@ -134,6 +193,23 @@ class SimplePipelineEngine(object):
         computing a pipeline. See
         :func:`zipline.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    max_workers : int, optional
+        The number of threads used to compute the terms of a pipeline.
+        Terms whose inputs are available are computed concurrently, along
+        with the loads of loaders which are ``thread_safe``. By default,
+        terms are computed one at a time in the calling thread. The threads
+        are stopped by ``close``.
+    term_cache : zipline.pipeline.cache.TermCache, optional
+        An on-disk cache of computed terms. Terms found in the cache are
+        added to the initial workspace instead of being computed, and the
+        computed terms are written to it.
+    incremental : bool, optional
+        Whether to keep the arrays loaded by each run, and advance them to the
+        dates of the next run by loading only the sessions they are missing.
+        This makes running a pipeline for one new session at a time, as in
+        live trading, load one session of data instead of the whole lookback
+        window of its terms. Only loaders which are ``incremental`` are
+        advanced. Default is False.
 
     See Also
     --------
@@ -146,6 +222,11 @@ class SimplePipelineEngine(object):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_term_cache',
+        '_loaded_windows',
+        '_max_workers',
+        '_pool',
+        '_term_timings',
         '__weakref__',
     )
 
@@ -153,7 +234,10 @@ class SimplePipelineEngine(object):
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 term_cache=None,
+                 max_workers=None,
+                 incremental=False):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
@@ -164,6 +248,11 @@ class SimplePipelineEngine(object):
         self._populate_initial_workspace = (
             populate_initial_workspace or default_populate_initial_workspace
         )
+        self._term_cache = term_cache
+        self._loaded_windows = LoadedWindows() if incremental else None
+        self._max_workers = max_workers
+        self._pool = None
+        self._term_timings = {}
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -212,6 +301,48 @@ class SimplePipelineEngine(object):
         --------
         PipelineEngine.run_pipeline
         """
+        return self._to_narrow(
+            *self._run_pipeline(pipeline, start_date, end_date)
+        )
+
+    def run_columnar_pipeline(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, and return its results without converting them
+        into a DataFrame.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : zipline.pipeline.columnar.ColumnarResults
+            The rows of the frame returned by ``run_pipeline``, labelled by
+            sids and dates. Assets are retrieved only for the rows which are
+            converted into a frame, for example by ``for_session``.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
+        return self._to_columnar(
+            *self._run_pipeline(pipeline, start_date, end_date)
+        )
+
+    def _run_pipeline(self, pipeline, start_date, end_date):
+        """
+        Compute the outputs of a pipeline.
+
+        Returns
+        -------
+        (terms, data, mask, dates, assets) : tuple
+            The arguments of ``_to_narrow`` and ``_to_columnar``.
+        """
         if end_date < start_date:
             raise ValueError(
                 "start_date must be before or equal to end_date \n"
@@ -240,6 +371,13 @@ class SimplePipelineEngine(object):
             dates,
             assets,
         )
+        if self._term_cache is not None:
+            initial_workspace = self._populate_from_term_cache(
+                initial_workspace,
+                graph,
+                dates,
+                assets,
+            )
 
         results = self.compute_chunk(
             graph,
@@ -248,7 +386,7 @@ class SimplePipelineEngine(object):
             initial_workspace,
         )
 
-        return self._to_narrow(
+        return (
             graph.outputs,
             results,
             results.pop(screen_name),
@@ -256,6 +394,113 @@ class SimplePipelineEngine(object):
             assets,
         )
 
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             processes=None):
+        """
+        Compute a pipeline in chunks of sessions.
+
+        Each chunk is computed with ``run_pipeline``, which loads the
+        lookback window its terms need before the chunk, so the largest
+        workspace is bounded by ``chunksize`` and the longest lookback rather
+        than the length of the whole range.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+        chunksize : int
+            The number of sessions of each chunk.
+        processes : int, optional
+            The number of worker processes which compute the chunks. The
+            workers are forked from this process, and inherit the engine and
+            its loaders. By default, or where processes can not be forked,
+            the chunks are computed one at a time in this process.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            The result of ``run_pipeline`` over the whole range.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+        if chunksize < 1:
+            raise ValueError(
+                "chunksize must be a positive number of sessions, got %r" %
+                chunksize
+            )
+
+        sessions = self._calendar
+        start_ix, end_ix = sessions.slice_locs(start_date, end_date)
+        ranges = [
+            (sessions[ix], sessions[min(ix + chunksize, end_ix) - 1])
+            for ix in range(start_ix, end_ix, chunksize)
+        ]
+
+        chunks = None
+        if processes is not None and processes > 1 and len(ranges) > 1:
+            # Fail here, rather than in a worker, when the first chunk starts
+            # before the lookback of the pipeline is available.
+            graph = pipeline.to_execution_plan(
+                uuid4().hex,
+                self._root_mask_term,
+                sessions,
+                *ranges[0]
+            )
+            extra_rows = graph.extra_rows[self._root_mask_term]
+            if start_ix < extra_rows:
+                raise NoFurtherDataError.from_lookback_window(
+                    initial_message="Insufficient data to compute Pipeline:",
+                    first_date=sessions[0],
+                    lookback_start=start_date,
+                    lookback_length=extra_rows,
+                )
+
+            global _chunked_pipeline
+            _chunked_pipeline = (self, pipeline)
+            try:
+                pool = _fork_pool(min(processes, len(ranges)))
+                if pool is not None:
+                    try:
+                        chunks = pool.map(
+                            _run_pipeline_chunk,
+                            ranges,
+                            chunksize=1,
+                        )
+                    finally:
+                        pool.close()
+                        pool.join()
+            finally:
+                _chunked_pipeline = None
+
+        if chunks is None:
+            chunks = [
+                self.run_pipeline(pipeline, chunk_start, chunk_end)
+                for chunk_start, chunk_end in ranges
+            ]
+
+        # The frames of chunks whose screen passed nothing don't have the
+        # categorical columns of LabelArray terms, which can't be
+        # concatenated with the others.
+        chunks = [chunk for chunk in chunks if len(chunk)] or chunks[:1]
+        if len(chunks) == 1:
+            return chunks[0]
+        return categorical_df_concat(chunks, inplace=True)
+
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
         Compute a lifetimes matrix from our AssetFinder, then drop columns that
@@ -314,6 +559,52 @@ class SimplePipelineEngine(object):
         assert shape[0] * shape[1] != 0, 'root mask cannot be empty'
         return ret
 
+    def _term_cache_key(self, term, graph, dates, assets, root_mask_values):
+        """
+        The key of ``term`` in the term cache, or None if it is not cacheable.
+
+        The result of a term is determined by the dates, assets and asset
+        lifetimes it is computed over, so the key is built from the slice of
+        the root mask which matches the term's dates.
+        """
+        if (isinstance(term, LoadableTerm) or
+                term is self._root_mask_term or
+                term is self._root_mask_dates_term):
+            return None
+
+        extra_rows = graph.extra_rows
+        offset = extra_rows[self._root_mask_term] - extra_rows[term]
+        return self._term_cache.key(
+            term,
+            dates[offset:],
+            assets,
+            root_mask_values[offset:],
+        )
+
+    def _populate_from_term_cache(self,
+                                  initial_workspace,
+                                  graph,
+                                  dates,
+                                  assets):
+        """
+        Add the terms of ``graph`` which are in the term cache to
+        ``initial_workspace``.
+        """
+        root_mask_values = initial_workspace[self._root_mask_term]
+        workspace = initial_workspace.copy()
+        for term in graph.ordered():
+            if term in workspace:
+                continue
+            key = self._term_cache_key(
+                term, graph, dates, assets, root_mask_values,
+            )
+            if key is None:
+                continue
+            cached = self._term_cache.get(key)
+            if cached is not None:
+                workspace[term] = cached
+        return workspace
+
     @staticmethod
     def _inputs_for_term(term, workspace, graph):
         """
@@ -354,6 +645,17 @@ class SimplePipelineEngine(object):
     def get_loader(self, term):
         return self._get_loader(term)
 
+    def _load_adjusted_array(self, loader, columns, dates, assets, mask):
+        """
+        Load ``columns`` from ``loader``, advancing the arrays of the previous
+        run if the engine is incremental.
+        """
+        if self._loaded_windows is None:
+            return loader.load_adjusted_array(columns, dates, assets, mask)
+        return self._loaded_windows.load(
+            loader, columns, dates, assets, mask,
+        )
+
     def compute_chunk(self, graph, dates, assets, initial_workspace):
         """
         Compute the Pipeline terms in the graph for the requested start and end
@@ -389,57 +691,274 @@ class SimplePipelineEngine(object):
         loader_groups = groupby(loader_group_key, graph.loadable_terms)
 
         refcounts = graph.initial_refcounts(workspace)
+        self._term_timings = {}
+
+        if self._max_workers is None or self._max_workers < 2:
+            for term in graph.execution_order(refcounts):
+                # `term` may have been supplied in `initial_workspace`, and in
+                # the future we may pre-compute loadable terms coming from the
+                # same dataset.  In either case, we will already have an entry
+                # for this term, which we shouldn't re-compute.
+                if term in workspace:
+                    continue
+
+                # Asset labels are always the same, but date labels vary by
+                # how many extra rows are needed.
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
+                )
 
-        for term in graph.execution_order(refcounts):
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
+                start = time()
+                if isinstance(term, LoadableTerm):
+                    to_load = sorted(
+                        loader_groups[loader_group_key(term)],
+                        key=lambda t: t.dataset
+                    )
+                    loaded = self._load_adjusted_array(
+                        get_loader(term), to_load, mask_dates, assets, mask,
+                    )
+                    self._store_loaded_terms(
+                        loaded, time() - start, workspace,
+                    )
+                else:
+                    result = term._compute(
+                        self._inputs_for_term(term, workspace, graph),
+                        mask_dates,
+                        assets,
+                        mask,
+                    )
+                    self._store_computed_term(
+                        term,
+                        result,
+                        time() - start,
+                        mask,
+                        graph,
+                        dates,
+                        assets,
+                        workspace,
+                        refcounts,
+                    )
+        else:
+            self._compute_terms_in_pool(
+                graph,
+                dates,
+                assets,
+                workspace,
+                refcounts,
+                loader_groups,
+                loader_group_key,
+            )
+
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
+    def _store_loaded_terms(self, loaded, elapsed, workspace):
+        """
+        Add the terms loaded together in ``elapsed`` seconds to ``workspace``.
+        """
+        workspace.update(loaded)
+        for term in loaded:
+            self._term_timings[term] = elapsed
+
+    def _store_computed_term(self,
+                             term,
+                             result,
+                             elapsed,
+                             mask,
+                             graph,
+                             dates,
+                             assets,
+                             workspace,
+                             refcounts):
+        """
+        Add the result of ``term``, computed in ``elapsed`` seconds, to
+        ``workspace`` and the term cache, and clear the terms which are no
+        longer needed.
+        """
+        workspace[term] = result
+        self._term_timings[term] = elapsed
+        if term.ndim == 2:
+            assert result.shape == mask.shape
+        else:
+            assert result.shape == (mask.shape[0], 1)
 
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = graph.mask_and_dates_for_term(
+        if self._term_cache is not None:
+            key = self._term_cache_key(
                 term,
-                self._root_mask_term,
-                workspace,
+                graph,
                 dates,
+                assets,
+                workspace[self._root_mask_term],
             )
+            if key is not None:
+                self._term_cache.set(key, result)
 
-            if isinstance(term, LoadableTerm):
-                to_load = sorted(
-                    loader_groups[loader_group_key(term)],
-                    key=lambda t: t.dataset
-                )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
+        # Decref dependencies of ``term``, and clear any terms whose
+        # refcounts hit 0.
+        for garbage_term in graph.decref_dependencies(term, refcounts):
+            del workspace[garbage_term]
+
+    def close(self):
+        """
+        Stop the threads which compute terms when ``max_workers`` is set.
+
+        The engine can still be used afterwards, a new pool of threads is
+        started by the next computation which needs one.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPool(self._max_workers)
+        return self._pool
+
+    def _compute_terms_in_pool(self,
+                               graph,
+                               dates,
+                               assets,
+                               workspace,
+                               refcounts,
+                               loader_groups,
+                               loader_group_key):
+        """
+        Compute the terms of ``graph`` which are missing from ``workspace`` on
+        the engine's thread pool, dispatching each term as soon as the terms
+        it depends on are available.
+
+        The inputs of each term are prepared, and its result is stored, in
+        the calling thread, so only the calling thread touches ``workspace``
+        and ``refcounts``. Loaders which are not ``thread_safe`` are run in
+        the calling thread while the pool computes other terms.
+        """
+        pool = self._get_pool()
+        nx_graph = graph.graph
+
+        to_compute = [
+            term for term in graph.execution_order(refcounts)
+            if term not in workspace
+        ]
+        # term -> the dependencies of term which have not been computed yet
+        waiting = {
+            term: {
+                parent for parent, _ in nx_graph.in_edges([term])
+                if parent not in workspace
+            }
+            for term in to_compute
+        }
+        ready = deque(term for term in to_compute if not waiting[term])
+        loading = set()
+        finished = Queue()
+        running = 0
+
+        while ready or running:
+            while ready:
+                term = ready.popleft()
+                if term in workspace:
+                    # Loaded along with another term of its loader group.
+                    continue
+
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
                 )
-                workspace.update(loaded)
+
+                if isinstance(term, LoadableTerm):
+                    group_key = loader_group_key(term)
+                    if group_key in loading:
+                        continue
+                    loading.add(group_key)
+
+                    to_load = sorted(
+                        loader_groups[group_key],
+                        key=lambda t: t.dataset
+                    )
+                    loader = self.get_loader(term)
+                    args = (loader, to_load, mask_dates, assets, mask)
+                    if getattr(loader, 'thread_safe', False):
+                        pool.apply_async(
+                            _timed_call,
+                            (None, self._load_adjusted_array, args),
+                            callback=finished.put,
+                        )
+                    else:
+                        # Load in this thread, while the pool computes the
+                        # terms which were already dispatched.
+                        finished.put(
+                            _timed_call(None, self._load_adjusted_array, args)
+                        )
+                    running += 1
+                else:
+                    args = (
+                        self._inputs_for_term(term, workspace, graph),
+                        mask_dates,
+                        assets,
+                        mask,
+                    )
+                    pool.apply_async(
+                        _timed_call,
+                        ((term, mask), term._compute, args),
+                        callback=finished.put,
+                    )
+                    running += 1
+
+            key, result, elapsed, exc_info = finished.get()
+            running -= 1
+            if exc_info is not None:
+                reraise(*exc_info)
+
+            if key is None:
+                self._store_loaded_terms(result, elapsed, workspace)
+                done = list(result)
             else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
-                    assets,
+                term, mask = key
+                self._store_computed_term(
+                    term,
+                    result,
+                    elapsed,
                     mask,
+                    graph,
+                    dates,
+                    assets,
+                    workspace,
+                    refcounts,
                 )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
+                done = [term]
+
+            for term in done:
+                for _, child in nx_graph.out_edges([term]):
+                    dependencies = waiting.get(child)
+                    if dependencies and term in dependencies:
+                        dependencies.remove(term)
+                        if not dependencies:
+                            ready.append(child)
+
+    @property
+    def term_timings(self):
+        """
+        The seconds spent computing each term in the most recent call to
+        ``compute_chunk``.
 
-                # Decref dependencies of ``term``, and clear any terms whose
-                # refcounts hit 0.
-                for garbage_term in graph.decref_dependencies(term, refcounts):
-                    del workspace[garbage_term]
+        Terms which were loaded together share the duration of their load.
+        When terms are computed on a thread pool, the durations overlap, so
+        their sum can exceed the time of the whole computation.
 
-        out = {}
-        graph_extra_rows = graph.extra_rows
-        for name, term in iteritems(graph.outputs):
-            # Truncate off extra rows from outputs.
-            out[name] = workspace[term][graph_extra_rows[term]:]
-        return out
+        Returns
+        -------
+        timings : dict[Term -> float]
+        """
+        return dict(self._term_timings)
 
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
@@ -472,40 +991,30 @@ class SimplePipelineEngine(object):
         If mask[date, asset] is True, then result.loc[(date, asset), colname]
         will contain the value of data[colname][date, asset].
         """
-        if not mask.any():
-            # Manually handle the empty DataFrame case. This is a workaround
-            # to pandas failing to tz_localize an empty dataframe with a
-            # MultiIndex. It also saves us the work of applying a known-empty
-            # mask to each array.
-            #
-            # Slicing `dates` here to preserve pandas metadata.
-            empty_dates = dates[:0]
-            empty_assets = array([], dtype=object)
-            return DataFrame(
-                data={
-                    name: array([], dtype=arr.dtype)
-                    for name, arr in iteritems(data)
-                },
-                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
-            )
+        return self._to_columnar(terms, data, mask, dates, assets).to_frame()
+
+    def _to_columnar(self, terms, data, mask, dates, assets):
+        """
+        Convert raw computed pipeline results into ColumnarResults, which keep
+        only the values of `mask`, labelled by sids rather than assets.
+
+        Parameters are the same as for ``_to_narrow``.
 
-        resolved_assets = array(self._finder.retrieve_all(assets))
-        dates_kept = repeat_last_axis(dates.values, len(assets))[mask]
-        assets_kept = repeat_first_axis(resolved_assets, len(dates))[mask]
-
-        final_columns = {}
-        for name in data:
-            # Each term that computed an output has its postprocess method
-            # called on the filtered result.
-            #
-            # As of Mon May 2 15:38:47 2016, we only use this to convert
-            # LabelArrays into categoricals.
-            final_columns[name] = terms[name].postprocess(data[name][mask])
-
-        return DataFrame(
-            data=final_columns,
-            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
-        ).tz_localize('UTC', level=0)
+        Returns
+        -------
+        results : zipline.pipeline.columnar.ColumnarResults
+        """
+        # The rows of `mask` are in date order, so the values it keeps are
+        # ordered by date and then by asset.
+        _, asset_ixs = mask.nonzero()
+        return ColumnarResults(
+            terms,
+            {name: arr[mask] for name, arr in iteritems(data)},
+            dates,
+            mask.sum(axis=1),
+            assets.values[asset_ixs],
+            self._finder,
+        )
 
     def _validate_compute_chunk_params(self, dates, assets, initial_workspace):
         """
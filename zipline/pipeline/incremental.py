@@ -0,0 +1,218 @@
+"""
+Incremental loading of pipeline inputs.
+"""
+from numpy import empty
+
+from zipline.lib.adjusted_array import AdjustedArray, NOMASK
+from zipline.lib.labelarray import LabelArray
+
+
+class LoadedWindows(object):
+    """
+    The arrays most recently loaded for each loadable term, which are advanced
+    to later dates by loading only the sessions that they are missing.
+
+    When a pipeline is run once per session, as in live trading, the dates of
+    each run overlap the dates of the previous run in all but the last
+    session, so only that session, and the adjustments which become effective
+    on it, need to be loaded.
+
+    Only the arrays of loaders whose ``incremental`` attribute is True are
+    advanced. The arrays of other loaders are loaded in full by every call.
+    """
+    def __init__(self):
+        # term -> (dates, assets, AdjustedArray)
+        self._windows = {}
+
+    def load(self, loader, columns, dates, assets, mask):
+        """
+        Load ``columns`` like ``loader.load_adjusted_array``, reusing the
+        arrays which were loaded for previous dates.
+
+        Parameters
+        ----------
+        loader : zipline.pipeline.loaders.base.PipelineLoader
+            The loader of ``columns``.
+        columns : list[BoundColumn]
+            The columns to load.
+        dates : pd.DatetimeIndex
+            The dates to load.
+        assets : pd.Int64Index
+            The assets to load.
+        mask : np.ndarray[bool]
+            The lifetimes of ``assets`` on ``dates``.
+
+        Returns
+        -------
+        arrays : dict[BoundColumn -> AdjustedArray]
+            The loaded arrays.
+        """
+        if not getattr(loader, 'incremental', False):
+            return loader.load_adjusted_array(columns, dates, assets, mask)
+
+        windows = [self._windows.get(column) for column in columns]
+        overlap = _overlap(windows, dates)
+
+        out = None
+        if overlap is not None:
+            # Load the last session that we already have along with the new
+            # sessions, so that the adjustments which become effective
+            # between them are loaded.
+            start = overlap - 1
+            new = loader.load_adjusted_array(
+                columns, dates[start:], assets, mask[start:],
+            )
+            out = {}
+            for column, window in zip(columns, windows):
+                advanced = _advance(window, new[column], dates, assets)
+                if advanced is None:
+                    out = None
+                    break
+                out[column] = advanced
+
+        if out is None:
+            out = loader.load_adjusted_array(columns, dates, assets, mask)
+
+        for column in columns:
+            array = out[column]
+            if (isinstance(array, AdjustedArray) and
+                    not isinstance(array.data, LabelArray)):
+                self._windows[column] = (dates, assets, array)
+            else:
+                self._windows.pop(column, None)
+        return out
+
+    def clear(self):
+        """
+        Forget the loaded arrays.
+        """
+        self._windows.clear()
+
+
+def _overlap(windows, dates):
+    """
+    The number of leading ``dates`` which are the trailing dates of all of
+    ``windows``, or None if the windows can not be advanced to ``dates``.
+    """
+    if not windows or any(window is None for window in windows):
+        return None
+
+    prev_dates = windows[0][0]
+    if any(not window[0].equals(prev_dates) for window in windows[1:]):
+        return None
+
+    overlap = dates.searchsorted(prev_dates[-1], side='right')
+    if not 0 < overlap < len(dates) or overlap > len(prev_dates):
+        return None
+    if not prev_dates[-overlap:].equals(dates[:overlap]):
+        return None
+    return overlap
+
+
+def _advance(window, new, dates, assets):
+    """
+    Advance the array of ``window`` to ``dates`` and ``assets``.
+
+    Parameters
+    ----------
+    window : (pd.DatetimeIndex, pd.Int64Index, AdjustedArray)
+        The previously loaded array and its labels.
+    new : AdjustedArray
+        The array loaded for the last previously loaded date, followed by the
+        dates which were not loaded yet.
+    dates : pd.DatetimeIndex
+        The dates of the advanced array.
+    assets : pd.Int64Index
+        The assets of the advanced array.
+
+    Returns
+    -------
+    advanced : AdjustedArray or None
+        The advanced array, or None if the adjustments of ``window`` can not
+        be moved to the new rows and columns.
+    """
+    prev_dates, prev_assets, prev = window
+    overlap = len(dates) - len(new.data) + 1
+    drop = len(prev_dates) - overlap
+    shift = overlap - 1
+
+    missing_value = prev.missing_value
+    data = empty((len(dates), len(assets)), dtype=new.data.dtype)
+    if assets.equals(prev_assets):
+        columns = None
+        data[:overlap] = prev.data[drop:]
+    else:
+        # The position of each of ``prev_assets`` in ``assets``, or -1.
+        columns = assets.get_indexer(prev_assets)
+        kept = columns != -1
+        data[:overlap] = missing_value
+        data[:overlap, columns[kept]] = prev.data[drop:, kept]
+    data[overlap:] = new.data[1:]
+
+    adjustments = {}
+    for row, row_adjustments in prev.adjustments.items():
+        for adjustment in row_adjustments:
+            if adjustment.last_row < drop:
+                # Only adjusts rows which are no longer in the window.
+                continue
+            if row < drop or not hasattr(adjustment, 'value'):
+                # The adjustment would have to be applied to the data.
+                return None
+            _add_adjustment(
+                adjustments,
+                row - drop,
+                adjustment,
+                max(adjustment.first_row - drop, 0),
+                adjustment.last_row - drop,
+                columns,
+            )
+
+    for row, row_adjustments in new.adjustments.items():
+        if row == 0:
+            # Already loaded with the last previously loaded date.
+            continue
+        for adjustment in row_adjustments:
+            if not hasattr(adjustment, 'value'):
+                return None
+            # Adjustments which start at the first row of a load adjust all of
+            # the rows before it.
+            _add_adjustment(
+                adjustments,
+                row + shift,
+                adjustment,
+                (0 if adjustment.first_row == 0
+                 else adjustment.first_row + shift),
+                adjustment.last_row + shift,
+                None,
+            )
+
+    return AdjustedArray(data, NOMASK, adjustments, missing_value)
+
+
+def _add_adjustment(adjustments,
+                    row,
+                    adjustment,
+                    first_row,
+                    last_row,
+                    columns):
+    """
+    Add a copy of ``adjustment`` over ``first_row`` through ``last_row`` to
+    the adjustments at ``row``, moving its columns to their positions in
+    ``columns``.
+    """
+    type_ = type(adjustment)
+    if columns is None:
+        moved = [type_(
+            first_row,
+            last_row,
+            adjustment.first_col,
+            adjustment.last_col,
+            adjustment.value,
+        )]
+    else:
+        moved = [
+            type_(first_row, last_row, col, col, adjustment.value)
+            for col in columns[adjustment.first_col:adjustment.last_col + 1]
+            if col != -1
+        ]
+    adjustments.setdefault(row, []).extend(moved)
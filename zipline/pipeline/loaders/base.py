@@ -15,7 +15,22 @@ class PipelineLoader(with_metaclass(ABCMeta)):
     ABC for classes that can load data for use with zipline.pipeline APIs.
 
     TODO: DOCUMENT THIS MORE!
+
+    Attributes
+    ----------
+    thread_safe : bool
+        Whether ``load_adjusted_array`` can be called from several threads at
+        once, which lets a ``SimplePipelineEngine`` with ``max_workers`` load
+        from this loader on its thread pool.
+    incremental : bool
+        Whether the adjustments loaded for a date which start at the first
+        row of the loaded dates also apply to all of the rows before it, which
+        lets a ``SimplePipelineEngine`` that is ``incremental`` advance the
+        arrays it loaded by loading only the dates it is missing.
     """
+    thread_safe = False
+    incremental = False
+
     @abstractmethod
     def load_adjusted_array(self, columns, dates, assets, mask):
         pass
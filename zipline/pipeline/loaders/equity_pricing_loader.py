@@ -35,6 +35,9 @@ class USEquityPricingLoader(PipelineLoader):
 
     Delegates loading of baselines and adjustments.
     """
+    # Splits, mergers and dividends adjust all of the prices before their
+    # effective date.
+    incremental = True
 
     def __init__(self, raw_price_loader, adjustments_loader):
         self.raw_price_loader = raw_price_loader
@@ -58,6 +58,9 @@ class DataFrameLoader(PipelineLoader):
         The default of None is interpreted as "no adjustments to the baseline".
     """
 
+    # The data is held in memory and only read by loads.
+    thread_safe = True
+
     def __init__(self, column, baseline, adjustments=None):
         self.column = column
         self.baseline = baseline.values.astype(self.column.dtype)
@@ -59,6 +59,11 @@ class PrecomputedLoader(PipelineLoader):
     -----
     Adjustments are unsupported by this loader.
     """
+    # The data is held in memory and only read by loads, and there are no
+    # adjustments to move when advancing a load.
+    thread_safe = True
+    incremental = True
+
     def __init__(self, constants, dates, sids):
         loaders = {}
         for column, const in iteritems(constants):
@@ -130,6 +130,9 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # The identity is kept to recognize equal terms constructed in
+            # other processes, see ``zipline.pipeline.cache``.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
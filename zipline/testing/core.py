@@ -712,6 +712,12 @@ class FakeDataPortal(DataPortal):
         else:
             return 1.0
 
+    def get_spot_values(self, assets, field, dt, data_frequency):
+        return np.array([
+            self.get_spot_value(asset, field, dt, data_frequency)
+            for asset in assets
+        ])
+
     def get_history_window(self, assets, end_dt, bar_count, frequency, field,
                            data_frequency, ffill=True):
         if frequency == "1d":
@@ -729,6 +735,15 @@ class FakeDataPortal(DataPortal):
 
             return df
 
+    def get_history_windows(self, assets, end_dt, bar_count, frequency,
+                            fields, data_frequency, ffill=True):
+        return pd.Panel({
+            field: self.get_history_window(assets, end_dt, bar_count,
+                                           frequency, field, data_frequency,
+                                           ffill)
+            for field in fields
+        })
+
 
 class FetcherDataPortal(DataPortal):
     """
@@ -748,6 +763,12 @@ class FetcherDataPortal(DataPortal):
         # otherwise just return a fixed value
         return int(asset)
 
+    def get_spot_values(self, assets, field, dt, data_frequency):
+        return np.array([
+            self.get_spot_value(asset, field, dt, data_frequency)
+            for asset in assets
+        ])
+
     # XXX: These aren't actually the methods that are used by the superclasses,
     # so these don't do anything, and this class will likely produce unexpected
     # results for history().
@@ -841,6 +841,9 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
         If this flag is set, use the value as the `read_all_threshold`
         parameter to BcolzDailyBarReader, otherwise use the default
         value.
+    BCOLZ_DAILY_BAR_READ_THREADS : int
+        If this flag is set, use the value as the `read_threads` parameter to
+        BcolzDailyBarReader, otherwise read serially.
     EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE : bool
         If this flag is set, `make_equity_daily_bar_data` will read data from
         the minute bar reader defined by a `WithBcolzEquityMinuteBarReader`.
@@ -860,6 +863,7 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
     """
     BCOLZ_DAILY_BAR_PATH = 'daily_equity_pricing.bcolz'
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = None
+    BCOLZ_DAILY_BAR_READ_THREADS = None
     EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE = False
     # allows WithBcolzEquityDailyBarReaderFromCSVs to call the
     # `write_csvs`method without needing to reimplement `init_class_fixtures`
@@ -889,9 +893,15 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
 
         if cls.BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD is not None:
             cls.bcolz_equity_daily_bar_reader = BcolzDailyBarReader(
-                t, cls.BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD)
+                t,
+                cls.BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD,
+                read_threads=cls.BCOLZ_DAILY_BAR_READ_THREADS,
+            )
         else:
-            cls.bcolz_equity_daily_bar_reader = BcolzDailyBarReader(t)
+            cls.bcolz_equity_daily_bar_reader = BcolzDailyBarReader(
+                t,
+                read_threads=cls.BCOLZ_DAILY_BAR_READ_THREADS,
+            )
 
 
 class WithBcolzEquityDailyBarReaderFromCSVs(WithBcolzEquityDailyBarReader):
@@ -1466,6 +1476,7 @@ class WithDataPortal(WithAdjustmentReader,
 
     DATA_PORTAL_MINUTE_HISTORY_PREFETCH = DEFAULT_MINUTE_HISTORY_PREFETCH
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = DEFAULT_DAILY_HISTORY_PREFETCH
+    DATA_PORTAL_ADAPTIVE_MINUTE_HISTORY_PREFETCH = False
 
     def make_data_portal(self):
         if self.DATA_PORTAL_FIRST_TRADING_DAY is None:
@@ -1514,6 +1525,8 @@ class WithDataPortal(WithAdjustmentReader,
             DATA_PORTAL_MINUTE_HISTORY_PREFETCH,
             daily_history_prefetch_length=self.
             DATA_PORTAL_DAILY_HISTORY_PREFETCH,
+            adaptive_minute_history_prefetch=self.
+            DATA_PORTAL_ADAPTIVE_MINUTE_HISTORY_PREFETCH,
         )
 
     def init_instance_fixtures(self):
@@ -199,6 +199,47 @@ def ignore_pandas_nan_categorical_warning():
         yield
 
 
+def categorical_df_concat(df_list, inplace=False):
+    """
+    Prepare a list of DataFrames to be concatenated, then concatenate them.
+
+    The categorical columns of the frames may have different categories, so
+    their categories are replaced with the union of the categories before the
+    frames are concatenated, which keeps the columns categorical.
+
+    Parameters
+    ----------
+    df_list : list[pd.DataFrame]
+        The frames to concatenate. They must have the same columns and
+        dtypes.
+    inplace : bool, optional
+        Whether the categories of the frames in ``df_list`` can be changed in
+        place. Otherwise the frames are copied first.
+
+    Returns
+    -------
+    concatenated : pd.DataFrame
+    """
+    if not inplace:
+        df_list = [df.copy() for df in df_list]
+
+    first = df_list[0]
+    if not all(first.dtypes.equals(df.dtypes) for df in df_list[1:]):
+        raise ValueError("Input DataFrames must have the same columns/dtypes.")
+
+    categorical_columns = first.columns[first.dtypes == 'category']
+    for column in categorical_columns:
+        categories = df_list[0][column].cat.categories
+        for df in df_list[1:]:
+            categories = categories.union(df[column].cat.categories)
+
+        with ignore_pandas_nan_categorical_warning():
+            for df in df_list:
+                df[column].cat.set_categories(categories, inplace=True)
+
+    return pd.concat(df_list)
+
+
 _INDEXER_NAMES = [
     '_' + name for (name, _) in pd.core.indexing.get_indexers_list()
 ]
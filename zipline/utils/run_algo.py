@@ -10,6 +10,7 @@ import pandas as pd
 
 
 import click
+from logbook import Logger
 try:
     from pygments import highlight
     from pygments.lexers import PythonLexer
@@ -31,6 +32,8 @@ from zipline.utils.calendars import get_calendar
 from zipline.utils.factory import create_simulation_parameters
 import zipline.utils.paths as pth
 
+log = Logger('run_algo')
+
 
 class _RunAlgoError(click.ClickException, ValueError):
     """Signal an error that should have a different message if invoked from
@@ -73,7 +76,9 @@ def _run(handle_data,
          environ,
          broker,
          state_filename,
-         realtime_bar_target):
+         realtime_bar_target,
+         minute_history_prefetch_length=None,
+         adaptive_history_prefetch=False):
     """Run a backtest for the given algorithm.
 
     This is shared between the cli and :func:`zipline.run_algo`.
@@ -146,12 +151,20 @@ def _run(handle_data,
         DataPortalClass = (partial(DataPortalLive, broker)
                            if broker
                            else DataPortal)
+        history_prefetch_kwargs = {
+            'adaptive_minute_history_prefetch': adaptive_history_prefetch,
+        }
+        if minute_history_prefetch_length is not None:
+            history_prefetch_kwargs['minute_history_prefetch_length'] = (
+                minute_history_prefetch_length
+            )
         data = DataPortalClass(
             env.asset_finder, get_calendar("NYSE"),
             first_trading_day=first_trading_day,
             equity_minute_reader=bundle_data.equity_minute_bar_reader,
             equity_daily_reader=bundle_data.equity_daily_bar_reader,
-            adjustment_reader=bundle_data.adjustment_reader
+            adjustment_reader=bundle_data.adjustment_reader,
+            **history_prefetch_kwargs
         )
 
         pipeline_loader = USEquityPricingLoader(
@@ -173,7 +186,10 @@ def _run(handle_data,
     if broker:
         emission_rate = 'minute'
         start = pd.Timestamp.utcnow()
-        end = start + pd.Timedelta('2 day')
+        # The realtime clock steps through every session until the end date,
+        # so a single process can trade for as long as requested.
+        if end is None or end <= start:
+            end = start + pd.Timedelta('2 day')
 
     TradingAlgorithmClass = (partial(LiveTradingAlgorithm,
                                      broker=broker,
@@ -206,6 +222,16 @@ def _run(handle_data,
         overwrite_sim_params=False,
     )
 
+    if adaptive_history_prefetch and isinstance(data, DataPortal):
+        for frequency, stats in sorted(
+                data.history_prefetch_stats().items()):
+            log.info(
+                '{} history windows: {hits} hits, {misses} misses, '
+                '{block_loads} block loads, hit rate {hit_rate:.2%}',
+                frequency,
+                **stats
+            )
+
     if output == '-':
         click.echo(str(perf))
     elif output != os.devnull:  # make the zipline magic not write any data
@@ -283,7 +309,9 @@ def run_algorithm(start,
                   strict_extensions=True,
                   environ=os.environ,
                   live_trading=False,
-                  tws_uri=None):
+                  tws_uri=None,
+                  minute_history_prefetch_length=None,
+                  adaptive_history_prefetch=False):
     """Run a trading algorithm.
 
     Parameters
@@ -337,6 +365,13 @@ def run_algorithm(start,
     environ : mapping[str -> str], optional
         The os environment to use. Many extensions use this to get parameters.
         This defaults to ``os.environ``.
+    minute_history_prefetch_length : int, optional
+        The number of minutes loaded after the end of a minute history window
+        to serve the following history calls. Only used with ``bundle``.
+    adaptive_history_prefetch : bool, optional
+        Grow the minute history prefetch while the history calls advance
+        minute by minute, and log the hit rates of the history windows at the
+        end of the run. Only used with ``bundle``.
 
     Returns
     -------
@@ -389,5 +424,7 @@ def run_algorithm(start,
         environ=environ,
         broker=None,
         state_filename=None,
-        realtime_bar_target=None
+        realtime_bar_target=None,
+        minute_history_prefetch_length=minute_history_prefetch_length,
+        adaptive_history_prefetch=adaptive_history_prefetch,
     )
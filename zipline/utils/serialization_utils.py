@@ -14,8 +14,15 @@
 # limitations under the License.
 
 from six import BytesIO
+import hashlib
+import os
 import pickle
+import threading
 from functools import partial
+from time import time
+
+import numpy as np
+import pandas as pd
 
 from zipline.assets import AssetFinder
 from zipline.finance.trading import TradingEnvironment
@@ -24,6 +31,9 @@ from zipline.finance.trading import TradingEnvironment
 # __getstate__.
 VERSION_LABEL = '_stateversion_'
 CHECKSUM_KEY = '__state_checksum'
+# Key of the individually pickled context fields in the state file written
+# by ContextCheckpointer
+FIELDS_KEY = '__state_fields'
 
 
 def _persistent_id(obj):
@@ -83,7 +93,11 @@ def load_context(state_file_path, context, checksum):
     with open(state_file_path, 'rb') as f:
         try:
             loaded_state = pickle.load(f)
-        except (pickle.UnpicklingError, IndexError):
+            if FIELDS_KEY in loaded_state:
+                fields = loaded_state.pop(FIELDS_KEY)
+                for k, v in fields.items():
+                    loaded_state[k] = pickle.loads(v)
+        except (pickle.UnpicklingError, IndexError, EOFError):
             raise ValueError("Corrupt state file: {}".format(state_file_path))
         else:
             if CHECKSUM_KEY not in loaded_state or \
@@ -99,15 +113,213 @@ def load_context(state_file_path, context, checksum):
 
 
 def store_context(state_file_path, context, checksum, exclude_list):
-    state = {}
-    fields_to_store = list(set(context.__dict__.keys()) -
-                           set(exclude_list))
+    ContextCheckpointer(state_file_path, checksum, exclude_list).store(context)
+
+
+def _atomic_write(path, data):
+    """Write ``data`` to ``path`` through a temporary file, so a crash during
+    the write leaves the previous file intact."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    # os.rename() does not replace existing files on Windows in Python 2
+    getattr(os, 'replace', os.rename)(tmp_path, path)
+
+
+def _array_digest(values, h):
+    h.update(repr((values.dtype.str, values.shape)).encode('utf-8'))
+    h.update(np.ascontiguousarray(values).view(np.uint8).ravel().data)
+
+
+def _content_digest(value, protocol):
+    """Computes the content hash of ``value``.
+
+    Arrays, pandas indexes, series and frames without object data are hashed
+    from their buffers without being pickled. Any other object is hashed
+    from its pickle, which is returned alongside the digest so it does not
+    have to be pickled again.
+
+    Returns
+    -------
+    digest : bytes
+    pickled : bytes or None
+    """
+    h = hashlib.md5()
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        _array_digest(value, h)
+        return h.digest(), None
+
+    if isinstance(value, (pd.Index, pd.Series, pd.DataFrame)) and \
+            not isinstance(value, pd.MultiIndex):
+        values = value.values
+        if isinstance(values, np.ndarray) and not values.dtype.hasobject:
+            h.update(type(value).__name__.encode('utf-8'))
+            _array_digest(values, h)
+            if isinstance(value, pd.Index):
+                h.update(pickle.dumps(
+                    (value.name, getattr(value, 'tz', None)), protocol))
+                return h.digest(), None
+            h.update(_content_digest(value.index, protocol)[0])
+            if isinstance(value, pd.Series):
+                h.update(pickle.dumps(value.name, protocol))
+            else:
+                h.update(_content_digest(value.columns, protocol)[0])
+            return h.digest(), None
+
+    pickled = pickle.dumps(value, protocol)
+    h.update(pickled)
+    return h.digest(), pickled
+
+
+class ContextCheckpointer(object):
+    """Incrementally stores the state of an algorithm's context.
+
+    Every context field is pickled separately, and only when its content hash
+    changed since the previous checkpoint. The state file is rewritten from
+    the cached pickles through a temporary file and a rename, so it is never
+    left half written.
+
+    Only arrays and pandas objects without object data are hashed without
+    being pickled. Any other field, such as a model object or a dict, is
+    still pickled by every :meth:`store` to compute its hash, so storing it
+    costs as much as before and only the write of unchanged fields is saved.
+
+    Since the fields are pickled separately, an object referenced by several
+    fields is restored by :func:`load_context` as a separate copy for each
+    of them. Keep such objects in a single field when their identity has to
+    be preserved.
+
+    Parameters
+    ----------
+    state_file_path : str
+        The path of the state file.
+    checksum : str
+        The checksum stored alongside the state, verified by load_context.
+    exclude_list : list[str]
+        The context fields which are not stored.
+    protocol : int, optional
+        The pickle protocol. Defaults to the highest available.
+    background : bool, optional
+        Write the state file in a background thread. The fields are still
+        serialized by :meth:`store`, so the checkpoint is consistent.
+
+    Attributes
+    ----------
+    last_cost : float
+        The time spent in the last :meth:`store` call, in seconds.
+    last_changed_fields : list[str]
+        The fields serialized by the last :meth:`store` call.
+    """
+
+    def __init__(self,
+                 state_file_path,
+                 checksum,
+                 exclude_list,
+                 protocol=pickle.HIGHEST_PROTOCOL,
+                 background=False):
+        self.state_file_path = state_file_path
+        self.checksum = checksum
+        self.exclude_list = set(exclude_list)
+        self.protocol = protocol
+        self.background = background
+
+        self.last_cost = None
+        self.last_changed_fields = []
+
+        self._digests = {}
+        self._pickles = {}
+        self._stored = False
+
+        self._pending = None
+        self._writing = False
+        self._write_error = None
+        self._cond = threading.Condition()
+        self._writer = None
+
+    def store(self, context):
+        """Checkpoint ``context``.
+
+        Returns
+        -------
+        written : bool
+            False if no field changed since the previous checkpoint.
+        """
+        start = time()
+
+        fields = set(context.__dict__.keys()) - self.exclude_list
+        changed = []
+        for field in fields:
+            digest, pickled = _content_digest(getattr(context, field),
+                                              self.protocol)
+            if self._digests.get(field) == digest:
+                continue
+            if pickled is None:
+                pickled = pickle.dumps(getattr(context, field), self.protocol)
+            self._digests[field] = digest
+            self._pickles[field] = pickled
+            changed.append(field)
+
+        removed = set(self._pickles) - fields
+        for field in removed:
+            del self._digests[field]
+            del self._pickles[field]
+
+        written = bool(changed or removed) or not self._stored
+        if written:
+            data = pickle.dumps({CHECKSUM_KEY: self.checksum,
+                                 FIELDS_KEY: dict(self._pickles)},
+                                self.protocol)
+            if self.background:
+                self._write_in_background(data)
+            else:
+                _atomic_write(self.state_file_path, data)
+            self._stored = True
+
+        self.last_changed_fields = changed
+        self.last_cost = time() - start
+        return written
+
+    def _write_in_background(self, data):
+        with self._cond:
+            self._raise_write_error()
+            # Only the latest checkpoint has to be written
+            self._pending = data
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop,
+                                                name='ContextCheckpointer')
+                self._writer.daemon = True
+                self._writer.start()
+            self._cond.notify_all()
 
-    for field in fields_to_store:
-        state[field] = getattr(context, field)
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                data, self._pending = self._pending, None
+                self._writing = True
+            error = None
+            try:
+                _atomic_write(self.state_file_path, data)
+            except Exception as e:
+                error = e
+            finally:
+                with self._cond:
+                    if error is not None:
+                        self._write_error = error
+                    self._writing = False
+                    self._cond.notify_all()
 
-    state[CHECKSUM_KEY] = checksum
+    def _raise_write_error(self):
+        if self._write_error is not None:
+            e, self._write_error = self._write_error, None
+            raise e
 
-    with open(state_file_path, 'wb') as f:
-        # Forcing v2 protocol for compatibility between py2 and py3
-        pickle.dump(state, f, protocol=2)
+    def flush(self):
+        """Wait until the last checkpoint is written to the state file."""
+        with self._cond:
+            while self._pending is not None or self._writing:
+                self._cond.wait()
+            self._raise_write_error()
@@ -32,3 +32,28 @@ coerce_string_to_conn = coerce_string(sqlite3.connect)
 coerce_string_to_eng = coerce_string(
     lambda s: sa.create_engine('sqlite:///' + s)
 )
+
+
+def database_path(conn):
+    """
+    The path of the main database of ``conn``, or the empty string if it is
+    held in memory.
+    """
+    for _, name, path in conn.execute('PRAGMA database_list'):
+        if name == 'main':
+            return path or ''
+    return ''
+
+
+def dispose_after_fork(engine):
+    """
+    Drop the connections of ``engine`` which a forked process inherited from
+    its parent, so that it opens its own ones.
+
+    SQLite connections must not be used across a fork. In-memory databases
+    are copied along with the process though, and can't be connected to
+    again, so their connections are kept.
+    """
+    if engine.url.database in (None, '', ':memory:'):
+        return
+    engine.dispose()